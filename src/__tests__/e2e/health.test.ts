@@ -33,4 +33,23 @@ describe('Health endpoint', () => {
     const res = await fetch(`${baseUrl}/health`);
     expect(res.headers.get('content-type')).toMatch(/application\/json/);
   });
+
+  it('GET /stats reports sessions and response cache counters', async () => {
+    const res = await fetch(`${baseUrl}/stats`);
+    expect(res.status).toBe(200);
+    const body = await res.json();
+    expect(body.sessions).toBe(0);
+    expect(body.responseCache.operations.search).toEqual({ hits: 0, misses: 0, coalesced: 0 });
+  });
+
+  it('GET /metrics serves Prometheus text with runtime gauges', async () => {
+    const res = await fetch(`${baseUrl}/metrics`);
+    expect(res.status).toBe(200);
+    expect(res.headers.get('content-type')).toMatch(/text\/plain; version=0\.0\.4/);
+    const text = await res.text();
+    expect(text).toContain('# TYPE websets_operation_duration_seconds histogram');
+    expect(text).toContain('websets_sessions 0');
+    expect(text).toMatch(/websets_tasks\{status="pending"\} \d+/);
+    expect(text).toContain('websets_api_pool_available{pool="websets"} 8');
+  });
 });
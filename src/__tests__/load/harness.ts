@@ -0,0 +1,433 @@
+// Load harness — drives /mcp over plain JSON-RPC with many concurrent sessions
+// and reports throughput, latency percentiles, event-loop lag and heap
+// high-water marks. The server under test runs in this process, so lag and
+// heap figures are the server's own (plus the comparatively idle driver).
+
+import { monitorEventLoopDelay } from 'node:perf_hooks';
+
+// --- Measurements ---
+
+export interface LatencySummary {
+  count: number;
+  p50: number;
+  p90: number;
+  p99: number;
+  max: number;
+}
+
+export function summarize(samples: number[]): LatencySummary {
+  if (samples.length === 0) return { count: 0, p50: 0, p90: 0, p99: 0, max: 0 };
+  const sorted = [...samples].sort((a, b) => a - b);
+  const at = (q: number) => sorted[Math.min(sorted.length - 1, Math.ceil(q * sorted.length) - 1)];
+  return {
+    count: sorted.length,
+    p50: round(at(0.5)),
+    p90: round(at(0.9)),
+    p99: round(at(0.99)),
+    max: round(sorted[sorted.length - 1]),
+  };
+}
+
+function round(ms: number): number {
+  return Math.round(ms * 100) / 100;
+}
+
+export interface RuntimeSummary {
+  eventLoopLagMs: { p50: number; p99: number; max: number };
+  heapHighWaterMb: number;
+  rssHighWaterMb: number;
+}
+
+/** Samples event-loop delay continuously and memory every few milliseconds. */
+export class RuntimeSampler {
+  private histogram = monitorEventLoopDelay({ resolution: 10 });
+  private timer: ReturnType<typeof setInterval> | null = null;
+  private heapMax = 0;
+  private rssMax = 0;
+
+  start(intervalMs = 25): void {
+    this.histogram.enable();
+    this.sample();
+    this.timer = setInterval(() => this.sample(), intervalMs);
+  }
+
+  stop(): RuntimeSummary {
+    if (this.timer) clearInterval(this.timer);
+    this.timer = null;
+    this.sample();
+    this.histogram.disable();
+    const ms = (ns: number) => round(ns / 1e6);
+    return {
+      eventLoopLagMs: {
+        p50: ms(this.histogram.percentile(50)),
+        p99: ms(this.histogram.percentile(99)),
+        max: ms(this.histogram.max),
+      },
+      heapHighWaterMb: round(this.heapMax / 1048576),
+      rssHighWaterMb: round(this.rssMax / 1048576),
+    };
+  }
+
+  private sample(): void {
+    const { heapUsed, rss } = process.memoryUsage();
+    if (heapUsed > this.heapMax) this.heapMax = heapUsed;
+    if (rss > this.rssMax) this.rssMax = rss;
+  }
+}
+
+// --- MCP client ---
+
+export interface CallResult {
+  ok: boolean;
+  latencyMs: number;
+  bytes: number;
+  text: string;
+}
+
+const PROTOCOL_VERSION = '2025-03-26';
+
+/** Minimal streamable-HTTP MCP client for a server with JSON responses enabled. */
+export class McpSession {
+  private nextId = 1;
+  private sessionId: string | null = null;
+
+  constructor(private mcpUrl: string) {}
+
+  async open(): Promise<void> {
+    const res = await this.post({
+      jsonrpc: '2.0',
+      id: this.nextId++,
+      method: 'initialize',
+      params: { protocolVersion: PROTOCOL_VERSION, capabilities: {}, clientInfo: { name: 'load-harness', version: '1.0.0' } },
+    });
+    this.sessionId = res.headers.get('mcp-session-id');
+    await res.text();
+    if (!res.ok || !this.sessionId) throw new Error(`initialize failed: HTTP ${res.status}`);
+    const ack = await this.post({ jsonrpc: '2.0', method: 'notifications/initialized' });
+    await ack.text();
+  }
+
+  async call(operation: string, args: Record<string, unknown> = {}, output?: 'pretty' | 'compact'): Promise<CallResult> {
+    const start = performance.now();
+    const res = await this.post({
+      jsonrpc: '2.0',
+      id: this.nextId++,
+      method: 'tools/call',
+      params: { name: 'manage_websets', arguments: { operation, args, ...(output ? { output } : {}) } },
+    });
+    const raw = await res.text();
+    const latencyMs = performance.now() - start;
+    let text = '';
+    let ok = res.ok;
+    try {
+      const body = JSON.parse(raw) as { result?: { content?: Array<{ text: string }>; isError?: boolean }; error?: unknown };
+      text = body.result?.content?.[0]?.text ?? '';
+      ok = ok && !body.error && !body.result?.isError;
+    } catch {
+      ok = false;
+    }
+    return { ok, latencyMs, bytes: raw.length, text };
+  }
+
+  async close(): Promise<void> {
+    if (!this.sessionId) return;
+    const res = await fetch(this.mcpUrl, { method: 'DELETE', headers: this.headers() });
+    await res.text();
+    this.sessionId = null;
+  }
+
+  private headers(): Record<string, string> {
+    const headers: Record<string, string> = {
+      'Content-Type': 'application/json',
+      Accept: 'application/json, text/event-stream',
+    };
+    if (this.sessionId) {
+      headers['mcp-session-id'] = this.sessionId;
+      headers['mcp-protocol-version'] = PROTOCOL_VERSION;
+    }
+    return headers;
+  }
+
+  private post(body: unknown): Promise<Response> {
+    return fetch(this.mcpUrl, { method: 'POST', headers: this.headers(), body: JSON.stringify(body) });
+  }
+}
+
+async function openSessions(mcpUrl: string, count: number): Promise<McpSession[]> {
+  return Promise.all(Array.from({ length: count }, async () => {
+    const session = new McpSession(mcpUrl);
+    await session.open();
+    return session;
+  }));
+}
+
+const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
+
+// --- Scenarios ---
+
+export interface ScenarioReport {
+  scenario: string;
+  wallMs: number;
+  requests: number;
+  errors: number;
+  requestsPerSec: number;
+  bytesReceived: number;
+  latencyMs: Record<string, LatencySummary>;
+  runtime: RuntimeSummary;
+  tasks?: { completed: number; failed: number; tasksPerSec: number };
+}
+
+interface Recorder {
+  latencies: Map<string, number[]>;
+  requests: number;
+  errors: number;
+  bytes: number;
+}
+
+function recorder(): Recorder {
+  return { latencies: new Map(), requests: 0, errors: 0, bytes: 0 };
+}
+
+function record(rec: Recorder, key: string, result: CallResult): void {
+  rec.requests++;
+  rec.bytes += result.bytes;
+  if (!result.ok) rec.errors++;
+  let list = rec.latencies.get(key);
+  if (!list) {
+    list = [];
+    rec.latencies.set(key, list);
+  }
+  list.push(result.latencyMs);
+}
+
+function report(scenario: string, rec: Recorder, wallMs: number, runtime: RuntimeSummary): ScenarioReport {
+  const latencyMs: Record<string, LatencySummary> = {
+    all: summarize([...rec.latencies.values()].flat()),
+  };
+  for (const [key, samples] of rec.latencies) latencyMs[key] = summarize(samples);
+  return {
+    scenario,
+    wallMs: round(wallMs),
+    requests: rec.requests,
+    errors: rec.errors,
+    requestsPerSec: round(rec.requests / (wallMs / 1000)),
+    bytesReceived: rec.bytes,
+    latencyMs,
+    runtime,
+  };
+}
+
+export interface DispatchScenarioOptions {
+  sessions: number;
+  requestsPerSession: number;
+  /** Items per webset read back by items.getAll. */
+  lensSize: number;
+  output?: 'pretty' | 'compact';
+}
+
+/**
+ * Many sessions issuing a mix of instant search, answer, webset reads and
+ * large items.getAll calls back to back: exercises the dispatcher,
+ * serialization, response cache and the websets pool.
+ */
+export async function runDispatchScenario(mcpUrl: string, opts: DispatchScenarioOptions): Promise<ScenarioReport> {
+  const [setup] = await openSessions(mcpUrl, 1);
+  const created = await setup.call('websets.create', {
+    searchQuery: 'developer tooling startups',
+    searchCount: opts.lensSize,
+    entity: { type: 'company' },
+  });
+  const websetId = (JSON.parse(created.text || '{}') as { id?: string }).id;
+  if (!websetId) throw new Error(`websets.create failed: ${created.text}`);
+  await setup.close();
+
+  const sessions = await openSessions(mcpUrl, opts.sessions);
+  const mix: Array<[string, (i: number) => Record<string, unknown>]> = [
+    ['exa.search', i => ({ query: `query ${i % 20}`, numResults: 10 })],
+    ['websets.get', () => ({ id: websetId })],
+    ['items.getAll', () => ({ websetId, maxItems: opts.lensSize })],
+    ['exa.answer', i => ({ query: `question ${i % 10}` })],
+  ];
+
+  const rec = recorder();
+  const sampler = new RuntimeSampler();
+  sampler.start();
+  const start = performance.now();
+
+  await Promise.all(sessions.map(async (session, s) => {
+    for (let i = 0; i < opts.requestsPerSession; i++) {
+      const [operation, args] = mix[(s + i) % mix.length];
+      record(rec, operation, await session.call(operation, args(s * opts.requestsPerSession + i), opts.output));
+    }
+  }));
+
+  const wallMs = performance.now() - start;
+  const runtime = sampler.stop();
+  await Promise.all(sessions.map(s => s.close()));
+  return report('dispatch', rec, wallMs, runtime);
+}
+
+export interface WorkflowScenarioOptions {
+  sessions: number;
+  tasksPerSession: number;
+  /** Items per lens/webset; larger lenses stress collection and joins. */
+  lensSize: number;
+  workflows: string[];
+  pollIntervalMs?: number;
+  /** Give up on a task after this long. */
+  taskTimeoutMs?: number;
+}
+
+const CRITERIA = [
+  { description: 'Raised a Series A or later' },
+  { description: 'Sells to software developers' },
+  { description: 'Headquartered in North America' },
+];
+
+const ENRICHMENTS = [
+  { description: 'Employee count', format: 'number' },
+  { description: 'Funding stage', format: 'options', options: [{ label: 'Seed' }, { label: 'Series A' }, { label: 'Series B' }] },
+];
+
+export function workflowArgs(type: string, lensSize: number, n: number): Record<string, unknown> {
+  switch (type) {
+    case 'qd.winnow':
+      return {
+        query: `developer tooling startups ${n}`,
+        entity: { type: 'company' },
+        criteria: CRITERIA,
+        enrichments: ENRICHMENTS,
+        count: lensSize,
+        selectionStrategy: 'diverse',
+      };
+    case 'convergent.search':
+      return {
+        queries: [`devtools startups ${n}`, `developer platform companies ${n}`, `API infrastructure companies ${n}`],
+        entity: { type: 'company' },
+        count: lensSize,
+      };
+    case 'semantic.cron': {
+      const lens = (id: string, query: string) => ({
+        id,
+        source: { query: `${query} ${n}`, count: lensSize, entity: { type: 'company' }, criteria: CRITERIA.slice(0, 1), enrichments: ENRICHMENTS },
+      });
+      return {
+        config: {
+          lenses: [lens('hiring', 'companies hiring engineers'), lens('funding', 'recently funded'), lens('launches', 'product launches')],
+          shapes: ['hiring', 'funding', 'launches'].map(lensId => ({
+            lensId,
+            conditions: [{ enrichment: 'Employee count', operator: 'gte', value: 100 }],
+            logic: 'all',
+          })),
+          join: { by: 'entity' },
+          signal: { requires: { type: 'threshold', min: 2 } },
+        },
+      };
+    }
+    default:
+      return {};
+  }
+}
+
+/**
+ * Many sessions each creating background tasks and polling them to completion
+ * with tasks.get, then reading the result: exercises the scheduler, polling,
+ * item collection, joins and large result payloads.
+ */
+export async function runWorkflowScenario(mcpUrl: string, opts: WorkflowScenarioOptions): Promise<ScenarioReport> {
+  const sessions = await openSessions(mcpUrl, opts.sessions);
+  const pollIntervalMs = opts.pollIntervalMs ?? 200;
+  const taskTimeoutMs = opts.taskTimeoutMs ?? 120_000;
+  const rec = recorder();
+  const taskLatency = new Map<string, number[]>();
+  let completed = 0;
+  let failed = 0;
+
+  const sampler = new RuntimeSampler();
+  sampler.start();
+  const start = performance.now();
+
+  await Promise.all(sessions.map(async (session, s) => {
+    await Promise.all(Array.from({ length: opts.tasksPerSession }, async (_, t) => {
+      const n = s * opts.tasksPerSession + t;
+      const type = opts.workflows[n % opts.workflows.length];
+      const taskStart = performance.now();
+      const created = await session.call('tasks.create', { type, args: workflowArgs(type, opts.lensSize, n) });
+      record(rec, 'tasks.create', created);
+      const taskId = created.ok ? (JSON.parse(created.text) as { taskId?: string }).taskId : undefined;
+      if (!taskId) {
+        failed++;
+        return;
+      }
+
+      let status = 'pending';
+      while (status === 'pending' || status === 'working') {
+        if (performance.now() - taskStart > taskTimeoutMs) break;
+        await sleep(pollIntervalMs);
+        const polled = await session.call('tasks.get', { taskId }, 'compact');
+        record(rec, 'tasks.get', polled);
+        if (polled.ok) status = (JSON.parse(polled.text) as { status: string }).status;
+      }
+
+      if (status === 'completed') {
+        record(rec, 'tasks.result', await session.call('tasks.result', { taskId }));
+        completed++;
+        let list = taskLatency.get(type);
+        if (!list) {
+          list = [];
+          taskLatency.set(type, list);
+        }
+        list.push(performance.now() - taskStart);
+      } else {
+        failed++;
+      }
+    }));
+  }));
+
+  const wallMs = performance.now() - start;
+  const runtime = sampler.stop();
+  await Promise.all(sessions.map(s => s.close()));
+
+  const result = report('workflows', rec, wallMs, runtime);
+  for (const [type, samples] of taskLatency) result.latencyMs[`task:${type}`] = summarize(samples);
+  result.tasks = { completed, failed, tasksPerSec: round(completed / (wallMs / 1000)) };
+  return result;
+}
+
+// --- Output ---
+
+export function formatReport(r: ScenarioReport): string {
+  const lines = [
+    `== ${r.scenario}: ${r.requests} requests in ${(r.wallMs / 1000).toFixed(2)}s ` +
+      `(${r.requestsPerSec} req/s, ${r.errors} errors, ${(r.bytesReceived / 1048576).toFixed(1)} MB received)`,
+  ];
+  if (r.tasks) lines.push(`   tasks: ${r.tasks.completed} completed, ${r.tasks.failed} failed, ${r.tasks.tasksPerSec} tasks/s`);
+  lines.push('   latency (ms)               count      p50      p90      p99      max');
+  for (const [key, s] of Object.entries(r.latencyMs)) {
+    lines.push(
+      `   ${key.padEnd(24)} ${String(s.count).padStart(7)} ${String(s.p50).padStart(8)} ${String(s.p90).padStart(8)} ` +
+        `${String(s.p99).padStart(8)} ${String(s.max).padStart(8)}`,
+    );
+  }
+  const lag = r.runtime.eventLoopLagMs;
+  lines.push(`   event-loop lag (ms): p50 ${lag.p50}, p99 ${lag.p99}, max ${lag.max}`);
+  lines.push(`   heap high-water: ${r.runtime.heapHighWaterMb} MB, rss high-water: ${r.runtime.rssHighWaterMb} MB`);
+  return lines.join('\n');
+}
+
+/** Percentage change of the headline numbers against a saved baseline run. */
+export function formatComparison(current: ScenarioReport[], baseline: ScenarioReport[]): string {
+  const pct = (now: number, was: number) => (was === 0 ? 'n/a' : `${now >= was ? '+' : ''}${(((now - was) / was) * 100).toFixed(1)}%`);
+  const lines: string[] = [];
+  for (const r of current) {
+    const b = baseline.find(x => x.scenario === r.scenario);
+    if (!b) continue;
+    lines.push(
+      `== ${r.scenario} vs baseline: req/s ${pct(r.requestsPerSec, b.requestsPerSec)}, ` +
+        `p50 ${pct(r.latencyMs.all.p50, b.latencyMs.all.p50)}, p99 ${pct(r.latencyMs.all.p99, b.latencyMs.all.p99)}, ` +
+        `loop lag p99 ${pct(r.runtime.eventLoopLagMs.p99, b.runtime.eventLoopLagMs.p99)}, ` +
+        `heap ${pct(r.runtime.heapHighWaterMb, b.runtime.heapHighWaterMb)}`,
+    );
+  }
+  return lines.join('\n');
+}
@@ -0,0 +1,133 @@
+import { describe, it, expect, beforeAll, afterAll } from 'vitest';
+import { startMockExaServer, parseFlags, mockOptionsFromFlags, type MockExaServer } from './mockExaServer.js';
+import { summarize, formatComparison, workflowArgs, type ScenarioReport } from './harness.js';
+
+async function json(url: string, init?: RequestInit): Promise<any> {
+  const res = await fetch(url, init);
+  return { status: res.status, body: await res.json() };
+}
+
+function post(url: string, body: unknown): Promise<any> {
+  return json(url, { method: 'POST', headers: { 'Content-Type': 'application/json' }, body: JSON.stringify(body) });
+}
+
+describe('mock Exa server', () => {
+  let mock: MockExaServer;
+
+  beforeAll(async () => {
+    mock = await startMockExaServer({ pageSize: 40, itemBytes: 256, idleAfterMs: 50 });
+  });
+
+  afterAll(async () => {
+    await mock.close();
+  });
+
+  it('creates websets that go idle after the configured delay', async () => {
+    const created = await post(`${mock.url}/websets/v0/websets`, {
+      search: { query: 'devtools', count: 100, entity: { type: 'company' }, criteria: [{ description: 'B2B' }] },
+      enrichments: [{ description: 'Employees', format: 'number' }],
+    });
+    expect(created.status).toBe(200);
+    expect(created.body.status).toBe('running');
+    expect(created.body.searches[0].progress.completion).toBe(0);
+
+    await new Promise(r => setTimeout(r, 60));
+    const { body } = await json(`${mock.url}/websets/v0/websets/${created.body.id}`);
+    expect(body.status).toBe('idle');
+    expect(body.searches[0].progress).toEqual({ found: 100, analyzed: 100, completion: 100 });
+  });
+
+  it('paginates items newest first, capped at the page size', async () => {
+    const created = await post(`${mock.url}/websets/v0/websets`, {
+      search: { query: 'paging', count: 90 },
+      enrichments: [{ description: 'Stage', format: 'options', options: [{ label: 'Seed' }, { label: 'Series A' }] }],
+    });
+    const ids: string[] = [];
+    const times: number[] = [];
+    let cursor: string | null = null;
+    let pages = 0;
+    do {
+      const qs: string = cursor ? `?limit=100&cursor=${cursor}` : '?limit=100';
+      const { body } = await json(`${mock.url}/websets/v0/websets/${created.body.id}/items${qs}`);
+      expect(body.data.length).toBeLessThanOrEqual(40);
+      for (const item of body.data) {
+        ids.push(item.id);
+        times.push(Date.parse(item.createdAt));
+        expect(item.properties.content).toHaveLength(256);
+        expect(['Seed', 'Series A']).toContain(item.enrichments[0].result[0]);
+      }
+      cursor = body.nextCursor;
+      pages++;
+    } while (cursor);
+
+    expect(pages).toBe(3);
+    expect(new Set(ids).size).toBe(90);
+    expect(times).toEqual([...times].sort((a, b) => b - a));
+
+    const { body: item } = await json(`${mock.url}/websets/v0/websets/${created.body.id}/items/${ids[5]}`);
+    expect(item.id).toBe(ids[5]);
+  });
+
+  it('generates the same items on every run', async () => {
+    const run = async () => {
+      const fresh = await startMockExaServer();
+      const ws = await post(`${fresh.url}/websets/v0/websets`, { search: { query: 'repeatable', count: 10 } });
+      const { body } = await json(`${fresh.url}/websets/v0/websets/${ws.body.id}/items`);
+      await fresh.close();
+      return body.data.map((item: any) => item.properties.url);
+    };
+    expect(await run()).toEqual(await run());
+  });
+
+  it('serves search, answer and research and counts requests by route', async () => {
+    const search = await post(`${mock.url}/search`, { query: 'q', numResults: 7 });
+    expect(search.body.results).toHaveLength(7);
+    const answer = await post(`${mock.url}/answer`, { query: 'q' });
+    expect(answer.body.answer).toContain('q');
+    const research = await post(`${mock.url}/research/v1`, { instructions: 'find things' });
+    const { body } = await json(`${mock.url}/research/v1/${research.body.researchId}`);
+    expect(body.status).toBe('completed');
+
+    expect(mock.requests.search).toBeGreaterThanOrEqual(1);
+    expect(mock.requests['research.create']).toBe(1);
+    expect((await json(`${mock.url}/nope`)).status).toBe(404);
+  });
+
+  it('reads options from command-line flags', () => {
+    const flags = parseFlags(['--latency', '30', '--page-size=25', '--verbose']);
+    expect(flags).toEqual({ latency: '30', 'page-size': '25', verbose: 'true' });
+    expect(mockOptionsFromFlags(flags)).toMatchObject({ latencyMs: 30, pageSize: 25, itemBytes: undefined });
+  });
+});
+
+describe('load harness', () => {
+  it('summarizes latency percentiles', () => {
+    const samples = Array.from({ length: 100 }, (_, i) => i + 1);
+    expect(summarize(samples)).toEqual({ count: 100, p50: 50, p90: 90, p99: 99, max: 100 });
+    expect(summarize([])).toEqual({ count: 0, p50: 0, p90: 0, p99: 0, max: 0 });
+  });
+
+  it('builds valid arguments for each workflow', () => {
+    expect(workflowArgs('qd.winnow', 500, 1)).toMatchObject({ count: 500, entity: { type: 'company' } });
+    expect((workflowArgs('convergent.search', 500, 1).queries as string[]).length).toBeGreaterThanOrEqual(2);
+    const cron = workflowArgs('semantic.cron', 500, 1).config as any;
+    expect(cron.lenses.every((l: any) => l.source.count === 500)).toBe(true);
+    expect(cron.shapes.map((s: any) => s.lensId)).toEqual(cron.lenses.map((l: any) => l.id));
+  });
+
+  it('compares runs against a baseline', () => {
+    const run = (rps: number, p99: number): ScenarioReport => ({
+      scenario: 'dispatch',
+      wallMs: 1000,
+      requests: rps,
+      errors: 0,
+      requestsPerSec: rps,
+      bytesReceived: 0,
+      latencyMs: { all: { count: rps, p50: 10, p90: 20, p99, max: p99 } },
+      runtime: { eventLoopLagMs: { p50: 1, p99: 2, max: 3 }, heapHighWaterMb: 100, rssHighWaterMb: 200 },
+    });
+    const text = formatComparison([run(120, 40)], [run(100, 50)]);
+    expect(text).toContain('req/s +20.0%');
+    expect(text).toContain('p99 -20.0%');
+  });
+});
@@ -0,0 +1,405 @@
+// Local stand-in for the Exa websets, search and research endpoints, for load
+// tests that must not touch the real API. Responses follow the shapes the
+// handlers and workflows read; item content is synthetic and deterministic.
+//
+// Standalone: npx tsx src/__tests__/load/mockExaServer.ts --port 4010 --latency 50
+
+import http from 'node:http';
+import { pathToFileURL } from 'node:url';
+import type { AddressInfo } from 'node:net';
+
+export interface MockExaOptions {
+  /** Base latency added to every response. */
+  latencyMs?: number;
+  /** Uniform random extra latency on top of latencyMs. */
+  jitterMs?: number;
+  /** Largest page items.list returns, whatever limit is asked for. */
+  pageSize?: number;
+  /** Items per webset; defaults to the search count of the create request. */
+  itemsPerWebset?: number;
+  /** Approximate bytes of page content per item. */
+  itemBytes?: number;
+  /** Distinct entity names shared by all websets; smaller means more overlap between lenses. */
+  entityPool?: number;
+  /** Time from creation until a webset reports idle. */
+  idleAfterMs?: number;
+  /** Time from creation until a research job completes. */
+  researchMs?: number;
+  /** Fraction of criteria evaluations that come back satisfied. */
+  satisfiedRate?: number;
+}
+
+export interface MockExaServer {
+  url: string;
+  /** Requests served, by route name. */
+  requests: Record<string, number>;
+  close(): Promise<void>;
+}
+
+interface EnrichmentDef {
+  id: string;
+  description: string;
+  format: string;
+  options?: Array<{ label: string }>;
+}
+
+interface MockWebset {
+  id: string;
+  seq: number;
+  createdAt: number;
+  query: string;
+  entityType: string;
+  criteria: Array<{ description: string }>;
+  enrichments: EnrichmentDef[];
+  count: number;
+  searchId: string;
+  status: 'running' | 'idle' | 'paused';
+  items?: Record<string, unknown>[];
+}
+
+const DEFAULTS: Required<MockExaOptions> = {
+  latencyMs: 0,
+  jitterMs: 0,
+  pageSize: 50,
+  itemsPerWebset: 0,
+  itemBytes: 1024,
+  entityPool: 500,
+  idleAfterMs: 0,
+  researchMs: 0,
+  satisfiedRate: 0.7,
+};
+
+const FILLER = 'Synthetic page text for load testing the websets MCP server. ';
+
+// mulberry32: small deterministic PRNG so runs are repeatable
+function prng(seed: number): () => number {
+  let a = seed >>> 0;
+  return () => {
+    a = (a + 0x6d2b79f5) >>> 0;
+    let t = a;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+function seedOf(text: string): number {
+  let h = 2166136261;
+  for (let i = 0; i < text.length; i++) h = Math.imul(h ^ text.charCodeAt(i), 16777619);
+  return h >>> 0;
+}
+
+function filler(bytes: number): string {
+  return FILLER.repeat(Math.ceil(bytes / FILLER.length)).slice(0, bytes);
+}
+
+function enrichmentValue(def: EnrichmentDef, rand: () => number, entity: number): string {
+  switch (def.format) {
+    case 'number':
+      return String(Math.floor(rand() * 500));
+    case 'options':
+      return def.options?.[Math.floor(rand() * def.options.length)]?.label ?? 'n/a';
+    case 'date':
+      return new Date(Date.now() - Math.floor(rand() * 60) * 86_400_000).toISOString().slice(0, 10);
+    case 'url':
+      return `https://company${entity}.example.com/about`;
+    default:
+      return `${def.description} for company ${entity}`;
+  }
+}
+
+export async function startMockExaServer(options: MockExaOptions = {}, port = 0): Promise<MockExaServer> {
+  const given = Object.entries(options).filter(([, v]) => v !== undefined);
+  const opts: Required<MockExaOptions> = { ...DEFAULTS, ...Object.fromEntries(given) };
+  const websets = new Map<string, MockWebset>();
+  const research = new Map<string, { id: string; createdAt: number; instructions: string }>();
+  const requests: Record<string, number> = {};
+  const content = filler(opts.itemBytes);
+  let seq = 0;
+
+  const generateItems = (ws: MockWebset): Record<string, unknown>[] => {
+    if (ws.items) return ws.items;
+    const rand = prng(seedOf(ws.query) ^ ws.seq);
+    const items: Record<string, unknown>[] = [];
+    for (let i = 0; i < ws.count; i++) {
+      const entity = Math.floor(rand() * opts.entityPool);
+      // Listed newest first, as the API does
+      const createdAt = new Date(ws.createdAt - i * 1000).toISOString();
+      items.push({
+        id: `witem_${ws.seq}_${i}`,
+        object: 'webset_item',
+        source: 'search',
+        sourceId: ws.searchId,
+        websetId: ws.id,
+        properties: {
+          type: ws.entityType,
+          url: `https://company${entity}.example.com`,
+          description: `Company ${entity} builds products related to ${ws.query}.`,
+          content,
+          company: { name: `Company ${entity}`, location: 'San Francisco, CA', employees: 10 + entity },
+        },
+        evaluations: ws.criteria.map(c => ({
+          criterion: c.description,
+          reasoning: `Checked ${c.description} against the company site.`,
+          satisfied: rand() < opts.satisfiedRate ? 'yes' : 'no',
+          references: [{ title: 'About', url: `https://company${entity}.example.com/about`, snippet: 'About us' }],
+        })),
+        enrichments: ws.enrichments.map(def => ({
+          object: 'enrichment_result',
+          enrichmentId: def.id,
+          format: def.format,
+          result: [enrichmentValue(def, rand, entity)],
+          reasoning: `Derived from the company site for ${def.description}.`,
+          references: [],
+          status: 'completed',
+        })),
+        createdAt,
+        updatedAt: createdAt,
+      });
+    }
+    ws.items = items;
+    return items;
+  };
+
+  const websetView = (ws: MockWebset) => {
+    if (ws.status === 'running' && Date.now() - ws.createdAt >= opts.idleAfterMs) ws.status = 'idle';
+    const done = ws.status !== 'running';
+    return {
+      id: ws.id,
+      object: 'webset',
+      status: ws.status,
+      externalId: null,
+      searches: [{
+        id: ws.searchId,
+        object: 'webset_search',
+        status: done ? 'completed' : 'running',
+        query: ws.query,
+        entity: { type: ws.entityType },
+        criteria: ws.criteria,
+        count: ws.count,
+        progress: { found: done ? ws.count : 0, analyzed: done ? ws.count : 0, completion: done ? 100 : 0 },
+      }],
+      enrichments: ws.enrichments.map(e => ({ ...e, object: 'webset_enrichment', status: done ? 'completed' : 'running' })),
+      monitors: [],
+      metadata: {},
+      createdAt: new Date(ws.createdAt).toISOString(),
+      updatedAt: new Date().toISOString(),
+    };
+  };
+
+  const createWebset = (body: Record<string, unknown>) => {
+    const search = (body.search ?? {}) as Record<string, unknown>;
+    const n = seq++;
+    const ws: MockWebset = {
+      id: `webset_mock_${n}`,
+      seq: n,
+      createdAt: Date.now(),
+      query: String(search.query ?? 'query'),
+      entityType: ((search.entity as { type?: string } | undefined)?.type) ?? 'company',
+      criteria: (search.criteria as Array<{ description: string }>) ?? [],
+      enrichments: ((body.enrichments as Array<Omit<EnrichmentDef, 'id'>>) ?? []).map((e, i) => ({
+        id: `wenrich_${n}_${i}`,
+        description: e.description,
+        format: e.format ?? 'text',
+        options: e.options,
+      })),
+      count: opts.itemsPerWebset || Number(search.count ?? 25),
+      searchId: `wsearch_${n}`,
+      status: 'running',
+    };
+    websets.set(ws.id, ws);
+    return websetView(ws);
+  };
+
+  const searchResults = (body: Record<string, unknown>) => {
+    const query = String(body.query ?? body.url ?? '');
+    const rand = prng(seedOf(query));
+    const n = Number(body.numResults ?? 10);
+    return {
+      requestId: `req_${seq++}`,
+      resolvedSearchType: 'neural',
+      results: Array.from({ length: n }, (_, i) => {
+        const entity = Math.floor(rand() * opts.entityPool);
+        return {
+          id: `https://company${entity}.example.com/${i}`,
+          url: `https://company${entity}.example.com/${i}`,
+          title: `Company ${entity}: ${query}`,
+          score: 1 - i / n,
+          publishedDate: new Date(Date.now() - i * 86_400_000).toISOString(),
+          text: body.contents ? content : undefined,
+        };
+      }),
+      costDollars: { total: 0.005 },
+    };
+  };
+
+  type Handler = (match: RegExpMatchArray, body: Record<string, unknown>, query: URLSearchParams) => unknown;
+
+  // Version segments (v0, v1, ...) are optional so client upgrades don't break routing
+  const routes: Array<[string, string, RegExp, Handler]> = [
+    ['POST', 'websets.create', /^\/websets(?:\/v\d+)?\/websets\/?$/, (_m, body) => createWebset(body)],
+    ['GET', 'websets.list', /^\/websets(?:\/v\d+)?\/websets\/?$/, () => ({
+      data: [...websets.values()].slice(0, 25).map(websetView),
+      hasMore: false,
+      nextCursor: null,
+    })],
+    ['GET', 'websets.get', /^\/websets(?:\/v\d+)?\/websets\/([^/]+)$/, m => {
+      const ws = websets.get(m[1]);
+      return ws ? websetView(ws) : null;
+    }],
+    ['POST', 'websets.cancel', /^\/websets(?:\/v\d+)?\/websets\/([^/]+)\/cancel$/, m => {
+      const ws = websets.get(m[1]);
+      if (!ws) return null;
+      ws.status = 'idle';
+      return websetView(ws);
+    }],
+    ['GET', 'items.list', /^\/websets(?:\/v\d+)?\/websets\/([^/]+)\/items\/?$/, (m, _b, query) => {
+      const ws = websets.get(m[1]);
+      if (!ws) return null;
+      const items = generateItems(ws);
+      const start = Number(query.get('cursor') ?? 0) || 0;
+      const limit = Math.min(Number(query.get('limit') ?? opts.pageSize) || opts.pageSize, opts.pageSize);
+      const end = Math.min(start + limit, items.length);
+      return { data: items.slice(start, end), hasMore: end < items.length, nextCursor: end < items.length ? String(end) : null };
+    }],
+    ['GET', 'items.get', /^\/websets(?:\/v\d+)?\/websets\/([^/]+)\/items\/([^/]+)$/, m => {
+      const ws = websets.get(m[1]);
+      return ws ? generateItems(ws).find(item => item.id === m[2]) ?? null : null;
+    }],
+    ['POST', 'searches.create', /^\/websets(?:\/v\d+)?\/websets\/([^/]+)\/searches$/, (m, body) => ({
+      id: `wsearch_${seq++}`, object: 'webset_search', websetId: m[1], status: 'running', query: body.query,
+    })],
+    ['POST', 'enrichments.create', /^\/websets(?:\/v\d+)?\/websets\/([^/]+)\/enrichments$/, (m, body) => ({
+      id: `wenrich_${seq++}`, object: 'webset_enrichment', websetId: m[1], status: 'running', ...body,
+    })],
+    ['POST', 'monitors.create', /^\/websets(?:\/v\d+)?\/monitors$/, (_m, body) => ({ id: `monitor_${seq++}`, object: 'monitor', ...body })],
+    ['POST', 'search', /^\/search$/, (_m, body) => searchResults(body)],
+    ['POST', 'findSimilar', /^\/findSimilar$/, (_m, body) => searchResults(body)],
+    ['POST', 'contents', /^\/contents$/, (_m, body) => {
+      const urls = ((body.urls ?? body.ids ?? []) as string[]);
+      return {
+        requestId: `req_${seq++}`,
+        results: urls.map(url => ({ id: url, url, title: url, text: content })),
+        statuses: urls.map(url => ({ id: url, status: 'success' })),
+      };
+    }],
+    ['POST', 'answer', /^\/answer$/, (_m, body) => ({
+      requestId: `req_${seq++}`,
+      answer: `Synthetic answer to: ${String(body.query ?? '')}`,
+      citations: searchResults({ query: body.query, numResults: 5 }).results,
+    })],
+    ['POST', 'research.create', /^\/research(?:\/v\d+)?(?:\/tasks)?\/?$/, (_m, body) => {
+      const id = `r_mock_${seq++}`;
+      research.set(id, { id, createdAt: Date.now(), instructions: String(body.instructions ?? '') });
+      return { researchId: id, status: 'pending', createdAt: Date.now(), instructions: body.instructions };
+    }],
+    ['GET', 'research.get', /^\/research(?:\/v\d+)?(?:\/tasks)?\/([^/]+)$/, m => {
+      const job = research.get(m[1]);
+      if (!job) return null;
+      const done = Date.now() - job.createdAt >= opts.researchMs;
+      return {
+        researchId: job.id,
+        status: done ? 'completed' : 'running',
+        createdAt: job.createdAt,
+        instructions: job.instructions,
+        ...(done ? { output: { content: `Synthetic research finding for: ${job.instructions}`, parsed: null } } : {}),
+        costDollars: { total: 0.1 },
+      };
+    }],
+  ];
+
+  const delay = () => opts.latencyMs + (opts.jitterMs > 0 ? Math.random() * opts.jitterMs : 0);
+
+  const server = http.createServer((req, res) => {
+    const chunks: Buffer[] = [];
+    req.on('data', chunk => chunks.push(chunk));
+    req.on('end', () => {
+      const url = new URL(req.url ?? '/', 'http://mock');
+      let body: Record<string, unknown> = {};
+      if (chunks.length > 0) {
+        try {
+          body = JSON.parse(Buffer.concat(chunks).toString('utf8'));
+        } catch {
+          body = {};
+        }
+      }
+
+      const route = routes.find(([method, , pattern]) => method === req.method && pattern.test(url.pathname));
+      const respond = () => {
+        if (!route) {
+          res.writeHead(404, { 'Content-Type': 'application/json' });
+          res.end(JSON.stringify({ error: `No mock for ${req.method} ${url.pathname}` }));
+          return;
+        }
+        const [, name, pattern, handler] = route;
+        requests[name] = (requests[name] ?? 0) + 1;
+        const result = handler(url.pathname.match(pattern)!, body, url.searchParams);
+        if (result === null) {
+          res.writeHead(404, { 'Content-Type': 'application/json' });
+          res.end(JSON.stringify({ error: 'Not found' }));
+          return;
+        }
+        res.writeHead(200, { 'Content-Type': 'application/json' });
+        res.end(JSON.stringify(result));
+      };
+
+      const ms = delay();
+      if (ms > 0) setTimeout(respond, ms);
+      else respond();
+    });
+  });
+
+  await new Promise<void>(resolve => server.listen(port, '127.0.0.1', resolve));
+  const address = server.address() as AddressInfo;
+
+  return {
+    url: `http://127.0.0.1:${address.port}`,
+    requests,
+    close: () => new Promise<void>((resolve, reject) => {
+      server.closeAllConnections?.();
+      server.close(err => (err ? reject(err) : resolve()));
+    }),
+  };
+}
+
+// --- Standalone entry point ---
+
+export function parseFlags(argv: string[]): Record<string, string> {
+  const flags: Record<string, string> = {};
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i];
+    if (!arg.startsWith('--')) continue;
+    const [key, inline] = arg.slice(2).split('=', 2);
+    flags[key] = inline ?? (argv[i + 1] && !argv[i + 1].startsWith('--') ? argv[++i] : 'true');
+  }
+  return flags;
+}
+
+export function mockOptionsFromFlags(flags: Record<string, string>): MockExaOptions {
+  const num = (key: string) => (flags[key] !== undefined ? Number(flags[key]) : undefined);
+  return {
+    latencyMs: num('latency'),
+    jitterMs: num('jitter'),
+    pageSize: num('page-size'),
+    itemsPerWebset: num('items'),
+    itemBytes: num('item-bytes'),
+    entityPool: num('entity-pool'),
+    idleAfterMs: num('idle-after'),
+    researchMs: num('research-ms'),
+  };
+}
+
+if (process.argv[1] && import.meta.url === pathToFileURL(process.argv[1]).href) {
+  const flags = parseFlags(process.argv.slice(2));
+  const mock = await startMockExaServer(mockOptionsFromFlags(flags), Number(flags.port ?? 0));
+  // When forked by the load runner, report the address over IPC
+  if (process.send) process.send({ url: mock.url });
+  else console.log(`Mock Exa API listening at ${mock.url}`);
+  process.on('message', async (msg: { type?: string }) => {
+    if (msg?.type === 'stats') process.send?.({ requests: mock.requests });
+    if (msg?.type === 'close') {
+      await mock.close();
+      process.exit(0);
+    }
+  });
+}
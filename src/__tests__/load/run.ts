@@ -0,0 +1,160 @@
+// Offline load test: the MCP server under test talks to a local mock of the
+// Exa API, so runs are repeatable and free. Save a run with --json and pass it
+// back with --compare to see the delta between two commits.
+//
+//   npm run bench:load -- --sessions 50 --requests 40 --tasks 2 --lens-size 500
+//   npm run bench:load -- --scenario workflows --json before.json
+//   npm run bench:load -- --scenario workflows --compare before.json
+//
+// Mock flags (--latency, --jitter, --page-size, --items, --item-bytes,
+// --entity-pool, --idle-after, --research-ms) are passed through to the mock.
+
+import { execSync, fork } from 'node:child_process';
+import { readFileSync, writeFileSync } from 'node:fs';
+import { fileURLToPath } from 'node:url';
+import type { Server as HttpServer } from 'node:http';
+import { createServer } from '../../server.js';
+import { parseFlags, mockOptionsFromFlags, startMockExaServer } from './mockExaServer.js';
+import {
+  runDispatchScenario,
+  runWorkflowScenario,
+  formatReport,
+  formatComparison,
+  type ScenarioReport,
+} from './harness.js';
+
+interface LoadReport {
+  commit: string | null;
+  startedAt: string;
+  flags: Record<string, string>;
+  scenarios: ScenarioReport[];
+}
+
+interface MockHandle {
+  url: string;
+  requests(): Promise<Record<string, number>>;
+  close(): Promise<void>;
+}
+
+/**
+ * Run the mock in a child process by default so its own allocation and CPU
+ * do not show up in the server's event-loop lag and heap figures.
+ */
+async function startMock(flags: Record<string, string>): Promise<MockHandle> {
+  if (flags['in-process-mock'] === 'true') {
+    const mock = await startMockExaServer(mockOptionsFromFlags(flags));
+    return { url: mock.url, requests: async () => mock.requests, close: () => mock.close() };
+  }
+
+  const mockArgs = Object.entries(flags).flatMap(([key, value]) => [`--${key}`, value]);
+  const child = fork(fileURLToPath(new URL('./mockExaServer.ts', import.meta.url)), mockArgs, {
+    execArgv: process.execArgv,
+    stdio: 'inherit',
+  });
+  const reply = <T>() => new Promise<T>((resolve, reject) => {
+    child.once('message', msg => resolve(msg as T));
+    child.once('exit', code => reject(new Error(`mock server exited with code ${code}`)));
+  });
+  const { url } = await reply<{ url: string }>();
+  return {
+    url,
+    requests: async () => {
+      const stats = reply<{ requests: Record<string, number> }>();
+      child.send({ type: 'stats' });
+      return (await stats).requests;
+    },
+    close: async () => {
+      const exited = new Promise(resolve => child.once('exit', resolve));
+      child.send({ type: 'close' });
+      await exited;
+    },
+  };
+}
+
+function currentCommit(): string | null {
+  try {
+    return execSync('git rev-parse --short HEAD', { stdio: ['ignore', 'pipe', 'ignore'] }).toString().trim();
+  } catch {
+    return null;
+  }
+}
+
+async function main(): Promise<void> {
+  const flags = parseFlags(process.argv.slice(2));
+  const num = (key: string, fallback: number) => (flags[key] !== undefined ? Number(flags[key]) : fallback);
+  const scenario = flags.scenario ?? 'all';
+  const sessions = num('sessions', 20);
+  const lensSize = num('lens-size', 200);
+  const output = flags.output === 'compact' ? 'compact' : flags.output === 'pretty' ? 'pretty' : undefined;
+  const workflows = (flags.workflows ?? 'qd.winnow,convergent.search,semantic.cron').split(',');
+
+  // Websets settle quickly so a run measures the server, not the mock's clock
+  if (flags['idle-after'] === undefined) flags['idle-after'] = '1500';
+  if (flags.latency === undefined) flags.latency = '20';
+
+  const mock = await startMock(flags);
+  const instance = createServer({
+    exaApiKey: 'load-test',
+    exaBaseUrl: mock.url,
+    host: '127.0.0.1',
+    responseCache: flags['no-cache'] === 'true' ? false : undefined,
+  });
+  const httpServer = await new Promise<HttpServer>(resolve => {
+    const s = instance.app.listen(0, '127.0.0.1', () => resolve(s));
+  });
+  const addr = httpServer.address();
+  if (!addr || typeof addr === 'string') throw new Error('Failed to get server address');
+  const mcpUrl = `http://127.0.0.1:${addr.port}/mcp`;
+
+  const report: LoadReport = { commit: currentCommit(), startedAt: new Date().toISOString(), flags, scenarios: [] };
+  console.log(`Load test at ${report.commit ?? 'unknown commit'} against mock ${mock.url}`);
+
+  try {
+    if (scenario === 'all' || scenario === 'dispatch') {
+      const r = await runDispatchScenario(mcpUrl, {
+        sessions,
+        requestsPerSession: num('requests', 25),
+        lensSize,
+        output,
+      });
+      report.scenarios.push(r);
+      console.log(formatReport(r));
+    }
+    if (scenario === 'all' || scenario === 'workflows') {
+      const r = await runWorkflowScenario(mcpUrl, {
+        sessions,
+        tasksPerSession: num('tasks', 1),
+        lensSize,
+        workflows,
+        pollIntervalMs: num('poll-ms', 200),
+        taskTimeoutMs: num('task-timeout-ms', 120_000),
+      });
+      report.scenarios.push(r);
+      console.log(formatReport(r));
+    }
+
+    const upstream = await mock.requests();
+    const upstreamTotal = Object.values(upstream).reduce((sum, n) => sum + n, 0);
+    console.log(`   upstream requests: ${upstreamTotal} ${JSON.stringify(upstream)}`);
+
+    if (flags.compare) {
+      const baseline = JSON.parse(readFileSync(flags.compare, 'utf8')) as LoadReport;
+      console.log(`\nCompared with ${baseline.commit ?? flags.compare}:`);
+      console.log(formatComparison(report.scenarios, baseline.scenarios));
+    }
+    if (flags.json) {
+      writeFileSync(flags.json, JSON.stringify(report, null, 2));
+      console.log(`Report written to ${flags.json}`);
+    }
+  } finally {
+    await new Promise<void>(resolve => httpServer.close(() => resolve()));
+    await mock.close();
+  }
+  // Session timers and task runners may still hold the loop open
+  process.exit(report.scenarios.some(r => r.errors > 0 || (r.tasks?.failed ?? 0) > 0) ? 1 : 0);
+}
+
+main().catch(err => {
+  console.error(err);
+  process.exit(1);
+});
@@ -169,6 +169,11 @@ describe('exa.getContents', () => {
     expect(opts.extras).toEqual({ links: 10 });
   });
 
+  it('forwards maxAgeHours: 0 so the request skips cached content', async () => {
+    await exaHandlers.getContents({ urls: ['https://example.com'], maxAgeHours: 0 }, exa);
+    expect((exa.getContents as any).mock.calls[0][1]).toEqual({ maxAgeHours: 0 });
+  });
+
   it('returns error on failure', async () => {
     (exa.getContents as any).mockRejectedValue(new Error('Rate limit'));
     const result = await exaHandlers.getContents({ urls: ['https://x.com'] }, exa);
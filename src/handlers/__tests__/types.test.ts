@@ -1,5 +1,5 @@
 import { describe, it, expect } from 'vitest';
-import { successResult, errorResult } from '../types.js';
+import { successResult, errorResult, resultPayload, serializeData } from '../types.js';
 
 describe('successResult', () => {
   it('wraps data in content array with pretty JSON', () => {
@@ -14,6 +14,19 @@ describe('successResult', () => {
     const result = successResult(null);
     expect(result.content[0].text).toBe('null');
   });
+
+  it('keeps the structured data for the dispatcher', () => {
+    const data = { id: 'test_123' };
+    expect(resultPayload(successResult(data))?.data).toBe(data);
+    expect(resultPayload(errorResult('op', 'boom'))).toBeUndefined();
+  });
+});
+
+describe('serializeData', () => {
+  it('writes indented or compact JSON', () => {
+    expect(serializeData({ a: [1] }, 'pretty')).toBe('{\n  "a": [\n    1\n  ]\n}');
+    expect(serializeData({ a: [1] }, 'compact')).toBe('{"a":[1]}');
+  });
 });
 
 describe('errorResult', () => {
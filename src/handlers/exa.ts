@@ -143,7 +143,7 @@ export const getContents: OperationHandler = async (args, exa) => {
     if (args.summary) opts.summary = args.summary;
     if (args.livecrawl) opts.livecrawl = args.livecrawl;
     if (args.livecrawlTimeout) opts.livecrawlTimeout = args.livecrawlTimeout;
-    if (args.maxAgeHours) opts.maxAgeHours = args.maxAgeHours;
+    if (args.maxAgeHours !== undefined) opts.maxAgeHours = args.maxAgeHours;
     if (args.subpages) opts.subpages = args.subpages;
     if (args.subpageTarget) opts.subpageTarget = args.subpageTarget;
     if (args.extras) opts.extras = args.extras;
@@ -2,6 +2,7 @@ import type { Exa } from 'exa-js';
 import { z } from 'zod';
 import { OperationHandler, successResult, errorResult, requireParams } from './types.js';
 import { projectImport } from '../lib/projections.js';
+import { getImportPoller } from '../lib/statusPoller.js';
 
 export const Schemas = {
   create: z.object({
@@ -112,8 +113,14 @@ export const waitUntilCompleted: OperationHandler = async (args, exa) => {
     const id = args.id as string;
     const timeout = (args.timeout as number | undefined) ?? 300_000;
     const pollInterval = (args.pollInterval as number | undefined) ?? 2_000;
-    const response = await exa.websets.imports.waitUntilCompleted(id, { timeout, pollInterval });
-    return successResult(projectImport(response as unknown as Record<string, unknown>));
+    const { resource, timedOut } = await getImportPoller(exa).waitFor(id, {
+      timeoutMs: timeout,
+      maxIntervalMs: pollInterval,
+    });
+    if (timedOut) {
+      throw new Error(`Import ${id} did not complete within ${timeout}ms`);
+    }
+    return successResult(projectImport(resource as Record<string, unknown>));
   } catch (error) {
     return errorResult('imports.waitUntilCompleted', error);
   }
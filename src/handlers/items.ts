@@ -1,7 +1,8 @@
 import type { Exa } from 'exa-js';
 import { z } from 'zod';
 import { OperationHandler, successResult, errorResult, requireParams } from './types.js';
-import { filterAndProjectItems } from '../lib/projections.js';
+import { filterAndProjectItems, hasSatisfiedEvaluation, projectItem } from '../lib/projections.js';
+import { streamItems } from '../lib/itemStream.js';
 
 export const Schemas = {
   list: z.object({
@@ -17,6 +18,8 @@ export const Schemas = {
     websetId: z.string(),
     maxItems: z.number().optional(),
     sourceId: z.string().optional(),
+    withinDays: z.number().positive().optional(),
+    resumeCursor: z.string().optional(),
   }),
   del: z.object({
     websetId: z.string(),
@@ -62,17 +65,23 @@ export const getAll: OperationHandler = async (args, exa) => {
   const guard = requireParams('items.getAll', args, 'websetId');
   if (guard) return guard;
   try {
-    const websetId = args.websetId as string;
-    const maxItems = (args.maxItems as number | undefined) ?? 1000;
-    const opts: Record<string, unknown> = {};
-    if (args.sourceId) opts.sourceId = args.sourceId;
-    const results: unknown[] = [];
-    for await (const item of exa.websets.items.listAll(websetId, opts as any)) {
-      results.push(item);
-      if (results.length >= maxItems) break;
-    }
-    const projected = filterAndProjectItems(results);
-    return successResult({ ...projected, truncated: results.length >= maxItems });
+    // Filter and project as items stream in; raw items are never buffered
+    const result = await streamItems(exa, args.websetId as string, {
+      maxItems: (args.maxItems as number | undefined) ?? 1000,
+      sourceId: args.sourceId as string | undefined,
+      withinDays: args.withinDays as number | undefined,
+      resumeCursor: args.resumeCursor as string | undefined,
+      filter: hasSatisfiedEvaluation,
+      map: projectItem,
+    });
+    return successResult({
+      data: result.data,
+      total: result.total,
+      included: result.data.length,
+      excluded: result.excluded,
+      truncated: result.truncated,
+      resumeCursor: result.resumeCursor,
+    });
   } catch (error) {
     return errorResult('items.getAll', error);
   }
@@ -3,12 +3,14 @@ import type { OperationHandler } from './types.js';
 import { successResult, errorResult, requireParams } from './types.js';
 import { taskStore } from '../lib/taskStore.js';
 import { workflowRegistry } from '../workflows/types.js';
-import { WorkflowError } from '../workflows/helpers.js';
+import { launchWorkflow } from '../workflows/runner.js';
+import { taskScheduler, type TaskPriority } from '../lib/scheduler.js';
 
 export const Schemas = {
   create: z.object({
     type: z.string(),
     args: z.record(z.string(), z.unknown()).optional(),
+    priority: z.enum(['low', 'normal', 'high']).optional(),
   }).catchall(z.unknown()), // Allow flattened arguments
   get: z.object({
     taskId: z.string(),
@@ -24,7 +26,7 @@ export const Schemas = {
   }),
 };
 
-export const create: OperationHandler = async (args, exa) => {
+export const create: OperationHandler = async (args, exa, context) => {
 
   const guard = requireParams('tasks.create', args, 'type');
   if (guard) return guard;
@@ -36,21 +38,20 @@ export const create: OperationHandler = async (args, exa) => {
     return errorResult('tasks.create', `Unknown task type: "${type}". Available: ${available}`);
   }
 
+  if (!taskScheduler.canAdmit()) {
+    return errorResult('tasks.create', 'Task queue is full. Cancel or wait for existing tasks.');
+  }
+
   try {
-    const { type: _type, args: _args, ...rest } = args;
+    const { type: _type, args: _args, priority, ...rest } = args;
     const taskArgs = (_args as Record<string, unknown>) ?? rest;
     const task = taskStore.create(type, taskArgs);
+    const started = launchWorkflow(task, workflow, exa, taskStore, {
+      priority: priority as TaskPriority | undefined,
+      sessionId: context?.sessionId,
+    });
 
-
-    void workflow(task.id, taskArgs, exa, taskStore)
-      .then(result => taskStore.setResult(task.id, result))
-      .catch(err => taskStore.setError(task.id, {
-        step: err instanceof WorkflowError ? err.step : 'unknown',
-        message: err instanceof Error ? err.message : String(err),
-        recoverable: err instanceof WorkflowError ? err.recoverable : false,
-      }));
-
-    return successResult({ taskId: task.id, status: 'pending' });
+    return successResult({ taskId: task.id, status: 'pending', queued: !started });
   } catch (error) {
     return errorResult('tasks.create', error);
   }
@@ -114,6 +115,7 @@ export const cancel: OperationHandler = async (args) => {
   if (guard) return guard;
 
   const cancelled = taskStore.cancel(args.taskId as string);
+  if (cancelled) taskScheduler.remove(args.taskId as string);
   if (!cancelled) {
     return errorResult('tasks.cancel', `Cannot cancel task ${args.taskId} (not found or already finished)`);
   }
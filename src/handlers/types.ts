@@ -5,15 +5,48 @@ export type ToolResult = {
   isError?: boolean;
 };
 
+/** Per-request context from the MCP transport. */
+export interface OperationContext {
+  sessionId?: string;
+}
+
 export type OperationHandler = (
   args: Record<string, unknown>,
-  exa: Exa
+  exa: Exa,
+  context?: OperationContext,
 ) => Promise<ToolResult>;
 
+/** How result JSON is written: indented for reading, or compact for large payloads. */
+export type OutputFormat = 'pretty' | 'compact';
+
+const PAYLOAD = Symbol('payload');
+
+/**
+ * Wrap handler data as a tool result. The data stays attached and the text is
+ * only serialized when first read, so the dispatcher can add metadata and pick
+ * the output format with a single stringify (see resultPayload).
+ */
 export function successResult(data: unknown): ToolResult {
-  return {
-    content: [{ type: 'text', text: JSON.stringify(data, null, 2) }],
+  let text: string | undefined;
+  const result: ToolResult = {
+    content: [{
+      type: 'text',
+      get text() {
+        return (text ??= serializeData(data, 'pretty'));
+      },
+    }],
   };
+  Object.defineProperty(result, PAYLOAD, { value: data });
+  return result;
+}
+
+/** The structured data behind a successResult, or undefined for other results. */
+export function resultPayload(result: ToolResult): { data: unknown } | undefined {
+  return PAYLOAD in result ? { data: (result as Record<symbol, unknown>)[PAYLOAD] } : undefined;
+}
+
+export function serializeData(data: unknown, format: OutputFormat): string {
+  return format === 'compact' ? JSON.stringify(data) : JSON.stringify(data, null, 2);
 }
 
 export function errorResult(operation: string, error: unknown, hints?: string): ToolResult {
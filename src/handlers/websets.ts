@@ -2,6 +2,7 @@ import type { Exa } from 'exa-js';
 import { z } from 'zod';
 import { OperationHandler, successResult, errorResult, requireParams } from './types.js';
 import { projectWebset } from '../lib/projections.js';
+import { getWebsetPoller } from '../lib/statusPoller.js';
 
 export const Schemas = {
   create: z.object({
@@ -93,6 +94,7 @@ export const get: OperationHandler = async (args, exa) => {
     const id = args.id as string;
     const expand = args.expand as string[] | undefined;
     const response = await exa.websets.get(id, expand as any);
+    getWebsetPoller(exa).observe(id, response);
     return successResult(projectWebset(response as unknown as Record<string, unknown>));
   } catch (error) {
     return errorResult('websets.get', error);
@@ -162,8 +164,14 @@ export const waitUntilIdle: OperationHandler = async (args, exa) => {
     const id = args.id as string;
     const timeout = (args.timeout as number | undefined) ?? 300_000;
     const pollInterval = (args.pollInterval as number | undefined) ?? 1_000;
-    const response = await exa.websets.waitUntilIdle(id, { timeout, pollInterval });
-    return successResult(projectWebset(response as unknown as Record<string, unknown>));
+    const { resource, timedOut } = await getWebsetPoller(exa).waitFor(id, {
+      timeoutMs: timeout,
+      maxIntervalMs: pollInterval,
+    });
+    if (timedOut) {
+      throw new Error(`Webset ${id} did not reach idle state within ${timeout}ms`);
+    }
+    return successResult(projectWebset(resource as Record<string, unknown>));
   } catch (error) {
     return errorResult('websets.waitUntilIdle', error);
   }
@@ -1,5 +1,6 @@
 #!/usr/bin/env node
 import { createServer } from "./server.js";
+import { taskStore } from "./lib/taskStore.js";
 
 const defaultCompatModeRaw = process.env.MANAGE_WEBSETS_DEFAULT_COMPAT_MODE;
 const defaultCompatMode = defaultCompatModeRaw === 'safe' ? 'safe' : 'strict';
@@ -13,11 +14,33 @@ if (
   );
 }
 
+const outputFormatRaw = process.env.MANAGE_WEBSETS_OUTPUT_FORMAT;
+const defaultOutputFormat = outputFormatRaw === 'compact' ? 'compact' : 'pretty';
+if (outputFormatRaw !== undefined && outputFormatRaw !== 'compact' && outputFormatRaw !== 'pretty') {
+  console.warn(`Invalid MANAGE_WEBSETS_OUTPUT_FORMAT="${outputFormatRaw}". Using "pretty".`);
+}
+
+const cacheMaxMb = Number(process.env.RESPONSE_CACHE_MAX_MB ?? 64);
+
 const { app } = createServer({
   exaApiKey: process.env.EXA_API_KEY || '',
+  exaBaseUrl: process.env.EXA_BASE_URL || undefined,
   defaultCompatMode,
+  defaultOutputFormat,
+  taskStorePath: process.env.TASK_STORE_PATH || undefined,
+  responseCache: cacheMaxMb > 0
+    ? { maxBytes: cacheMaxMb * 1024 * 1024, spillDir: process.env.RESPONSE_CACHE_DIR || undefined }
+    : false,
 });
 
+// Write buffered task updates before exiting so a restart can resume them
+for (const signal of ['SIGINT', 'SIGTERM'] as const) {
+  process.once(signal, () => {
+    taskStore.dispose();
+    process.exit(0);
+  });
+}
+
 const PORT = process.env.PORT || 7860;
 
 app.listen(PORT, () => {
@@ -0,0 +1,97 @@
+// Run with `npm run bench`. Compares the indexed joins against the original
+// pairwise scan on synthetic lenses of a few thousand items each.
+import { bench, describe } from 'vitest';
+import { EntityIndex, diceCoefficient } from '../entityMatcher.js';
+import { deduplicateItems } from '../../workflows/convergent.js';
+import { joinLensResults } from '../../workflows/semanticCron.js';
+
+const ITEMS_PER_LENS = 2_000;
+const LENSES = 3;
+
+function syntheticName(i: number): string {
+  const words = ['Quantum', 'Neural', 'Solar', 'Cloud', 'Bio', 'Data', 'Robotic', 'Fusion', 'Edge', 'Vector'];
+  return `${words[i % 10]} ${words[Math.floor(i / 10) % 10]} Systems ${i}`;
+}
+
+function syntheticLens(lens: number) {
+  const items: Record<string, unknown>[] = [];
+  for (let i = 0; i < ITEMS_PER_LENS; i++) {
+    // Half the entities overlap between lenses, half are unique to this lens
+    const id = i % 2 === 0 ? i : lens * ITEMS_PER_LENS + i;
+    items.push({
+      id: `item_${lens}_${i}`,
+      properties: {
+        company: { name: syntheticName(id) },
+        url: i % 4 === 0 ? `https://company${id}.com` : undefined,
+      },
+      createdAt: new Date(Date.UTC(2026, 0, 1) + ((i * 7919) % 90) * 86400000).toISOString(),
+    });
+  }
+  return items;
+}
+
+const itemsByQuery = Array.from({ length: LENSES }, (_, l) => syntheticLens(l));
+
+const lensResults = itemsByQuery.map((items, l) => ({
+  lensId: `lens${l}`,
+  websetId: `ws${l}`,
+  totalItems: items.length,
+  shapedItems: items.map(item => {
+    const props = item.properties as Record<string, any>;
+    return {
+      id: item.id as string,
+      name: props.company.name as string,
+      url: (props.url as string) ?? '',
+      entityType: 'company',
+      enrichments: {},
+      createdAt: item.createdAt as string,
+      projected: {},
+    };
+  }),
+}));
+
+function linearDedupe(lists: Array<Record<string, unknown>[]>): number {
+  const entities: Array<{ name: string; url: string }> = [];
+  for (const list of lists) {
+    for (const item of list) {
+      const props = item.properties as Record<string, any>;
+      const name = props.company.name as string;
+      const url = (props.url as string) ?? '';
+      const found = entities.some(e =>
+        (url && e.url && url === e.url) || (name && e.name && diceCoefficient(name, e.name) > 0.85),
+      );
+      if (!found) entities.push({ name, url });
+    }
+  }
+  return entities.length;
+}
+
+describe(`entity resolution: ${LENSES} lenses × ${ITEMS_PER_LENS} items`, () => {
+  bench('linear scan (baseline)', () => {
+    linearDedupe(itemsByQuery);
+  }, { iterations: 3 });
+
+  bench('EntityIndex', () => {
+    const index = new EntityIndex<true>();
+    for (const list of itemsByQuery) {
+      for (const item of list) {
+        const props = item.properties as Record<string, any>;
+        if (!index.match(props.company.name, props.url ?? '')) {
+          index.add(props.company.name, props.url ?? '', true);
+        }
+      }
+    }
+  });
+
+  bench('deduplicateItems', () => {
+    deduplicateItems(itemsByQuery);
+  });
+
+  bench('joinLensResults entity+temporal', () => {
+    joinLensResults(lensResults, { by: 'entity+temporal', temporal: { days: 7 } });
+  });
+
+  bench('joinLensResults temporal', () => {
+    joinLensResults(lensResults, { by: 'temporal', temporal: { days: 7 } });
+  });
+});
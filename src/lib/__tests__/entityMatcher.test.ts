@@ -0,0 +1,141 @@
+import { describe, it, expect } from 'vitest';
+import {
+  EntityIndex,
+  diceCoefficient,
+  normalizeUrl,
+  hasCrossLensPairWithin,
+  crossLensPairsWithin,
+} from '../entityMatcher.js';
+
+// Reference implementation: the original first-match linear scan
+function linearMatch(
+  entities: Array<{ name: string; url: string }>,
+  name: string,
+  url: string,
+  threshold: number,
+): number {
+  for (let i = 0; i < entities.length; i++) {
+    const e = entities[i];
+    if (url && e.url && normalizeUrl(url) === normalizeUrl(e.url)) return i;
+    if (name && e.name && diceCoefficient(name, e.name) > threshold) return i;
+  }
+  return -1;
+}
+
+function randomName(rand: () => number): string {
+  const stems = ['acme', 'globex', 'initech', 'umbrella', 'hooli', 'stark', 'wayne', 'tyrell'];
+  const suffixes = ['', ' inc', ' corp', ' labs', ' ai', 's', ' group'];
+  const stem = stems[Math.floor(rand() * stems.length)];
+  const suffix = suffixes[Math.floor(rand() * suffixes.length)];
+  const noise = rand() < 0.3 ? String.fromCharCode(97 + Math.floor(rand() * 26)) : '';
+  return `${stem}${noise}${suffix}`;
+}
+
+function seeded(seed: number): () => number {
+  return () => {
+    seed = (seed * 1664525 + 1013904223) >>> 0;
+    return seed / 2 ** 32;
+  };
+}
+
+describe('normalizeUrl', () => {
+  it('ignores scheme, www, case, fragments and trailing slashes', () => {
+    expect(normalizeUrl('https://www.Acme.com/')).toBe('acme.com');
+    expect(normalizeUrl('http://acme.com#about')).toBe('acme.com');
+    expect(normalizeUrl('acme.com/jobs/?page=2')).toBe('acme.com/jobs?page=2');
+  });
+
+  it('keeps distinct paths distinct', () => {
+    expect(normalizeUrl('https://acme.com/a')).not.toBe(normalizeUrl('https://acme.com/b'));
+  });
+});
+
+describe('EntityIndex', () => {
+  it('matches by normalized URL', () => {
+    const index = new EntityIndex<string>();
+    index.add('Acme', 'https://acme.com/', 'first');
+    expect(index.match('Something Else', 'http://www.acme.com')).toBe('first');
+  });
+
+  it('matches by fuzzy name above threshold', () => {
+    const index = new EntityIndex<string>();
+    index.add('Acme Corporation', '', 'acme');
+    expect(index.match('acme corporation', '')).toBe('acme');
+    expect(index.match('Acme Corporations', '')).toBe('acme');
+    expect(index.match('Globex', '')).toBeUndefined();
+  });
+
+  it('matches short names only on exact equality', () => {
+    const index = new EntityIndex<string>();
+    index.add('A', '', 'a');
+    expect(index.match('a', '')).toBe('a');
+    expect(index.match('b', '')).toBeUndefined();
+  });
+
+  it('prefers the earliest matching entity', () => {
+    const index = new EntityIndex<string>();
+    index.add('Acme Labs', 'https://one.com', 'first');
+    index.add('Other', 'https://two.com', 'second');
+    // URL points at the second, name at the first — the first wins
+    expect(index.match('Acme Labs', 'https://two.com')).toBe('first');
+  });
+
+  it('agrees with a linear scan on random names', () => {
+    for (const threshold of [0.85, 0.7, 0.5, 0]) {
+      const rand = seeded(42 + Math.round(threshold * 100));
+      const index = new EntityIndex<number>(threshold);
+      const reference: Array<{ name: string; url: string }> = [];
+
+      for (let i = 0; i < 500; i++) {
+        const name = randomName(rand);
+        const url = rand() < 0.2 ? `https://${name.replace(/\s/g, '')}.com` : '';
+        const expected = linearMatch(reference, name, url, threshold);
+        const actual = index.match(name, url);
+        expect(actual ?? -1).toBe(expected);
+        if (actual === undefined) {
+          index.add(name, url, reference.length);
+          reference.push({ name, url });
+        }
+      }
+    }
+  });
+});
+
+describe('temporal windows', () => {
+  const day = 86400000;
+
+  it('hasCrossLensPairWithin ignores same-lens pairs', () => {
+    expect(hasCrossLensPairWithin([
+      { lensId: 'a', time: 0 },
+      { lensId: 'a', time: day },
+      { lensId: 'b', time: 30 * day },
+    ], 7 * day)).toBe(false);
+  });
+
+  it('hasCrossLensPairWithin finds a close pair across lenses', () => {
+    expect(hasCrossLensPairWithin([
+      { lensId: 'a', time: 0 },
+      { lensId: 'a', time: 20 * day },
+      { lensId: 'b', time: 25 * day },
+    ], 7 * day)).toBe(true);
+  });
+
+  it('hasCrossLensPairWithin skips invalid dates', () => {
+    expect(hasCrossLensPairWithin([
+      { lensId: 'a', time: NaN },
+      { lensId: 'b', time: 0 },
+    ], 7 * day)).toBe(false);
+  });
+
+  it('crossLensPairsWithin returns every qualifying lens pair', () => {
+    const pairs = crossLensPairsWithin([
+      { lensId: 'a', time: 0 },
+      { lensId: 'b', time: 3 * day },
+      { lensId: 'c', time: 20 * day },
+    ], 7 * day);
+    expect(pairs.has('a\u0000b')).toBe(true);
+    expect(pairs.has('b\u0000a')).toBe(true);
+    expect(pairs.has('a\u0000c')).toBe(false);
+    expect(pairs.has('b\u0000c')).toBe(false);
+  });
+});
@@ -0,0 +1,118 @@
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import fs from 'node:fs';
+import os from 'node:os';
+import path from 'node:path';
+import { FileTaskBackend } from '../fileTaskBackend.js';
+import { TaskStore } from '../taskStore.js';
+import { resumeInterruptedTasks } from '../../workflows/runner.js';
+import { registerWorkflow } from '../../workflows/types.js';
+
+describe('FileTaskBackend', () => {
+  let dir: string;
+  let file: string;
+  const stores: TaskStore[] = [];
+
+  const open = (compactAfter?: number) => {
+    const store = new TaskStore(undefined, new FileTaskBackend(file, compactAfter));
+    stores.push(store);
+    return store;
+  };
+
+  beforeEach(() => {
+    dir = fs.mkdtempSync(path.join(os.tmpdir(), 'tasks-'));
+    file = path.join(dir, 'tasks.jsonl');
+  });
+
+  afterEach(() => {
+    for (const s of stores.splice(0)) s.dispose();
+    fs.rmSync(dir, { recursive: true, force: true });
+  });
+
+  it('round-trips tasks across store instances', () => {
+    const first = open();
+    const done = first.create('echo', { message: 'hi' });
+    first.setResult(done.id, { echoed: 'hi' });
+    const running = first.create('echo', {});
+    first.updateProgress(running.id, { step: 'echoing', completed: 1, total: 2 });
+    first.dispose();
+
+    const second = open();
+    expect(second.get(done.id)?.result).toEqual({ echoed: 'hi' });
+    expect(second.get(running.id)?.status).toBe('working');
+
+    const interrupted = second.takeInterrupted();
+    expect(interrupted.map(t => t.id)).toEqual([running.id]);
+    expect(second.takeInterrupted()).toEqual([]);
+  });
+
+  it('skips a torn final line', () => {
+    const first = open();
+    const task = first.create('echo', {});
+    first.dispose();
+    fs.appendFileSync(file, '{"op":"put","task":{"id":');
+
+    const second = open();
+    expect(second.get(task.id)).toBeDefined();
+    expect(second.list()).toHaveLength(1);
+  });
+
+  it('records expired tasks as deleted', () => {
+    const first = new TaskStore(0, new FileTaskBackend(file));
+    stores.push(first);
+    const task = first.create('echo', {});
+    first.setResult(task.id, {});
+    first.flush();
+    expect(first.cleanup()).toBe(1);
+    first.dispose();
+
+    expect(open().get(task.id)).toBeUndefined();
+  });
+
+  it('compacts the log once it is mostly stale', () => {
+    const store = open(10);
+    const task = store.create('echo', {});
+    for (let i = 0; i < 20; i++) {
+      store.updateProgress(task.id, { step: 'loop', completed: i, total: 20 });
+      store.flush();
+    }
+    const lines = fs.readFileSync(file, 'utf8').trim().split('\n');
+    expect(lines.length).toBeLessThan(10);
+  });
+});
+
+describe('resumeInterruptedTasks', () => {
+  let dir: string;
+
+  beforeEach(() => {
+    dir = fs.mkdtempSync(path.join(os.tmpdir(), 'tasks-'));
+  });
+
+  afterEach(() => {
+    fs.rmSync(dir, { recursive: true, force: true });
+  });
+
+  it('relaunches known workflows and fails unknown ones', async () => {
+    const file = path.join(dir, 'tasks.jsonl');
+    const before = new TaskStore(undefined, new FileTaskBackend(file));
+    const known = before.create('test.resumable', { n: 1 });
+    before.setPartialResult(known.id, { checkpoint: 'created' });
+    const unknown = before.create('test.missing', {});
+    before.dispose();
+
+    let seenPartial: unknown;
+    registerWorkflow('test.resumable', async (taskId, args, _exa, store) => {
+      seenPartial = store.get(taskId)?.partialResult;
+      return { resumed: args.n };
+    });
+
+    const after = new TaskStore(undefined, new FileTaskBackend(file));
+    const resumed = resumeInterruptedTasks({} as any, after);
+    expect(resumed).toEqual([known.id]);
+    await new Promise(r => setTimeout(r, 0));
+
+    expect(seenPartial).toEqual({ checkpoint: 'created' });
+    expect(after.get(known.id)?.result).toEqual({ resumed: 1 });
+    expect(after.get(unknown.id)?.error?.step).toBe('resume');
+    after.dispose();
+  });
+});
@@ -0,0 +1,137 @@
+import { describe, it, expect } from 'vitest';
+import { streamItems, encodeResumeCursor } from '../itemStream.js';
+
+const DAY = 86_400_000;
+
+function item(id: string, ageDays: number, satisfied = 'yes') {
+  return {
+    id,
+    createdAt: new Date(Date.now() - ageDays * DAY).toISOString(),
+    evaluations: [{ criterion: 'c', satisfied }],
+    properties: { content: 'x'.repeat(1000) },
+  };
+}
+
+// listAll mock that records how many items were pulled
+function mockExa(items: Record<string, unknown>[]) {
+  const state = { pulled: 0 };
+  const exa = {
+    websets: {
+      items: {
+        async *listAll() {
+          for (const i of items) {
+            state.pulled++;
+            yield i;
+          }
+        },
+      },
+    },
+  } as any;
+  return { exa, state };
+}
+
+describe('streamItems', () => {
+  it('filters and maps each item, keeping only the projection', async () => {
+    const { exa } = mockExa([item('a', 1), item('b', 2, 'no'), item('c', 3)]);
+    const result = await streamItems(exa, 'ws', {
+      filter: i => (i.evaluations as any[])[0].satisfied === 'yes',
+      map: i => i.id as string,
+    });
+    expect(result.data).toEqual(['a', 'c']);
+    expect(result.total).toBe(3);
+    expect(result.excluded).toBe(1);
+    expect(result.truncated).toBe(false);
+  });
+
+  it('counts a null projection as excluded', async () => {
+    const { exa } = mockExa([item('a', 1), item('b', 2)]);
+    const result = await streamItems(exa, 'ws', { map: i => (i.id === 'a' ? null : i.id) });
+    expect(result.data).toEqual(['b']);
+    expect(result.excluded).toBe(1);
+  });
+
+  it('stops reading at maxItems', async () => {
+    const { exa, state } = mockExa([item('a', 1), item('b', 2), item('c', 3)]);
+    const result = await streamItems(exa, 'ws', { maxItems: 2 });
+    expect(result.data).toHaveLength(2);
+    expect(result.truncated).toBe(true);
+    expect(state.pulled).toBe(2);
+  });
+
+  it('stops early past withinDays when items arrive newest first', async () => {
+    const { exa, state } = mockExa([item('a', 1), item('b', 2), item('c', 10), item('d', 11), item('e', 12)]);
+    const result = await streamItems(exa, 'ws', { withinDays: 5, map: i => i.id });
+    expect(result.data).toEqual(['a', 'b']);
+    expect(state.pulled).toBe(3);
+  });
+
+  it('filters but reads everything when items arrive oldest first', async () => {
+    const { exa, state } = mockExa([item('e', 12), item('c', 10), item('b', 2), item('a', 1)]);
+    const result = await streamItems(exa, 'ws', { withinDays: 5, map: i => i.id });
+    expect(result.data).toEqual(['b', 'a']);
+    expect(state.pulled).toBe(4);
+  });
+
+  it('resumes from a cursor with only newer items', async () => {
+    const older = [item('c', 3), item('d', 4)];
+    const first = await streamItems(mockExa(older).exa, 'ws', { map: i => i.id });
+    expect(first.data).toEqual(['c', 'd']);
+
+    const { exa, state } = mockExa([item('a', 1), item('b', 2), ...older]);
+    const second = await streamItems(exa, 'ws', { resumeCursor: first.resumeCursor!, map: i => i.id });
+    expect(second.data).toEqual(['a', 'b']);
+    expect(second.total).toBe(2);
+    expect(state.pulled).toBe(4); // stops at the first item past the cursor
+  });
+
+  it('does not repeat items that share the cursor timestamp', async () => {
+    const createdAt = new Date(Date.now() - DAY).toISOString();
+    const cursor = encodeResumeCursor({ t: new Date(createdAt).getTime(), ids: ['a'] });
+    const { exa } = mockExa([
+      { id: 'b', createdAt },
+      { id: 'a', createdAt },
+    ]);
+    const result = await streamItems(exa, 'ws', { resumeCursor: cursor, map: i => i.id });
+    expect(result.data).toEqual(['b']);
+  });
+
+  it('does not take equal timestamps as proof of newest-first order', async () => {
+    const day1 = new Date(Date.now() - 3 * DAY).toISOString();
+    const cursor = encodeResumeCursor({ t: new Date(day1).getTime() + 1, ids: [] });
+    const { exa } = mockExa([
+      { id: 'a', createdAt: day1 },
+      { id: 'b', createdAt: day1 },
+      item('c', 2),
+      item('d', 1),
+    ]);
+    const result = await streamItems(exa, 'ws', { resumeCursor: cursor, map: i => i.id });
+    expect(result.data).toEqual(['c', 'd']);
+  });
+
+  it('returns no cursor for a truncated read, so unread items are not skipped', async () => {
+    const items = [item('e', 1), item('d', 2), item('c', 3), item('b', 4), item('a', 5)];
+    const partial = await streamItems(mockExa(items).exa, 'ws', { maxItems: 2, map: i => i.id });
+    expect(partial.data).toEqual(['e', 'd']);
+    expect(partial.truncated).toBe(true);
+    expect(partial.resumeCursor).toBeNull();
+  });
+
+  it('returns no cursor when stopped early', async () => {
+    const { exa } = mockExa([item('a', 1), item('b', 2), item('c', 3)]);
+    const result = await streamItems(exa, 'ws', { shouldStop: () => true });
+    expect(result.data).toHaveLength(1);
+    expect(result.resumeCursor).toBeNull();
+  });
+
+  it('rejects a malformed cursor', async () => {
+    const { exa } = mockExa([]);
+    await expect(streamItems(exa, 'ws', { resumeCursor: 'nope' })).rejects.toThrow('Invalid resumeCursor');
+  });
+
+  it('returns a null cursor when items have no createdAt', async () => {
+    const { exa } = mockExa([{ id: 'a' }]);
+    const result = await streamItems(exa, 'ws');
+    expect(result.resumeCursor).toBeNull();
+    expect(result.data).toEqual([{ id: 'a' }]);
+  });
+});
@@ -0,0 +1,118 @@
+import { describe, it, expect } from 'vitest';
+import { MetricsRegistry, upstreamErrors, upstreamRequests, withUpstreamMetrics } from '../metrics.js';
+
+function sampleValue(text: string, series: string): number | undefined {
+  const line = text.split('\n').find(l => l.startsWith(`${series} `));
+  return line === undefined ? undefined : Number(line.slice(series.length + 1));
+}
+
+describe('MetricsRegistry', () => {
+  it('renders counters by label', () => {
+    const registry = new MetricsRegistry();
+    const counter = registry.counter('test_calls_total', 'Calls', ['api']);
+    counter.inc('websets');
+    counter.labels('websets').inc(2);
+    counter.inc('search');
+
+    const text = registry.render();
+    expect(text).toContain('# TYPE test_calls_total counter');
+    expect(sampleValue(text, 'test_calls_total{api="websets"}')).toBe(3);
+    expect(sampleValue(text, 'test_calls_total{api="search"}')).toBe(1);
+  });
+
+  it('renders cumulative histogram buckets with sum and count', () => {
+    const registry = new MetricsRegistry();
+    const histogram = registry.histogram('test_seconds', 'Latency', ['op'], [0.1, 1]);
+    histogram.observe(0.05, 'get');
+    histogram.observe(0.5, 'get');
+    histogram.observe(5, 'get');
+
+    const text = registry.render();
+    expect(sampleValue(text, 'test_seconds_bucket{op="get",le="0.1"}')).toBe(1);
+    expect(sampleValue(text, 'test_seconds_bucket{op="get",le="1"}')).toBe(2);
+    expect(sampleValue(text, 'test_seconds_bucket{op="get",le="+Inf"}')).toBe(3);
+    expect(sampleValue(text, 'test_seconds_sum{op="get"}')).toBeCloseTo(5.55);
+    expect(sampleValue(text, 'test_seconds_count{op="get"}')).toBe(3);
+  });
+
+  it('reads collected gauges at render time and escapes label values', () => {
+    const registry = new MetricsRegistry();
+    let sessions = 1;
+    registry.collect('test_sessions', 'Sessions', 'gauge', () => sessions);
+    registry.collect('test_tasks', 'Tasks', 'gauge', () => [[['say "hi"'], 2]], ['status']);
+    sessions = 4;
+
+    const text = registry.render();
+    expect(sampleValue(text, 'test_sessions')).toBe(4);
+    expect(sampleValue(text, 'test_tasks{status="say \\"hi\\""}')).toBe(2);
+  });
+
+  it('skips a collector that throws', () => {
+    const registry = new MetricsRegistry();
+    registry.collect('test_broken', 'Broken', 'gauge', () => { throw new Error('boom'); });
+    registry.collect('test_ok', 'Ok', 'gauge', () => 1);
+    const text = registry.render();
+    expect(text).not.toContain('test_broken');
+    expect(sampleValue(text, 'test_ok')).toBe(1);
+  });
+
+  it('returns the existing metric when a name is registered twice', () => {
+    const registry = new MetricsRegistry();
+    expect(registry.counter('test_total', 'x')).toBe(registry.counter('test_total', 'x'));
+  });
+});
+
+describe('withUpstreamMetrics', () => {
+  const count = (api: 'websets' | 'research' | 'search') => ({
+    calls: upstreamRequests.labels(api).value,
+    errors: upstreamErrors.labels(api).value,
+  });
+
+  it('counts calls and failures by API', async () => {
+    const exa = withUpstreamMetrics({
+      search: async () => ({ results: [] }),
+      websets: {
+        get: async () => ({ id: 'ws_1' }),
+        items: { list: async () => { throw new Error('404'); } },
+      },
+      research: { create: async () => ({ researchId: 'r_1' }) },
+    } as any);
+    const before = { search: count('search'), websets: count('websets'), research: count('research') };
+
+    await exa.search('q');
+    await exa.websets.get('ws_1');
+    await expect(exa.websets.items.list('ws_1')).rejects.toThrow('404');
+    await exa.research.create({ instructions: 'x' } as any);
+
+    expect(count('search').calls - before.search.calls).toBe(1);
+    expect(count('websets').calls - before.websets.calls).toBe(2);
+    expect(count('websets').errors - before.websets.errors).toBe(1);
+    expect(count('research').calls - before.research.calls).toBe(1);
+  });
+
+  it('counts each page fetched by listAll', async () => {
+    const items = {
+      async list(_id: string, opts?: { cursor?: string }) {
+        return opts?.cursor
+          ? { data: [{ id: 'b' }], hasMore: false, nextCursor: null }
+          : { data: [{ id: 'a' }], hasMore: true, nextCursor: 'c1' };
+      },
+      async *listAll(this: any, id: string) {
+        let cursor: string | undefined;
+        do {
+          const page = await this.list(id, { cursor });
+          yield* page.data;
+          cursor = page.hasMore ? page.nextCursor : undefined;
+        } while (cursor);
+      },
+    };
+    const exa = withUpstreamMetrics({ websets: { items } } as any);
+    const before = count('websets').calls;
+
+    const seen: string[] = [];
+    for await (const item of (exa.websets.items as any).listAll('ws_1')) seen.push(item.id);
+
+    expect(seen).toEqual(['a', 'b']);
+    expect(count('websets').calls - before).toBe(2);
+  });
+});
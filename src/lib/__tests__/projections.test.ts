@@ -1,6 +1,7 @@
 import { describe, it, expect } from 'vitest';
 import {
   projectItem,
+  compactItem,
   filterAndProjectItems,
   projectWebset,
   projectSearch,
@@ -198,6 +199,36 @@ describe('projectItem', () => {
   });
 });
 
+// --- compactItem tests ---
+
+describe('compactItem', () => {
+  it('drops content, reasoning and references but keeps the raw shape', () => {
+    const item = compactItem(makeItem());
+    const props = item.properties as Record<string, unknown>;
+    expect(props).not.toHaveProperty('content');
+    expect(props.company).toEqual({ name: 'Acme Corp', domain: 'acme.com', industry: 'Manufacturing' });
+    expect(item.evaluations).toEqual([
+      { criterion: 'Is a technology company', satisfied: 'yes' },
+      { criterion: 'Has over 100 employees', satisfied: 'no' },
+    ]);
+    const enrichment = (item.enrichments as Record<string, unknown>[])[0];
+    expect(enrichment.result).toEqual(['50000000']);
+    expect(enrichment).not.toHaveProperty('reasoning');
+    expect(enrichment).not.toHaveProperty('references');
+  });
+
+  it('projects the same as the raw item', () => {
+    const raw = makeItem();
+    expect(projectItem(compactItem(raw))).toEqual(projectItem(raw));
+  });
+
+  it('does not mutate the input', () => {
+    const raw = makeItem();
+    compactItem(raw);
+    expect((raw.properties as Record<string, unknown>).content).toBeDefined();
+  });
+});
+
 // --- filterAndProjectItems tests ---
 
 describe('filterAndProjectItems', () => {
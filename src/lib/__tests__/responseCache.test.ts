@@ -0,0 +1,238 @@
+import { describe, it, expect, vi } from 'vitest';
+import fs from 'node:fs';
+import os from 'node:os';
+import path from 'node:path';
+import type { Exa } from 'exa-js';
+import { ResponseCache, withResponseCache, cacheKey } from '../responseCache.js';
+
+function contentsFor(urls: string[]) {
+  return { requestId: 'req', results: urls.map(url => ({ url, text: `text of ${url}` })) };
+}
+
+describe('cacheKey', () => {
+  it('ignores argument key order and undefined fields', () => {
+    expect(cacheKey('search', { query: 'q', opts: { a: 1, b: 2 } }))
+      .toBe(cacheKey('search', { opts: { b: 2, a: 1, c: undefined }, query: 'q' }));
+  });
+
+  it('separates operations', () => {
+    expect(cacheKey('search', { query: 'q' })).not.toBe(cacheKey('answer', { query: 'q' }));
+  });
+});
+
+describe('ResponseCache', () => {
+  it('serves repeat requests from cache and counts hits', async () => {
+    const cache = new ResponseCache();
+    const fetch = vi.fn(async () => ({ results: [1, 2] }));
+
+    expect(await cache.getOrFetch('search', { query: 'q' }, fetch)).toEqual({ results: [1, 2] });
+    expect(await cache.getOrFetch('search', { query: 'q' }, fetch)).toEqual({ results: [1, 2] });
+    expect(fetch).toHaveBeenCalledTimes(1);
+    expect(cache.stats().operations.search).toEqual({ hits: 1, misses: 1, coalesced: 0 });
+  });
+
+  it('returns independent copies', async () => {
+    const cache = new ResponseCache();
+    const first = await cache.getOrFetch('search', {}, async () => ({ results: [1] }));
+    first.results.push(2);
+    expect(await cache.getOrFetch('search', {}, async () => ({ results: [] }))).toEqual({ results: [1] });
+  });
+
+  it('coalesces identical requests in flight', async () => {
+    const cache = new ResponseCache();
+    let resolve!: (v: unknown) => void;
+    const fetch = vi.fn(() => new Promise(r => { resolve = r; }));
+
+    const a = cache.getOrFetch('answer', { query: 'q' }, fetch);
+    const b = cache.getOrFetch('answer', { query: 'q' }, fetch);
+    resolve({ answer: 42 });
+    expect(await a).toEqual({ answer: 42 });
+    expect(await b).toEqual({ answer: 42 });
+    expect(fetch).toHaveBeenCalledTimes(1);
+    expect(cache.stats().operations.answer.coalesced).toBe(1);
+  });
+
+  it('does not cache failures', async () => {
+    const cache = new ResponseCache();
+    await expect(cache.getOrFetch('search', {}, async () => { throw new Error('boom'); })).rejects.toThrow('boom');
+    expect(await cache.getOrFetch('search', {}, async () => 'ok')).toBe('ok');
+  });
+
+  it('expires entries after the per-operation TTL', async () => {
+    const cache = new ResponseCache({ ttlMs: { search: 20 } });
+    const fetch = vi.fn(async () => 'v');
+    await cache.getOrFetch('search', {}, fetch);
+    await cache.getOrFetch('answer', {}, fetch);
+    await new Promise(r => setTimeout(r, 30));
+    await cache.getOrFetch('search', {}, fetch);
+    await cache.getOrFetch('answer', {}, fetch);
+    expect(fetch).toHaveBeenCalledTimes(3);
+  });
+
+  it('evicts least recently used entries past the byte budget', async () => {
+    const cache = new ResponseCache({ maxBytes: 250 });
+    const big = 'x'.repeat(100);
+    await cache.getOrFetch('search', { q: 'a' }, async () => big);
+    await cache.getOrFetch('search', { q: 'b' }, async () => big);
+    await cache.getOrFetch('search', { q: 'a' }, async () => big); // touch a
+    await cache.getOrFetch('search', { q: 'c' }, async () => big); // evicts b
+
+    const fetch = vi.fn(async () => big);
+    await cache.getOrFetch('search', { q: 'a' }, fetch);
+    expect(fetch).not.toHaveBeenCalled();
+    await cache.getOrFetch('search', { q: 'b' }, fetch);
+    expect(fetch).toHaveBeenCalledTimes(1);
+    expect(cache.stats().bytes).toBeLessThanOrEqual(250);
+    expect(cache.stats().evictions).toBeGreaterThan(0);
+  });
+
+  it('spills evicted entries to disk and reads them back', async () => {
+    const dir = fs.mkdtempSync(path.join(os.tmpdir(), 'cache-'));
+    try {
+      const cache = new ResponseCache({ maxBytes: 150, spillDir: dir });
+      const big = 'y'.repeat(100);
+      await cache.getOrFetch('search', { q: 'a' }, async () => big);
+      await cache.getOrFetch('search', { q: 'b' }, async () => big); // a spills
+      expect(cache.stats().diskEntries).toBe(1);
+
+      const fetch = vi.fn(async () => 'fresh');
+      expect(await cache.getOrFetch('search', { q: 'a' }, fetch)).toBe(big);
+      expect(fetch).not.toHaveBeenCalled();
+      expect(cache.stats().diskHits).toBe(1);
+    } finally {
+      fs.rmSync(dir, { recursive: true, force: true });
+    }
+  });
+
+  describe('getContents', () => {
+    it('only fetches URLs that miss, preserving request order', async () => {
+      const cache = new ResponseCache();
+      const fetch = vi.fn(async (urls: string[]) => contentsFor(urls));
+
+      await cache.getContents(['https://a.com', 'https://b.com'], { text: true }, fetch);
+      const res = await cache.getContents(['https://c.com', 'https://a.com'], { text: true }, fetch);
+
+      expect(fetch.mock.calls[1][0]).toEqual(['https://c.com']);
+      expect(res.results.map((r: any) => r.url)).toEqual(['https://c.com', 'https://a.com']);
+      expect(cache.stats().operations.getContents).toEqual({ hits: 1, misses: 3, coalesced: 0 });
+    });
+
+    it('keys entries on the content options', async () => {
+      const cache = new ResponseCache();
+      const fetch = vi.fn(async (urls: string[]) => contentsFor(urls));
+      await cache.getContents(['https://a.com'], { text: true }, fetch);
+      await cache.getContents(['https://a.com'], { summary: true }, fetch);
+      expect(fetch).toHaveBeenCalledTimes(2);
+    });
+
+    it('shares a URL already being fetched by another batch', async () => {
+      const cache = new ResponseCache();
+      let release!: () => void;
+      const gate = new Promise<void>(r => { release = r; });
+      const fetch = vi.fn(async (urls: string[]) => {
+        await gate;
+        return contentsFor(urls);
+      });
+
+      const first = cache.getContents(['https://a.com', 'https://b.com'], undefined, fetch);
+      const second = cache.getContents(['https://b.com', 'https://c.com'], undefined, fetch);
+      release();
+      await first;
+      const res = await second;
+
+      expect(fetch).toHaveBeenCalledTimes(2);
+      expect(fetch.mock.calls[1][0]).toEqual(['https://c.com']);
+      expect(res.results.map((r: any) => r.url)).toEqual(['https://b.com', 'https://c.com']);
+    });
+
+    it('matches normalized URLs and returns unmatched results uncached', async () => {
+      const cache = new ResponseCache();
+      const fetch = vi.fn(async () => ({
+        results: [
+          { url: 'https://A.com/', text: 'a' },
+          { url: 'https://redirected.example/b', text: 'b' },
+        ],
+      }));
+
+      const res = await cache.getContents(['a.com', 'https://b.com'], undefined, fetch);
+      expect(res.results.map((r: any) => r.text)).toEqual(['a', 'b']);
+
+      // a.com was cached under the requested URL; b.com was not
+      await cache.getContents(['a.com', 'https://b.com'], undefined, fetch);
+      expect((fetch.mock.calls[1] as any[])[0]).toEqual(['https://b.com']);
+    });
+
+    it('keeps per-URL statuses for URLs that missed, including shared fetches', async () => {
+      const cache = new ResponseCache();
+      let release!: () => void;
+      const gate = new Promise<void>(r => { release = r; });
+      const fetch = vi.fn(async (urls: string[]) => {
+        await gate;
+        return {
+          results: urls.filter(u => u !== 'https://bad.com').map(url => ({ url })),
+          statuses: urls.map(id => ({ id, status: id === 'https://bad.com' ? 'error' : 'success' })),
+        };
+      });
+
+      const first = cache.getContents(['https://a.com', 'https://bad.com'], undefined, fetch);
+      const second = cache.getContents(['https://bad.com'], undefined, fetch);
+      release();
+      const res = await first;
+      const shared = await second;
+
+      expect(res.results.map((r: any) => r.url)).toEqual(['https://a.com']);
+      expect(res.statuses).toEqual([
+        { id: 'https://a.com', status: 'success' },
+        { id: 'https://bad.com', status: 'error' },
+      ]);
+      expect(shared.results).toEqual([]);
+      expect(shared.statuses).toEqual([{ id: 'https://bad.com', status: 'error' }]);
+    });
+
+    it('propagates a batch failure to callers sharing it', async () => {
+      const cache = new ResponseCache();
+      let fail!: (e: Error) => void;
+      const fetch = vi.fn(() => new Promise<any>((_, reject) => { fail = reject; }));
+
+      const first = cache.getContents(['https://a.com'], undefined, fetch);
+      const second = cache.getContents(['https://a.com'], undefined, fetch);
+      fail(new Error('upstream down'));
+      await expect(first).rejects.toThrow('upstream down');
+      await expect(second).rejects.toThrow('upstream down');
+    });
+  });
+});
+
+describe('withResponseCache', () => {
+  function mockExa() {
+    return {
+      search: vi.fn(async () => ({ results: [] })),
+      getContents: vi.fn(async (urls: string[]) => contentsFor(urls)),
+      websets: { get: vi.fn() },
+    };
+  }
+
+  it('caches search calls and passes other properties through', async () => {
+    const raw = mockExa();
+    const exa = withResponseCache(raw as unknown as Exa, new ResponseCache());
+    await exa.search('q', { numResults: 5 } as any);
+    await exa.search('q', { numResults: 5 } as any);
+    expect(raw.search).toHaveBeenCalledTimes(1);
+    expect(exa.websets).toBe(raw.websets);
+  });
+
+  it('accepts a single URL for getContents', async () => {
+    const raw = mockExa();
+    const exa = withResponseCache(raw as unknown as Exa, new ResponseCache());
+    const res = await exa.getContents('https://a.com');
+    expect((res as any).results[0].url).toBe('https://a.com');
+  });
+
+  it('bypasses the cache when fresh content is requested', async () => {
+    const raw = mockExa();
+    const exa = withResponseCache(raw as unknown as Exa, new ResponseCache());
+    await exa.getContents(['https://a.com'], { livecrawl: 'always' } as any);
+    await exa.getContents(['https://a.com'], { livecrawl: 'always' } as any);
+    expect(raw.getContents).toHaveBeenCalledTimes(2);
+  });
+});
@@ -0,0 +1,176 @@
+import { describe, it, expect, vi } from 'vitest';
+import type { Exa } from 'exa-js';
+import { TaskScheduler, withApiPools, type ApiPool } from '../scheduler.js';
+import { Semaphore } from '../semaphore.js';
+
+// A job that stays running until its release() is called
+function gate() {
+  let release!: () => void;
+  const done = new Promise<void>(r => { release = r; });
+  return { run: () => done, release };
+}
+
+const tick = () => new Promise(r => setTimeout(r, 0));
+
+describe('TaskScheduler', () => {
+  it('queues tasks beyond the worker limit instead of rejecting them', async () => {
+    const scheduler = new TaskScheduler(2);
+    const gates = [gate(), gate(), gate()];
+    expect(scheduler.submit('a', gates[0].run)).toBe(true);
+    expect(scheduler.submit('b', gates[1].run)).toBe(true);
+    expect(scheduler.submit('c', gates[2].run)).toBe(false);
+    expect(scheduler.stats()).toMatchObject({ running: 2, queued: 1 });
+
+    gates[0].release();
+    await tick();
+    expect(scheduler.stats()).toMatchObject({ running: 2, queued: 0 });
+  });
+
+  it('rejects only when the queue itself is full', () => {
+    const scheduler = new TaskScheduler(1, 1);
+    scheduler.submit('a', gate().run);
+    scheduler.submit('b', gate().run);
+    expect(scheduler.canAdmit()).toBe(false);
+    expect(() => scheduler.submit('c', gate().run)).toThrow(/queue is full/);
+  });
+
+  it('starts higher-priority tasks first', async () => {
+    const scheduler = new TaskScheduler(1);
+    const blocker = gate();
+    const order: string[] = [];
+    scheduler.submit('blocker', blocker.run);
+    scheduler.submit('low', async () => { order.push('low'); }, { priority: 'low' });
+    scheduler.submit('normal', async () => { order.push('normal'); });
+    scheduler.submit('high', async () => { order.push('high'); }, { priority: 'high' });
+
+    blocker.release();
+    await tick();
+    expect(order).toEqual(['high', 'normal', 'low']);
+  });
+
+  it('shares workers fairly across sessions', async () => {
+    const scheduler = new TaskScheduler(2);
+    const started: string[] = [];
+    const gates = new Map<string, ReturnType<typeof gate>>();
+    const submit = (id: string, sessionId: string) => {
+      const g = gate();
+      gates.set(id, g);
+      scheduler.submit(id, () => { started.push(id); return g.run(); }, { sessionId });
+    };
+
+    // Session A floods the queue before B submits anything
+    submit('a1', 'A');
+    submit('a2', 'A');
+    submit('a3', 'A');
+    submit('a4', 'A');
+    submit('b1', 'B');
+
+    gates.get('a1')!.release();
+    await tick();
+    // A still has a2 running, B has nothing, so B goes next
+    expect(started).toEqual(['a1', 'a2', 'b1']);
+  });
+
+  it('drops a removed task before it starts', async () => {
+    const scheduler = new TaskScheduler(1);
+    const blocker = gate();
+    const run = vi.fn(async () => {});
+    scheduler.submit('blocker', blocker.run);
+    scheduler.submit('queued', run);
+    expect(scheduler.remove('queued')).toBe(true);
+
+    blocker.release();
+    await tick();
+    expect(run).not.toHaveBeenCalled();
+  });
+});
+
+describe('withApiPools', () => {
+  function pools(limit: number): Record<ApiPool, Semaphore> {
+    return { websets: new Semaphore(limit), research: new Semaphore(limit), search: new Semaphore(limit) };
+  }
+
+  it('bounds concurrent calls per API', async () => {
+    let active = 0;
+    let peak = 0;
+    const slow = async () => {
+      active++;
+      peak = Math.max(peak, active);
+      await new Promise(r => setTimeout(r, 5));
+      active--;
+      return {};
+    };
+    const exa = withApiPools({ search: vi.fn(slow) } as unknown as Exa, pools(2));
+
+    await Promise.all(Array.from({ length: 6 }, () => exa.search('q')));
+    expect(peak).toBe(2);
+  });
+
+  it('routes nested websets calls through the websets pool with the original receiver', async () => {
+    const items = {
+      prefix: 'item',
+      get(this: { prefix: string }, id: string) { return Promise.resolve(`${this.prefix}:${id}`); },
+    };
+    const websetPool = new Semaphore(1);
+    const exa = withApiPools({ websets: { items } } as unknown as Exa, { ...pools(1), websets: websetPool });
+
+    await websetPool.acquire();
+    let resolved = false;
+    const pending = (exa.websets.items as any).get('x').then((v: string) => { resolved = true; return v; });
+    await tick();
+    expect(resolved).toBe(false);
+    websetPool.release();
+    expect(await pending).toBe('item:x');
+  });
+
+  it('pools each page of an async generator separately', async () => {
+    const items = {
+      async list(this: unknown, _ws: string, opts?: { cursor?: number }) {
+        const page = opts?.cursor ?? 0;
+        return { data: [page], nextCursor: page < 2 ? page + 1 : null };
+      },
+      async *listAll(this: any, ws: string) {
+        let cursor: number | undefined;
+        do {
+          const res = await this.list(ws, { cursor });
+          yield* res.data;
+          cursor = res.nextCursor ?? undefined;
+        } while (cursor !== undefined);
+      },
+      get: (id: string) => Promise.resolve(id),
+    };
+    const websetPool = new Semaphore(1);
+    const exa = withApiPools({ websets: { items } } as unknown as Exa, { ...pools(1), websets: websetPool });
+
+    const seen: number[] = [];
+    for await (const n of (exa.websets.items as any).listAll('ws')) {
+      seen.push(n);
+      // No permit is held between pages, so other websets calls still run
+      expect(await (exa.websets.items as any).get(`during-${n}`)).toBe(`during-${n}`);
+    }
+    expect(seen).toEqual([0, 1, 2]);
+
+    // A page fetch waits for a permit like any other websets call
+    await websetPool.acquire();
+    const iterator = (exa.websets.items as any).listAll('ws')[Symbol.asyncIterator]();
+    let fetched = false;
+    const first = iterator.next().then((r: unknown) => { fetched = true; return r; });
+    await tick();
+    expect(fetched).toBe(false);
+    websetPool.release();
+    expect((await first).value).toBe(0);
+  });
+
+  it('leaves async generators unpooled', async () => {
+    async function* listAll() { yield 1; yield 2; }
+    const exa = withApiPools({ websets: { items: { listAll } } } as unknown as Exa, pools(0));
+    const seen: number[] = [];
+    for await (const n of (exa.websets.items as any).listAll()) seen.push(n);
+    expect(seen).toEqual([1, 2]);
+  });
+
+  it('does not wrap a client twice', () => {
+    const exa = withApiPools({ search: vi.fn() } as unknown as Exa, pools(1));
+    expect(withApiPools(exa)).toBe(exa);
+  });
+});
@@ -49,4 +49,13 @@ describe('Semaphore', () => {
     await Promise.all([task(), task(), task(), task(), task()]);
     expect(maxConcurrent).toBe(3);
   });
+
+  it('tryAcquire() takes a free permit without queueing', () => {
+    const sem = new Semaphore(1);
+    expect(sem.tryAcquire()).toBe(true);
+    expect(sem.tryAcquire()).toBe(false);
+    expect(sem.available).toBe(0);
+    sem.release();
+    expect(sem.available).toBe(1);
+  });
 });
@@ -0,0 +1,135 @@
+import { describe, it, expect, vi } from 'vitest';
+import { StatusPoller, getWebsetPoller } from '../statusPoller.js';
+
+function websetPoller(fetch: (id: string) => Promise<any>) {
+  return new StatusPoller<any>({
+    fetch,
+    classify: ws => (ws.status === 'idle' ? 'done' : ws.status === 'paused' ? 'failed' : 'pending'),
+    failureMessage: () => 'paused',
+    progressKey: ws => String(ws.found ?? ''),
+    minIntervalMs: 5,
+    maxIntervalMs: 20,
+  });
+}
+
+describe('StatusPoller', () => {
+  it('resolves immediately when the resource is already done', async () => {
+    const fetch = vi.fn().mockResolvedValue({ status: 'idle' });
+    const poller = websetPoller(fetch);
+    const result = await poller.waitFor('ws1', { timeoutMs: 1000 });
+    expect(result).toEqual({ resource: { status: 'idle' }, timedOut: false, stopped: false });
+    expect(fetch).toHaveBeenCalledTimes(1);
+  });
+
+  it('coalesces concurrent waiters on the same id into one fetch loop', async () => {
+    let calls = 0;
+    const fetch = vi.fn().mockImplementation(async () => {
+      calls++;
+      return { status: calls >= 3 ? 'idle' : 'running' };
+    });
+    const poller = websetPoller(fetch);
+
+    const results = await Promise.all([
+      poller.waitFor('ws1', { timeoutMs: 1000 }),
+      poller.waitFor('ws1', { timeoutMs: 1000 }),
+      poller.waitFor('ws1', { timeoutMs: 1000 }),
+    ]);
+
+    expect(results.every(r => r.resource.status === 'idle')).toBe(true);
+    expect(fetch).toHaveBeenCalledTimes(3);
+    expect(poller.stats()).toMatchObject({ watched: 0, waiters: 0, fetches: 3, coalesced: 2 });
+  });
+
+  it('polls different ids independently', async () => {
+    const fetch = vi.fn().mockImplementation(async (id: string) => ({ id, status: 'idle' }));
+    const poller = websetPoller(fetch);
+    const [a, b] = await Promise.all([
+      poller.waitFor('a', { timeoutMs: 1000 }),
+      poller.waitFor('b', { timeoutMs: 1000 }),
+    ]);
+    expect(a.resource.id).toBe('a');
+    expect(b.resource.id).toBe('b');
+  });
+
+  it('times out a waiter at its own deadline', async () => {
+    const fetch = vi.fn().mockResolvedValue({ status: 'running' });
+    const poller = websetPoller(fetch);
+    const result = await poller.waitFor('ws1', { timeoutMs: 0 });
+    expect(result.timedOut).toBe(true);
+    expect(poller.stats().watched).toBe(0);
+  });
+
+  it('rejects all waiters when the resource fails', async () => {
+    const fetch = vi.fn().mockResolvedValue({ status: 'paused' });
+    const poller = websetPoller(fetch);
+    await expect(poller.waitFor('ws1', { timeoutMs: 1000 })).rejects.toThrow('paused');
+  });
+
+  it('rejects waiters when the fetch throws', async () => {
+    const fetch = vi.fn().mockRejectedValue(new Error('network down'));
+    const poller = websetPoller(fetch);
+    await expect(poller.waitFor('ws1', { timeoutMs: 1000 })).rejects.toThrow('network down');
+  });
+
+  it('stops a single waiter when shouldStop returns true', async () => {
+    const fetch = vi.fn().mockResolvedValue({ status: 'running' });
+    const poller = websetPoller(fetch);
+    const onUpdate = vi.fn();
+    const result = await poller.waitFor('ws1', { timeoutMs: 1000, onUpdate, shouldStop: () => true });
+    expect(result.stopped).toBe(true);
+    expect(onUpdate).toHaveBeenCalledWith({ status: 'running' });
+  });
+
+  it('wakes waiters when a finished status is observed elsewhere', async () => {
+    const fetch = vi.fn().mockResolvedValue({ status: 'running' });
+    const poller = new StatusPoller<any>({
+      fetch,
+      classify: ws => (ws.status === 'idle' ? 'done' : 'pending'),
+      failureMessage: () => 'failed',
+      minIntervalMs: 60_000,
+    });
+    const wait = poller.waitFor('ws1', { timeoutMs: 120_000 });
+    await new Promise(r => setTimeout(r, 5));
+    poller.observe('ws1', { status: 'idle' });
+    const result = await wait;
+    expect(result.resource.status).toBe('idle');
+    expect(fetch).toHaveBeenCalledTimes(1);
+  });
+
+  it('backs off while progress stalls', async () => {
+    const times: number[] = [];
+    const fetch = vi.fn().mockImplementation(async () => {
+      times.push(Date.now());
+      return { status: times.length >= 5 ? 'idle' : 'running', found: 0 };
+    });
+    const poller = new StatusPoller<any>({
+      fetch,
+      classify: ws => (ws.status === 'idle' ? 'done' : 'pending'),
+      failureMessage: () => 'failed',
+      progressKey: ws => String(ws.found),
+      minIntervalMs: 10,
+      maxIntervalMs: 1000,
+      backoffFactor: 2,
+    });
+    await poller.waitFor('ws1', { timeoutMs: 5000 });
+    const gaps = times.slice(1).map((t, i) => t - times[i]);
+    // First gap resets to min (new progress key), later gaps grow
+    expect(gaps[gaps.length - 1]).toBeGreaterThan(gaps[0]);
+  });
+});
+
+describe('getWebsetPoller', () => {
+  it('returns one poller per Exa client', () => {
+    const exaA = { websets: { get: vi.fn() } } as any;
+    const exaB = { websets: { get: vi.fn() } } as any;
+    expect(getWebsetPoller(exaA)).toBe(getWebsetPoller(exaA));
+    expect(getWebsetPoller(exaA)).not.toBe(getWebsetPoller(exaB));
+  });
+
+  it('treats paused websets as failures', async () => {
+    const exa = { websets: { get: vi.fn().mockResolvedValue({ id: 'ws1', status: 'paused' }) } } as any;
+    await expect(getWebsetPoller(exa).waitFor('ws1', { timeoutMs: 1000 })).rejects.toThrow(
+      'paused unexpectedly',
+    );
+  });
+});
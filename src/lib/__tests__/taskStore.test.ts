@@ -121,23 +121,11 @@ describe('TaskStore', () => {
     expect(store.cleanup()).toBe(0);
   });
 
-  it('enforces max concurrent limit', () => {
+  it('does not cap active tasks (admission is up to the scheduler)', () => {
     store = new TaskStore();
-    for (let i = 0; i < 20; i++) {
+    for (let i = 0; i < 25; i++) {
       store.create('echo', { i });
     }
-    expect(() => store.create('echo', { i: 20 })).toThrow(/Max concurrent tasks/);
-  });
-
-  it('max concurrent considers only active tasks', () => {
-    store = new TaskStore();
-    for (let i = 0; i < 20; i++) {
-      store.create('echo', { i });
-    }
-    // Complete one, freeing a slot
-    const first = store.list()[0];
-    store.setResult(first.id, {});
-
-    expect(() => store.create('echo', { i: 20 })).not.toThrow();
+    expect(store.list('pending')).toHaveLength(25);
   });
 });
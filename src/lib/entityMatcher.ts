@@ -0,0 +1,236 @@
+// Entity resolution — indexed replacements for the pairwise fuzzy joins in
+// convergent.search and semantic.cron. Results are identical to a linear scan
+// that takes the first (oldest) entity whose URL matches or whose name has a
+// Dice coefficient above the threshold; only the candidate generation changes.
+
+// --- Normalization ---
+
+export function normalizeName(name: string): string {
+  return name.toLowerCase().trim();
+}
+
+export function normalizeUrl(url: string): string {
+  return url
+    .trim()
+    .toLowerCase()
+    .replace(/^[a-z][a-z0-9+.-]*:\/\//, '')
+    .replace(/^www\./, '')
+    .replace(/#.*$/, '')
+    .replace(/\/+(\?|$)/, '$1');
+}
+
+// --- Bigram signatures ---
+
+export interface NameSignature {
+  bigrams: Set<string>;
+}
+
+function bigramSet(s: string): Set<string> {
+  const set = new Set<string>();
+  for (let i = 0; i < s.length - 1; i++) {
+    set.add(s.slice(i, i + 2));
+  }
+  return set;
+}
+
+/** Signature for a normalized name; null when too short for bigrams. */
+export function nameSignature(normalized: string): NameSignature | null {
+  if (normalized.length < 2) return null;
+  return { bigrams: bigramSet(normalized) };
+}
+
+export function signatureDice(a: NameSignature, b: NameSignature): number {
+  const [small, large] = a.bigrams.size <= b.bigrams.size ? [a.bigrams, b.bigrams] : [b.bigrams, a.bigrams];
+  let intersection = 0;
+  for (const bg of small) {
+    if (large.has(bg)) intersection++;
+  }
+  return (2 * intersection) / (a.bigrams.size + b.bigrams.size);
+}
+
+export function diceCoefficient(a: string, b: string): number {
+  const na = normalizeName(a);
+  const nb = normalizeName(b);
+  if (na === nb) return 1;
+  const sa = nameSignature(na);
+  const sb = nameSignature(nb);
+  if (!sa || !sb) return 0;
+  return signatureDice(sa, sb);
+}
+
+/**
+ * How many of a name's bigrams must be probed so that any entity with
+ * Dice > threshold shares at least one of them (prefix filtering).
+ * A match needs overlap > t·|A|/(2−t); the epsilon keeps the bound conservative.
+ */
+function probeLength(size: number, threshold: number): number {
+  const minOverlap = Math.floor((threshold * size) / (2 - threshold) - 1e-9) + 1;
+  return Math.max(1, Math.min(size, size - minOverlap + 1));
+}
+
+// --- Entity index ---
+
+interface IndexedEntity<T> {
+  value: T;
+  signature: NameSignature | null;
+}
+
+/**
+ * Incremental entity index: URL hash lookup plus a bigram inverted index for
+ * fuzzy names. Lookups probe only the rarest bigrams a match must share. match() returns the earliest-added entity
+ * that a linear scan would have picked.
+ */
+export class EntityIndex<T> {
+  private entities: IndexedEntity<T>[] = [];
+  private byUrl = new Map<string, number>();
+  private byExactName = new Map<string, number>();
+  private postings = new Map<string, number[]>();
+  private firstNamed = -1;
+
+  constructor(private threshold = 0.85) {}
+
+  get size(): number {
+    return this.entities.length;
+  }
+
+  values(): T[] {
+    return this.entities.map(e => e.value);
+  }
+
+  match(name: string, url: string): T | undefined {
+    let best = Infinity;
+
+    if (url) {
+      const idx = this.byUrl.get(normalizeUrl(url));
+      if (idx !== undefined) best = idx;
+    }
+
+    if (name) {
+      best = Math.min(best, this.matchName(normalizeName(name), best));
+    }
+
+    return best === Infinity ? undefined : this.entities[best].value;
+  }
+
+  add(name: string, url: string, value: T): void {
+    const idx = this.entities.length;
+    const normalized = name ? normalizeName(name) : '';
+    const signature = name ? nameSignature(normalized) : null;
+    this.entities.push({ value, signature });
+
+    if (url) {
+      const key = normalizeUrl(url);
+      if (!this.byUrl.has(key)) this.byUrl.set(key, idx);
+    }
+    if (!name) return;
+
+    if (this.firstNamed < 0) this.firstNamed = idx;
+    if (!this.byExactName.has(normalized)) this.byExactName.set(normalized, idx);
+    if (signature) {
+      for (const token of signature.bigrams) {
+        let list = this.postings.get(token);
+        if (!list) {
+          list = [];
+          this.postings.set(token, list);
+        }
+        list.push(idx);
+      }
+    }
+  }
+
+  /** Earliest entity index below `limit` whose name matches, or Infinity. */
+  private matchName(normalized: string, limit: number): number {
+    const t = this.threshold;
+    if (t >= 1) return Infinity; // Dice never exceeds 1
+    if (t < 0) return this.firstNamed >= 0 && this.firstNamed < limit ? this.firstNamed : Infinity;
+
+    let best = limit;
+    const exact = this.byExactName.get(normalized);
+    if (exact !== undefined && exact < best) best = exact;
+
+    const signature = nameSignature(normalized);
+    if (!signature) return best;
+
+    // Dice > t is impossible unless the other set size is within these bounds
+    const size = signature.bigrams.size;
+    const minSize = (size * t) / (2 - t);
+    const maxSize = t > 0 ? (size * (2 - t)) / t : Infinity;
+
+    // Every match shares one of the rarest `probe` bigrams; a bigram nobody
+    // has yet is the rarest of all and costs nothing to probe.
+    const lists = [...signature.bigrams]
+      .map(token => this.postings.get(token) ?? [])
+      .sort((a, b) => a.length - b.length)
+      .slice(0, probeLength(size, t));
+
+    const seen = new Set<number>();
+    for (const list of lists) {
+      // Postings are in insertion order, so stop once past the current best
+      for (const idx of list) {
+        if (idx >= best) break;
+        if (seen.has(idx)) continue;
+        seen.add(idx);
+        const other = this.entities[idx].signature;
+        if (!other || other.bigrams.size < minSize || other.bigrams.size > maxSize) continue;
+        if (signatureDice(signature, other) > t) {
+          best = idx;
+          break;
+        }
+      }
+    }
+    return best;
+  }
+}
+
+// --- Temporal windows ---
+
+export interface LensTimestamp {
+  lensId: string;
+  time: number;
+}
+
+function sortedValid(stamps: LensTimestamp[]): LensTimestamp[] {
+  return stamps.filter(s => !Number.isNaN(s.time)).sort((a, b) => a.time - b.time);
+}
+
+/** True if two timestamps from different lenses fall within windowMs of each other. */
+export function hasCrossLensPairWithin(stamps: LensTimestamp[], windowMs: number): boolean {
+  const sorted = sortedValid(stamps);
+  // Most recent timestamp seen, plus the most recent one from any other lens
+  let last: LensTimestamp | undefined;
+  let lastOther: LensTimestamp | undefined;
+  for (const s of sorted) {
+    const prev = last && last.lensId !== s.lensId ? last : lastOther;
+    if (prev && s.time - prev.time <= windowMs) return true;
+    if (last && last.lensId !== s.lensId) lastOther = last;
+    last = s;
+  }
+  return false;
+}
+
+/**
+ * Pairs of lenses that have at least one timestamp each within windowMs.
+ * Returned as a lookup keyed by both orderings of "a\u0000b".
+ */
+export function crossLensPairsWithin(stamps: LensTimestamp[], windowMs: number): Set<string> {
+  const sorted = sortedValid(stamps);
+  const pairs = new Set<string>();
+  const inWindow = new Map<string, number>();
+  let start = 0;
+
+  for (const s of sorted) {
+    while (sorted[start].time < s.time - windowMs) {
+      const old = sorted[start++];
+      const n = inWindow.get(old.lensId)! - 1;
+      if (n === 0) inWindow.delete(old.lensId);
+      else inWindow.set(old.lensId, n);
+    }
+    for (const lensId of inWindow.keys()) {
+      if (lensId === s.lensId) continue;
+      pairs.add(`${lensId}\u0000${s.lensId}`);
+      pairs.add(`${s.lensId}\u0000${lensId}`);
+    }
+    inWindow.set(s.lensId, (inWindow.get(s.lensId) ?? 0) + 1);
+  }
+  return pairs;
+}
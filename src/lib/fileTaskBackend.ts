@@ -0,0 +1,85 @@
+import fs from 'node:fs';
+import path from 'node:path';
+import type { TaskBackend, TaskState } from './taskStore.js';
+
+type LogRecord =
+  | { op: 'put'; task: TaskState }
+  | { op: 'del'; id: string };
+
+const DEFAULT_COMPACT_AFTER = 1_000;
+
+/**
+ * Append-only JSONL task log. Each write appends one record per changed task;
+ * load() replays the log (ignoring a torn final line) and rewrites it compacted.
+ * The log is compacted again once it holds several times more records than live tasks.
+ */
+export class FileTaskBackend implements TaskBackend {
+  readonly durable = true;
+  private records = 0;
+  private fd: number | null = null;
+
+  constructor(
+    private filePath: string,
+    private compactAfter = DEFAULT_COMPACT_AFTER,
+  ) {}
+
+  load(): TaskState[] {
+    const tasks = new Map<string, TaskState>();
+    if (fs.existsSync(this.filePath)) {
+      const text = fs.readFileSync(this.filePath, 'utf8');
+      for (const line of text.split('\n')) {
+        if (!line) continue;
+        let record: LogRecord;
+        try {
+          record = JSON.parse(line) as LogRecord;
+        } catch {
+          continue; // torn write from a crash mid-append
+        }
+        if (record.op === 'put') tasks.set(record.task.id, record.task);
+        else if (record.op === 'del') tasks.delete(record.id);
+      }
+    }
+    const loaded = [...tasks.values()];
+    this.compact(loaded);
+    return loaded;
+  }
+
+  write(upserts: TaskState[], deletes: string[], snapshot: () => TaskState[]): void {
+    if (upserts.length === 0 && deletes.length === 0) return;
+    const lines: string[] = [];
+    for (const task of upserts) lines.push(JSON.stringify({ op: 'put', task }));
+    for (const id of deletes) lines.push(JSON.stringify({ op: 'del', id }));
+    fs.writeSync(this.open(), lines.join('\n') + '\n');
+    this.records += lines.length;
+
+    if (this.records >= this.compactAfter) {
+      const live = snapshot();
+      if (this.records > live.length * 4) this.compact(live);
+    }
+  }
+
+  close(): void {
+    if (this.fd !== null) {
+      fs.closeSync(this.fd);
+      this.fd = null;
+    }
+  }
+
+  private open(): number {
+    if (this.fd === null) {
+      fs.mkdirSync(path.dirname(this.filePath), { recursive: true });
+      this.fd = fs.openSync(this.filePath, 'a');
+    }
+    return this.fd;
+  }
+
+  private compact(tasks: TaskState[]): void {
+    this.close();
+    fs.mkdirSync(path.dirname(this.filePath), { recursive: true });
+    const tmp = `${this.filePath}.tmp`;
+    const body = tasks.map(task => JSON.stringify({ op: 'put', task })).join('\n');
+    fs.writeFileSync(tmp, body ? body + '\n' : '');
+    fs.renameSync(tmp, this.filePath);
+    this.records = tasks.length;
+  }
+}
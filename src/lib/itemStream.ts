@@ -0,0 +1,143 @@
+// Streaming item collection — filter and project webset items as they arrive
+// instead of buffering whole raw pages. Only what `map` returns is kept, so
+// memory scales with the projected output, not with raw item size.
+//
+// Resume cursors are a createdAt high-water mark (plus the IDs seen at that
+// instant), so a later call with the cursor returns only items created since.
+
+import type { Exa } from 'exa-js';
+
+const DAY_MS = 86_400_000;
+const DEFAULT_MAX_ITEMS = 1000;
+
+export interface ItemStreamOptions<T> {
+  /** Raw items to read before stopping. */
+  maxItems?: number;
+  sourceId?: string;
+  /** Items failing the filter are counted as excluded and never mapped. */
+  filter?: (item: Record<string, unknown>) => boolean;
+  /** Projection applied per item; return null to exclude it. Defaults to the raw item. */
+  map?: (item: Record<string, unknown>) => T | null;
+  /** Only items created within the last N days. */
+  withinDays?: number;
+  /** Cursor from a previous result: only items created after it. */
+  resumeCursor?: string;
+  shouldStop?: () => boolean;
+}
+
+export interface ItemStreamResult<T> {
+  data: T[];
+  /** Items read in range (after the cursor and date window). */
+  total: number;
+  excluded: number;
+  truncated: boolean;
+  /**
+   * Pass back as resumeCursor to fetch only newer items. Null if items carry no
+   * createdAt, or if the read was truncated or stopped before the end.
+   */
+  resumeCursor: string | null;
+}
+
+interface CursorState {
+  t: number;
+  ids: string[];
+}
+
+export function encodeResumeCursor(state: CursorState): string {
+  return Buffer.from(JSON.stringify(state)).toString('base64url');
+}
+
+export function decodeResumeCursor(cursor: string): CursorState {
+  try {
+    const state = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8')) as CursorState;
+    if (typeof state.t === 'number' && Array.isArray(state.ids)) return state;
+  } catch {
+    // fall through
+  }
+  throw new Error('Invalid resumeCursor');
+}
+
+function createdAtOf(item: Record<string, unknown>): number {
+  return typeof item.createdAt === 'string' ? new Date(item.createdAt).getTime() : NaN;
+}
+
+export async function streamItems<T = Record<string, unknown>>(
+  exa: Exa,
+  websetId: string,
+  options: ItemStreamOptions<T> = {},
+): Promise<ItemStreamResult<T>> {
+  const maxItems = options.maxItems ?? DEFAULT_MAX_ITEMS;
+  const after = options.resumeCursor ? decodeResumeCursor(options.resumeCursor) : null;
+  const seenAtCursor = new Set(after?.ids ?? []);
+  const notBefore = options.withinDays !== undefined ? Date.now() - options.withinDays * DAY_MS : -Infinity;
+  const lowerBound = Math.max(after?.t ?? -Infinity, notBefore);
+
+  const data: T[] = [];
+  let read = 0;
+  let total = 0;
+  let excluded = 0;
+  let newest: CursorState | null = after ? { t: after.t, ids: [...after.ids] } : null;
+
+  // The stream may only stop early at the lower bound if pages come newest first,
+  // which we only assume once an item has been strictly older than the one
+  // before it and none has been newer. Equal timestamps prove nothing.
+  let descending = false;
+  let ascending = false;
+  let previous = NaN;
+  let stopped = false;
+
+  const listOpts = options.sourceId ? { sourceId: options.sourceId } : undefined;
+  for await (const raw of (exa.websets.items as any).listAll(websetId, listOpts)) {
+    const item = raw as Record<string, unknown>;
+    read++;
+
+    const time = createdAtOf(item);
+    const id = item.id as string | undefined;
+    if (!Number.isNaN(time)) {
+      if (!Number.isNaN(previous)) {
+        if (time > previous) ascending = true;
+        else if (time < previous) descending = true;
+      }
+      if (!newest || time > newest.t) newest = { t: time, ids: id ? [id] : [] };
+      else if (time === newest.t && id && !newest.ids.includes(id)) newest.ids.push(id);
+
+      const beforeBound = time < lowerBound || (after !== null && time === after.t && !!id && seenAtCursor.has(id));
+      if (beforeBound) {
+        if (descending && !ascending && time < lowerBound) break;
+        previous = time;
+        if (read >= maxItems) break;
+        if (options.shouldStop?.()) {
+          stopped = true;
+          break;
+        }
+        continue;
+      }
+      previous = time;
+    }
+
+    total++;
+    if (options.filter && !options.filter(item)) {
+      excluded++;
+    } else {
+      const mapped = options.map ? options.map(item) : (item as T);
+      if (mapped === null) excluded++;
+      else data.push(mapped);
+    }
+    if (read >= maxItems) break;
+    if (options.shouldStop?.()) {
+      stopped = true;
+      break;
+    }
+  }
+
+  // A cursor marks everything up to its newest item as read. After a partial
+  // read the unread items may be older than that, so resuming would skip them.
+  const truncated = read >= maxItems;
+  return {
+    data,
+    total,
+    excluded,
+    truncated,
+    resumeCursor: newest && !truncated && !stopped ? encodeResumeCursor(newest) : null,
+  };
+}
@@ -0,0 +1,349 @@
+// Process metrics in the Prometheus text format. Hot paths only bump numbers
+// on pre-resolved label series; anything derived from existing state (task
+// counts, sessions, pool depth) is read by collectors when /metrics is scraped.
+
+import type { Exa } from 'exa-js';
+import { SEARCH_METHODS } from './scheduler.js';
+
+type Labels = readonly string[];
+
+function escapeLabel(value: string): string {
+  return value.replace(/\\/g, '\\\\').replace(/\n/g, '\\n').replace(/"/g, '\\"');
+}
+
+function formatLabels(names: Labels, values: Labels, extra?: string): string {
+  const parts = names.map((name, i) => `${name}="${escapeLabel(values[i] ?? '')}"`);
+  if (extra) parts.push(extra);
+  return parts.length > 0 ? `{${parts.join(',')}}` : '';
+}
+
+function formatValue(value: number): string {
+  if (value === Infinity) return '+Inf';
+  if (value === -Infinity) return '-Inf';
+  return String(value);
+}
+
+interface Metric {
+  readonly name: string;
+  render(lines: string[]): void;
+}
+
+abstract class LabelledMetric<S> implements Metric {
+  protected series = new Map<string, { values: Labels; series: S }>();
+
+  constructor(
+    readonly name: string,
+    readonly help: string,
+    readonly labelNames: Labels,
+  ) {}
+
+  /** The series for these label values; hold on to it on hot paths to skip the lookup. */
+  labels(...values: string[]): S {
+    const key = values.join('\u0000');
+    let entry = this.series.get(key);
+    if (!entry) {
+      entry = { values, series: this.create() };
+      this.series.set(key, entry);
+    }
+    return entry.series;
+  }
+
+  protected abstract create(): S;
+  abstract render(lines: string[]): void;
+}
+
+// --- Counter ---
+
+export interface CounterSeries {
+  inc(by?: number): void;
+}
+
+class CounterValue implements CounterSeries {
+  value = 0;
+  inc(by = 1): void {
+    this.value += by;
+  }
+}
+
+export class Counter extends LabelledMetric<CounterValue> {
+  inc(...values: string[]): void {
+    this.labels(...values).inc();
+  }
+
+  protected create(): CounterValue {
+    return new CounterValue();
+  }
+
+  render(lines: string[]): void {
+    lines.push(`# HELP ${this.name} ${this.help}`, `# TYPE ${this.name} counter`);
+    for (const { values, series } of this.series.values()) {
+      lines.push(`${this.name}${formatLabels(this.labelNames, values)} ${formatValue(series.value)}`);
+    }
+  }
+}
+
+// --- Histogram ---
+
+/** Seconds; spans quick cached calls up to long workflow steps. */
+export const DEFAULT_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600];
+
+export interface HistogramSeries {
+  observe(seconds: number): void;
+}
+
+class HistogramValue implements HistogramSeries {
+  counts: number[];
+  sum = 0;
+  count = 0;
+
+  constructor(private buckets: number[]) {
+    this.counts = new Array(buckets.length).fill(0);
+  }
+
+  observe(value: number): void {
+    this.sum += value;
+    this.count++;
+    // Only the first matching bucket is bumped; render() accumulates
+    const buckets = this.buckets;
+    for (let i = 0; i < buckets.length; i++) {
+      if (value <= buckets[i]) {
+        this.counts[i]++;
+        return;
+      }
+    }
+  }
+}
+
+export class Histogram extends LabelledMetric<HistogramValue> {
+  constructor(name: string, help: string, labelNames: Labels, private buckets: number[] = DEFAULT_BUCKETS) {
+    super(name, help, labelNames);
+  }
+
+  observe(seconds: number, ...values: string[]): void {
+    this.labels(...values).observe(seconds);
+  }
+
+  protected create(): HistogramValue {
+    return new HistogramValue(this.buckets);
+  }
+
+  render(lines: string[]): void {
+    lines.push(`# HELP ${this.name} ${this.help}`, `# TYPE ${this.name} histogram`);
+    for (const { values, series } of this.series.values()) {
+      let cumulative = 0;
+      for (let i = 0; i < this.buckets.length; i++) {
+        cumulative += series.counts[i];
+        const le = `le="${formatValue(this.buckets[i])}"`;
+        lines.push(`${this.name}_bucket${formatLabels(this.labelNames, values, le)} ${cumulative}`);
+      }
+      lines.push(`${this.name}_bucket${formatLabels(this.labelNames, values, 'le="+Inf"')} ${series.count}`);
+      lines.push(`${this.name}_sum${formatLabels(this.labelNames, values)} ${formatValue(series.sum)}`);
+      lines.push(`${this.name}_count${formatLabels(this.labelNames, values)} ${series.count}`);
+    }
+  }
+}
+
+// --- Collected gauges and counters ---
+
+export type Sample = [labelValues: string[], value: number];
+
+/** A metric whose samples are read from existing state at scrape time. */
+class Collected implements Metric {
+  constructor(
+    readonly name: string,
+    private help: string,
+    private type: 'gauge' | 'counter',
+    private labelNames: Labels,
+    private collect: () => Sample[] | number,
+  ) {}
+
+  render(lines: string[]): void {
+    let samples: Sample[] | number;
+    try {
+      samples = this.collect();
+    } catch {
+      return; // a broken collector must not take down the scrape
+    }
+    lines.push(`# HELP ${this.name} ${this.help}`, `# TYPE ${this.name} ${this.type}`);
+    if (typeof samples === 'number') {
+      lines.push(`${this.name} ${formatValue(samples)}`);
+      return;
+    }
+    for (const [values, value] of samples) {
+      lines.push(`${this.name}${formatLabels(this.labelNames, values)} ${formatValue(value)}`);
+    }
+  }
+}
+
+// --- Registry ---
+
+export class MetricsRegistry {
+  private metrics = new Map<string, Metric>();
+
+  counter(name: string, help: string, labelNames: Labels = []): Counter {
+    return this.register(new Counter(name, help, labelNames));
+  }
+
+  histogram(name: string, help: string, labelNames: Labels = [], buckets?: number[]): Histogram {
+    return this.register(new Histogram(name, help, labelNames, buckets));
+  }
+
+  /**
+   * Register a gauge (or a counter kept elsewhere) read at scrape time.
+   * Registering the same name again replaces the collector, so a recreated
+   * server reports its own state.
+   */
+  collect(
+    name: string,
+    help: string,
+    type: 'gauge' | 'counter',
+    collect: () => Sample[] | number,
+    labelNames: Labels = [],
+  ): void {
+    this.metrics.set(name, new Collected(name, help, type, labelNames, collect));
+  }
+
+  /** Prometheus text exposition format (version 0.0.4). */
+  render(): string {
+    const lines: string[] = [];
+    for (const metric of this.metrics.values()) metric.render(lines);
+    return lines.join('\n') + '\n';
+  }
+
+  private register<M extends Metric>(metric: M): M {
+    const existing = this.metrics.get(metric.name);
+    if (existing) return existing as M;
+    this.metrics.set(metric.name, metric);
+    return metric;
+  }
+}
+
+export const PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8';
+
+export const metrics = new MetricsRegistry();
+
+export const operationDuration = metrics.histogram(
+  'websets_operation_duration_seconds',
+  'manage_websets operation latency',
+  ['operation', 'status'],
+);
+
+export const workflowDuration = metrics.histogram(
+  'websets_workflow_duration_seconds',
+  'Background task run time by workflow type',
+  ['workflow', 'status'],
+);
+
+export const workflowStepDuration = metrics.histogram(
+  'websets_workflow_step_duration_seconds',
+  'Workflow step latency',
+  ['workflow', 'step'],
+);
+
+export type UpstreamApi = 'websets' | 'research' | 'search';
+
+export const upstreamRequests = metrics.counter(
+  'websets_upstream_requests_total',
+  'Calls made to the Exa API',
+  ['api'],
+);
+
+export const upstreamErrors = metrics.counter(
+  'websets_upstream_errors_total',
+  'Exa API calls that failed',
+  ['api'],
+);
+
+/** Seconds since `start` (a performance.now() reading). */
+export function secondsSince(start: number): number {
+  return (performance.now() - start) / 1000;
+}
+
+// --- Upstream instrumentation ---
+
+function counted(
+  target: object,
+  value: (...args: unknown[]) => unknown,
+  calls: CounterSeries,
+  errors: CounterSeries,
+): (...args: unknown[]) => unknown {
+  return (...args: unknown[]) => {
+    calls.inc();
+    let result: unknown;
+    try {
+      result = value.apply(target, args);
+    } catch (err) {
+      errors.inc();
+      throw err;
+    }
+    if (result instanceof Promise) {
+      return result.catch(err => {
+        errors.inc();
+        throw err;
+      });
+    }
+    return result;
+  };
+}
+
+function countNamespace<T extends object>(target: T, api: UpstreamApi, wrapped: WeakMap<object, unknown>): T {
+  const calls = upstreamRequests.labels(api);
+  const errors = upstreamErrors.labels(api);
+  const proxy: T = new Proxy(target, {
+    get(obj, prop) {
+      const value = Reflect.get(obj, prop);
+      if (typeof prop !== 'string' || !value || prop === 'constructor') return value;
+      if (typeof value === 'function') {
+        // Paginating and polling helpers call this.list()/this.get() per round,
+        // so route them through the proxy and count those calls instead
+        if (/^(listAll|waitUntil|poll)/.test(prop)) return value.bind(proxy);
+        let fn = wrapped.get(value) as ((...args: unknown[]) => unknown) | undefined;
+        if (!fn) {
+          fn = counted(obj, value, calls, errors);
+          wrapped.set(value, fn);
+        }
+        return fn;
+      }
+      if (typeof value === 'object') {
+        let nested = wrapped.get(value) as object | undefined;
+        if (!nested) {
+          nested = countNamespace(value, api, wrapped);
+          wrapped.set(value, nested);
+        }
+        return nested;
+      }
+      return value;
+    },
+  });
+  return proxy;
+}
+
+/** Count every Exa API call (and failure) by API: websets, research or search. */
+export function withUpstreamMetrics(exa: Exa): Exa {
+  const wrapped = new WeakMap<object, unknown>();
+  const searchCalls = upstreamRequests.labels('search');
+  const searchErrors = upstreamErrors.labels('search');
+  return new Proxy(exa, {
+    get(obj, prop) {
+      const value = Reflect.get(obj, prop);
+      if (typeof prop !== 'string' || !value) return value;
+      if ((prop === 'websets' || prop === 'research') && typeof value === 'object') {
+        let namespace = wrapped.get(value) as object | undefined;
+        if (!namespace) {
+          namespace = countNamespace(value, prop, wrapped);
+          wrapped.set(value, namespace);
+        }
+        return namespace;
+      }
+      if (SEARCH_METHODS.has(prop) && typeof value === 'function') {
+        let fn = wrapped.get(value) as ((...args: unknown[]) => unknown) | undefined;
+        if (!fn) {
+          fn = counted(obj, value, searchCalls, searchErrors);
+          wrapped.set(value, fn);
+        }
+        return fn;
+      }
+      return value;
+    },
+  });
+}
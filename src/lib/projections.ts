@@ -32,7 +32,7 @@ function extractItemFields(item: Record<string, unknown>): {
 
 // --- Item projection ---
 
-function hasSatisfiedEvaluation(item: Record<string, unknown>): boolean {
+export function hasSatisfiedEvaluation(item: Record<string, unknown>): boolean {
   const evaluations = item.evaluations as Array<Record<string, unknown>> | undefined;
   if (!evaluations || evaluations.length === 0) return true; // no criteria = pass
   return evaluations.some(e => e.satisfied === 'yes');
@@ -65,6 +65,29 @@ export function projectItem(item: Record<string, unknown>): Record<string, unkno
   };
 }
 
+/**
+ * Raw item minus the bulk nothing downstream reads: the page content blob and
+ * per-evaluation/enrichment reasoning and references. Keeps the raw shape, so
+ * workflows can hold items in memory without paying for the full payload.
+ */
+export function compactItem(item: Record<string, unknown>): Record<string, unknown> {
+  const compact: Record<string, unknown> = { ...item };
+  const props = item.properties as Record<string, unknown> | undefined;
+  if (props && 'content' in props) {
+    const { content: _content, ...rest } = props;
+    compact.properties = rest;
+  }
+  const evaluations = item.evaluations as Array<Record<string, unknown>> | undefined;
+  if (Array.isArray(evaluations)) {
+    compact.evaluations = evaluations.map(({ reasoning: _r, references: _refs, ...e }) => e);
+  }
+  const enrichments = item.enrichments as Array<Record<string, unknown>> | undefined;
+  if (Array.isArray(enrichments)) {
+    compact.enrichments = enrichments.map(({ reasoning: _r, references: _refs, ...e }) => e);
+  }
+  return compact;
+}
+
 export function filterAndProjectItems(items: unknown[]): {
   data: unknown[];
   total: number;
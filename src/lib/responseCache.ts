@@ -0,0 +1,435 @@
+// Response cache for the instant Exa endpoints (search, findSimilar,
+// getContents, answer). Entries are content-addressed by operation and
+// normalized arguments, expire per operation, and live in a byte-bounded LRU
+// that can spill evicted entries to disk. Identical requests in flight at the
+// same time share one upstream call; getContents is cached per URL.
+
+import { createHash } from 'node:crypto';
+import fs from 'node:fs';
+import path from 'node:path';
+import type { Exa } from 'exa-js';
+
+export type CachedOperation = 'search' | 'findSimilar' | 'getContents' | 'answer';
+
+export const DEFAULT_TTL_MS: Record<CachedOperation, number> = {
+  search: 10 * 60 * 1000,
+  findSimilar: 10 * 60 * 1000,
+  getContents: 60 * 60 * 1000,
+  answer: 5 * 60 * 1000,
+};
+
+const DEFAULT_MAX_BYTES = 64 * 1024 * 1024;
+const DEFAULT_MAX_DISK_BYTES = 256 * 1024 * 1024;
+
+export interface ResponseCacheOptions {
+  maxBytes?: number;
+  ttlMs?: Partial<Record<CachedOperation, number>>;
+  /** Directory for entries evicted from memory; no spill when unset. */
+  spillDir?: string;
+  maxDiskBytes?: number;
+}
+
+export interface OperationStats {
+  hits: number;
+  misses: number;
+  coalesced: number;
+}
+
+export interface CacheStats {
+  entries: number;
+  bytes: number;
+  maxBytes: number;
+  diskEntries: number;
+  diskBytes: number;
+  diskHits: number;
+  evictions: number;
+  operations: Record<CachedOperation, OperationStats>;
+}
+
+interface Entry {
+  json: string;
+  bytes: number;
+  expiresAt: number;
+}
+
+interface DiskEntry {
+  bytes: number;
+  expiresAt: number;
+}
+
+interface FetchedContent {
+  json?: string;
+  /** The upstream status entry for this URL, if the batch that fetched it had one. */
+  status?: unknown;
+}
+
+// --- Keys ---
+
+/** JSON with object keys sorted, so argument order never changes the key. */
+export function stableStringify(value: unknown): string {
+  if (value === undefined) return 'null';
+  if (value === null || typeof value !== 'object') return JSON.stringify(value);
+  if (Array.isArray(value)) return `[${value.map(stableStringify).join(',')}]`;
+  const entries = Object.keys(value as Record<string, unknown>)
+    .filter(k => (value as Record<string, unknown>)[k] !== undefined)
+    .sort()
+    .map(k => `${JSON.stringify(k)}:${stableStringify((value as Record<string, unknown>)[k])}`);
+  return `{${entries.join(',')}}`;
+}
+
+export function cacheKey(operation: string, args: unknown): string {
+  return createHash('sha256').update(operation).update('\u0000').update(stableStringify(args)).digest('hex');
+}
+
+// --- getContents matching ---
+
+/** A URL without scheme, host case or trailing slashes, which the API may normalize. */
+function looseUrl(url: string): string {
+  const rest = url.trim().replace(/^[a-z][a-z0-9+.-]*:\/\//i, '').replace(/\/+$/, '');
+  const slash = rest.indexOf('/');
+  return slash < 0 ? rest.toLowerCase() : rest.slice(0, slash).toLowerCase() + rest.slice(slash);
+}
+
+/**
+ * Pair upstream entries with requested URLs: exact matches on any of the
+ * entry's keys first, then loose ones. Each entry is used at most once.
+ */
+function matchToUrls<T>(
+  urls: string[],
+  entries: T[],
+  keysOf: (entry: T) => unknown[],
+): { matched: Map<string, T>; unmatched: T[] } {
+  const matched = new Map<string, T>();
+  const used = new Set<number>();
+  const pass = (normalize: (url: string) => string) => {
+    const wanted = new Map<string, string>();
+    for (const url of urls) {
+      if (!matched.has(url) && !wanted.has(normalize(url))) wanted.set(normalize(url), url);
+    }
+    entries.forEach((entry, i) => {
+      if (used.has(i)) return;
+      for (const key of keysOf(entry)) {
+        if (typeof key !== 'string') continue;
+        const url = wanted.get(normalize(key));
+        if (url === undefined) continue;
+        matched.set(url, entry);
+        wanted.delete(normalize(key));
+        used.add(i);
+        return;
+      }
+    });
+  };
+  pass(url => url);
+  pass(looseUrl);
+  return { matched, unmatched: entries.filter((_, i) => !used.has(i)) };
+}
+
+// --- Cache ---
+
+export class ResponseCache {
+  private memory = new Map<string, Entry>();
+  private disk = new Map<string, DiskEntry>();
+  private inFlight = new Map<string, Promise<string | undefined>>();
+  private contentsInFlight = new Map<string, Promise<FetchedContent>>();
+  private bytes = 0;
+  private diskBytes = 0;
+  private diskHits = 0;
+  private evictions = 0;
+  private maxBytes: number;
+  private maxDiskBytes: number;
+  private ttlMs: Record<CachedOperation, number>;
+  private spillDir: string | undefined;
+  private ops: Record<CachedOperation, OperationStats> = {
+    search: { hits: 0, misses: 0, coalesced: 0 },
+    findSimilar: { hits: 0, misses: 0, coalesced: 0 },
+    getContents: { hits: 0, misses: 0, coalesced: 0 },
+    answer: { hits: 0, misses: 0, coalesced: 0 },
+  };
+
+  constructor(options: ResponseCacheOptions = {}) {
+    this.maxBytes = options.maxBytes ?? DEFAULT_MAX_BYTES;
+    this.maxDiskBytes = options.maxDiskBytes ?? DEFAULT_MAX_DISK_BYTES;
+    this.ttlMs = { ...DEFAULT_TTL_MS, ...options.ttlMs };
+    this.spillDir = options.spillDir;
+    if (this.spillDir) fs.mkdirSync(this.spillDir, { recursive: true });
+  }
+
+  /**
+   * Return the cached response for (operation, args), or call `fetch` once for
+   * all concurrent callers and cache its result. Each caller gets its own copy.
+   */
+  async getOrFetch<T>(operation: CachedOperation, args: unknown, fetch: () => Promise<T>): Promise<T> {
+    const key = cacheKey(operation, args);
+    const json = await this.lookupOrFetch(operation, key, async () => fetch());
+    return JSON.parse(json!) as T;
+  }
+
+  /**
+   * getContents with one cache entry per URL. Only URLs that miss (and are not
+   * already being fetched) go upstream, in a single batch. Results keep the
+   * requested URL order; URLs the upstream returned nothing for are not cached.
+   * Upstream results that match no requested URL (redirected or normalized
+   * beyond what looseUrl undoes) are returned after the rest, uncached, and
+   * per-URL `statuses` are kept for every URL that missed.
+   */
+  async getContents(
+    urls: string[],
+    opts: Record<string, unknown> | undefined,
+    fetch: (urls: string[]) => Promise<any>,
+  ): Promise<any> {
+    const stats = this.ops.getContents;
+    const found = new Map<string, Promise<FetchedContent>>();
+    const missing: string[] = [];
+    const pending = new Map<string, (fetched: FetchedContent) => void>();
+    let failBatch: (error: unknown) => void = () => {};
+    const batch = new Promise<never>((_, reject) => { failBatch = reject; });
+    batch.catch(() => {});
+
+    for (const url of new Set(urls)) {
+      const key = cacheKey('getContents', { url, opts: opts ?? {} });
+      const cached = this.read(key);
+      if (cached !== undefined) {
+        stats.hits++;
+        found.set(url, Promise.resolve({ json: cached }));
+        continue;
+      }
+      const shared = this.contentsInFlight.get(key);
+      if (shared) {
+        stats.coalesced++;
+        found.set(url, shared);
+        continue;
+      }
+      stats.misses++;
+      missing.push(url);
+      const promise = Promise.race([
+        new Promise<FetchedContent>(resolve => pending.set(url, resolve)),
+        batch,
+      ]).finally(() => this.contentsInFlight.delete(key));
+      promise.catch(() => {}); // the batch error is thrown to this caller below
+      this.contentsInFlight.set(key, promise);
+      found.set(url, promise);
+    }
+
+    let response: Record<string, unknown> = {};
+    let unmatched: { results: unknown[]; statuses: unknown[] } = { results: [], statuses: [] };
+    if (missing.length > 0) {
+      try {
+        response = (await fetch(missing)) ?? {};
+      } catch (error) {
+        failBatch(error);
+        throw error;
+      }
+      const results = matchToUrls(missing, (response.results as any[]) ?? [], r => [r?.url, r?.id]);
+      const statuses = matchToUrls(missing, (response.statuses as any[]) ?? [], st => [st?.id]);
+      unmatched = { results: results.unmatched, statuses: statuses.unmatched };
+      for (const url of missing) {
+        const result = results.matched.get(url);
+        const json = result === undefined ? undefined : JSON.stringify(result);
+        if (json !== undefined) {
+          this.write(cacheKey('getContents', { url, opts: opts ?? {} }), json, this.ttlMs.getContents);
+        }
+        pending.get(url)!({ json, status: statuses.matched.get(url) });
+      }
+    }
+
+    const results: unknown[] = [];
+    const statuses: unknown[] = [];
+    for (const url of new Set(urls)) {
+      const { json, status } = await found.get(url)!;
+      if (json !== undefined) results.push(JSON.parse(json));
+      if (status !== undefined) statuses.push(status);
+    }
+    results.push(...unmatched.results);
+    statuses.push(...unmatched.statuses);
+    const out: Record<string, unknown> = { ...response, results };
+    if (statuses.length > 0) out.statuses = statuses;
+    return out;
+  }
+
+  stats(): CacheStats {
+    return {
+      entries: this.memory.size,
+      bytes: this.bytes,
+      maxBytes: this.maxBytes,
+      diskEntries: this.disk.size,
+      diskBytes: this.diskBytes,
+      diskHits: this.diskHits,
+      evictions: this.evictions,
+      operations: {
+        search: { ...this.ops.search },
+        findSimilar: { ...this.ops.findSimilar },
+        getContents: { ...this.ops.getContents },
+        answer: { ...this.ops.answer },
+      },
+    };
+  }
+
+  clear(): void {
+    this.memory.clear();
+    this.bytes = 0;
+    for (const key of [...this.disk.keys()]) this.dropDisk(key);
+  }
+
+  private async lookupOrFetch(
+    operation: CachedOperation,
+    key: string,
+    fetch: () => Promise<unknown>,
+  ): Promise<string | undefined> {
+    const stats = this.ops[operation];
+    const cached = this.read(key);
+    if (cached !== undefined) {
+      stats.hits++;
+      return cached;
+    }
+    const shared = this.inFlight.get(key);
+    if (shared) {
+      stats.coalesced++;
+      return shared;
+    }
+    stats.misses++;
+    const promise = fetch()
+      .then(value => {
+        const json = JSON.stringify(value ?? null);
+        this.write(key, json, this.ttlMs[operation]);
+        return json;
+      })
+      .finally(() => this.inFlight.delete(key));
+    this.inFlight.set(key, promise);
+    return promise;
+  }
+
+  private read(key: string): string | undefined {
+    const now = Date.now();
+    const entry = this.memory.get(key);
+    if (entry) {
+      this.memory.delete(key);
+      if (entry.expiresAt <= now) {
+        this.bytes -= entry.bytes;
+        return undefined;
+      }
+      this.memory.set(key, entry); // most recently used goes last
+      return entry.json;
+    }
+
+    const onDisk = this.disk.get(key);
+    if (!onDisk) return undefined;
+    if (onDisk.expiresAt <= now) {
+      this.dropDisk(key);
+      return undefined;
+    }
+    let json: string;
+    try {
+      json = fs.readFileSync(this.spillPath(key), 'utf8');
+    } catch {
+      this.dropDisk(key);
+      return undefined;
+    }
+    this.dropDisk(key);
+    this.diskHits++;
+    this.store(key, { json, bytes: onDisk.bytes, expiresAt: onDisk.expiresAt });
+    return json;
+  }
+
+  private write(key: string, json: string, ttlMs: number): void {
+    if (ttlMs <= 0) return;
+    const bytes = Buffer.byteLength(json);
+    if (bytes > this.maxBytes) return;
+    const old = this.memory.get(key);
+    if (old) {
+      this.memory.delete(key);
+      this.bytes -= old.bytes;
+    }
+    if (this.disk.has(key)) this.dropDisk(key);
+    this.store(key, { json, bytes, expiresAt: Date.now() + ttlMs });
+  }
+
+  private store(key: string, entry: Entry): void {
+    this.memory.set(key, entry);
+    this.bytes += entry.bytes;
+    for (const [oldKey, old] of this.memory) {
+      if (this.bytes <= this.maxBytes) break;
+      this.memory.delete(oldKey);
+      this.bytes -= old.bytes;
+      this.evictions++;
+      this.spill(oldKey, old);
+    }
+  }
+
+  private spill(key: string, entry: Entry): void {
+    if (!this.spillDir || entry.expiresAt <= Date.now() || entry.bytes > this.maxDiskBytes) return;
+    try {
+      fs.writeFileSync(this.spillPath(key), entry.json);
+    } catch {
+      return; // disk spill is best effort
+    }
+    this.disk.set(key, { bytes: entry.bytes, expiresAt: entry.expiresAt });
+    this.diskBytes += entry.bytes;
+    for (const oldKey of this.disk.keys()) {
+      if (this.diskBytes <= this.maxDiskBytes) break;
+      this.dropDisk(oldKey);
+    }
+  }
+
+  private dropDisk(key: string): void {
+    const entry = this.disk.get(key);
+    if (!entry) return;
+    this.disk.delete(key);
+    this.diskBytes -= entry.bytes;
+    fs.rm(this.spillPath(key), { force: true }, () => {});
+  }
+
+  private spillPath(key: string): string {
+    return path.join(this.spillDir!, `${key}.json`);
+  }
+}
+
+// --- Client wrapper ---
+
+const cachedClients = new WeakSet<object>();
+
+/** getContents options that change what a batch returns as a whole, so it can't be split per URL. */
+function isBatchScoped(opts: Record<string, unknown> | undefined): boolean {
+  return !!opts && (opts.context !== undefined || opts.subpages !== undefined || opts.subpageTarget !== undefined);
+}
+
+/** Options asking for fresh content, which a cache must not answer. */
+function wantsFresh(opts: Record<string, unknown> | undefined): boolean {
+  return !!opts && (opts.livecrawl === 'always' || opts.maxAgeHours === 0);
+}
+
+/**
+ * Serve exa.search, findSimilar, getContents and answer from `cache`.
+ * Everything else on the client passes through untouched.
+ */
+export function withResponseCache(exa: Exa, cache: ResponseCache): Exa {
+  if (cachedClients.has(exa)) return exa;
+  const target = exa as any;
+  const methods: Record<string, (...args: any[]) => Promise<unknown>> = {
+    search: (query: string, opts?: Record<string, unknown>) =>
+      wantsFresh(opts)
+        ? target.search(query, opts)
+        : cache.getOrFetch('search', { query, opts }, () => target.search(query, opts)),
+    findSimilar: (url: string, opts?: Record<string, unknown>) =>
+      wantsFresh(opts)
+        ? target.findSimilar(url, opts)
+        : cache.getOrFetch('findSimilar', { url, opts }, () => target.findSimilar(url, opts)),
+    answer: (query: string, opts?: Record<string, unknown>) =>
+      cache.getOrFetch('answer', { query, opts }, () => target.answer(query, opts)),
+    getContents: (urls: string | string[], opts?: Record<string, unknown>) => {
+      if (wantsFresh(opts)) return target.getContents(urls, opts);
+      if (isBatchScoped(opts)) {
+        return cache.getOrFetch('getContents', { urls, opts }, () => target.getContents(urls, opts));
+      }
+      const list = Array.isArray(urls) ? urls : [urls];
+      return cache.getContents(list, opts, missing => target.getContents(missing, opts));
+    },
+  };
+  const client = new Proxy(exa, {
+    get(obj, prop) {
+      if (typeof prop === 'string' && Object.hasOwn(methods, prop)) return methods[prop];
+      return Reflect.get(obj, prop);
+    },
+  });
+  cachedClients.add(client);
+  return client;
+}
@@ -0,0 +1,241 @@
+// Task scheduling — a bounded worker pool for background tasks and global
+// concurrency pools per upstream API, both built on Semaphore. Tasks beyond the
+// worker limit wait in a queue ordered by priority, then by how many tasks their
+// session already has running, then by arrival.
+
+import type { Exa } from 'exa-js';
+import { Semaphore } from './semaphore.js';
+
+// --- API pools ---
+
+export type ApiPool = 'websets' | 'research' | 'search';
+
+export const API_POOL_LIMITS: Record<ApiPool, number> = {
+  websets: 8,
+  research: 4,
+  search: 10,
+};
+
+/** Process-wide pools shared by every session and task. */
+export const apiPools: Record<ApiPool, Semaphore> = {
+  websets: new Semaphore(API_POOL_LIMITS.websets),
+  research: new Semaphore(API_POOL_LIMITS.research),
+  search: new Semaphore(API_POOL_LIMITS.search),
+};
+
+/** Top-level client methods that call the search/contents/answer endpoints. */
+export const SEARCH_METHODS = new Set([
+  'search',
+  'searchAndContents',
+  'findSimilar',
+  'findSimilarAndContents',
+  'getContents',
+  'answer',
+]);
+
+/**
+ * Async generators and long waits hold no permit themselves. They call
+ * this.list()/this.get() once per page or poll, so they are bound to the pooled
+ * proxy and each of those requests takes and releases its own permit.
+ */
+function isPaginatingOrWaiting(name: string): boolean {
+  return name.startsWith('listAll') || name.startsWith('waitUntil');
+}
+
+function poolNamespace<T extends object>(target: T, pool: Semaphore, wrapped: WeakMap<object, unknown>): T {
+  const proxy: T = new Proxy(target, {
+    get(obj, prop) {
+      const value = Reflect.get(obj, prop);
+      if (typeof prop !== 'string' || !value || prop === 'constructor') return value;
+      if (typeof value === 'function') {
+        if (isPaginatingOrWaiting(prop)) return value.bind(proxy);
+        let fn = wrapped.get(value) as ((...args: unknown[]) => Promise<unknown>) | undefined;
+        if (!fn) {
+          fn = (...args: unknown[]) => pool.run(async () => value.apply(obj, args));
+          wrapped.set(value, fn);
+        }
+        return fn;
+      }
+      if (typeof value === 'object') {
+        let nested = wrapped.get(value) as object | undefined;
+        if (!nested) {
+          nested = poolNamespace(value, pool, wrapped);
+          wrapped.set(value, nested);
+        }
+        return nested;
+      }
+      return value;
+    },
+  });
+  return proxy;
+}
+
+const pooledClients = new WeakSet<object>();
+
+/**
+ * Route an Exa client's calls through the API pools: search/contents/answer
+ * calls share the search pool and every websets.* call the websets pool.
+ * Research jobs span a create and a long poll, so workflows take the research
+ * pool explicitly around both (see runResearch in workflows/helpers).
+ */
+export function withApiPools(exa: Exa, pools: Record<ApiPool, Semaphore> = apiPools): Exa {
+  if (pooledClients.has(exa)) return exa;
+  const wrapped = new WeakMap<object, unknown>();
+  const client = new Proxy(exa, {
+    get(obj, prop) {
+      const value = Reflect.get(obj, prop);
+      if (typeof prop !== 'string' || !value) return value;
+      if (prop === 'websets' && typeof value === 'object') {
+        let websets = wrapped.get(value) as object | undefined;
+        if (!websets) {
+          websets = poolNamespace(value, pools.websets, wrapped);
+          wrapped.set(value, websets);
+        }
+        return websets;
+      }
+      if (SEARCH_METHODS.has(prop) && typeof value === 'function') {
+        let fn = wrapped.get(value) as ((...args: unknown[]) => Promise<unknown>) | undefined;
+        if (!fn) {
+          fn = (...args: unknown[]) => pools.search.run(async () => value.apply(obj, args));
+          wrapped.set(value, fn);
+        }
+        return fn;
+      }
+      return value;
+    },
+  });
+  pooledClients.add(client);
+  return client;
+}
+
+// --- Task scheduler ---
+
+export type TaskPriority = 'low' | 'normal' | 'high';
+
+const PRIORITY_RANK: Record<TaskPriority, number> = { low: 0, normal: 1, high: 2 };
+
+export interface ScheduleOptions {
+  priority?: TaskPriority;
+  /** MCP session that created the task; tasks without one share a session. */
+  sessionId?: string;
+}
+
+export interface SchedulerStats {
+  running: number;
+  queued: number;
+  maxRunning: number;
+  maxQueued: number;
+}
+
+interface QueuedTask {
+  id: string;
+  rank: number;
+  session: string;
+  seq: number;
+  run: () => Promise<void>;
+}
+
+const DEFAULT_MAX_RUNNING = 20;
+const DEFAULT_MAX_QUEUED = 200;
+
+export class TaskScheduler {
+  private slots: Semaphore;
+  private queue: QueuedTask[] = [];
+  private runningBySession = new Map<string, number>();
+  private running = 0;
+  private seq = 0;
+
+  constructor(
+    private maxRunning = DEFAULT_MAX_RUNNING,
+    private maxQueued = DEFAULT_MAX_QUEUED,
+  ) {
+    this.slots = new Semaphore(maxRunning);
+  }
+
+  /** False when the queue is full and submit() would throw. */
+  canAdmit(): boolean {
+    return this.slots.available > 0 || this.queue.length < this.maxQueued;
+  }
+
+  /**
+   * Start `run` now if a worker is free, otherwise queue it.
+   * Returns true if it started immediately. `run` must not reject.
+   */
+  submit(id: string, run: () => Promise<void>, options: ScheduleOptions = {}): boolean {
+    if (!this.canAdmit()) {
+      throw new Error(`Task queue is full (${this.maxQueued} waiting). Cancel or wait for existing tasks.`);
+    }
+    this.queue.push({
+      id,
+      rank: PRIORITY_RANK[options.priority ?? 'normal'],
+      session: options.sessionId ?? '',
+      seq: this.seq++,
+      run,
+    });
+    this.pump();
+    return !this.queue.some(t => t.id === id);
+  }
+
+  /** Drop a task that has not started yet. */
+  remove(id: string): boolean {
+    const idx = this.queue.findIndex(t => t.id === id);
+    if (idx < 0) return false;
+    this.queue.splice(idx, 1);
+    return true;
+  }
+
+  stats(): SchedulerStats {
+    return {
+      running: this.running,
+      queued: this.queue.length,
+      maxRunning: this.maxRunning,
+      maxQueued: this.maxQueued,
+    };
+  }
+
+  private pump(): void {
+    while (this.queue.length > 0 && this.slots.tryAcquire()) {
+      const [task] = this.queue.splice(this.nextIndex(), 1);
+      this.start(task);
+    }
+  }
+
+  /** Highest priority first; among equals, the session with the fewest running tasks, then FIFO. */
+  private nextIndex(): number {
+    let best = 0;
+    for (let i = 1; i < this.queue.length; i++) {
+      const a = this.queue[i];
+      const b = this.queue[best];
+      if (a.rank !== b.rank) {
+        if (a.rank > b.rank) best = i;
+        continue;
+      }
+      const loadA = this.runningBySession.get(a.session) ?? 0;
+      const loadB = this.runningBySession.get(b.session) ?? 0;
+      if (loadA < loadB || (loadA === loadB && a.seq < b.seq)) best = i;
+    }
+    return best;
+  }
+
+  private start(task: QueuedTask): void {
+    this.running++;
+    this.runningBySession.set(task.session, (this.runningBySession.get(task.session) ?? 0) + 1);
+    const finish = () => {
+      this.running--;
+      const n = this.runningBySession.get(task.session)! - 1;
+      if (n === 0) this.runningBySession.delete(task.session);
+      else this.runningBySession.set(task.session, n);
+      this.slots.release();
+      this.pump();
+    };
+    let promise: Promise<void>;
+    try {
+      promise = task.run();
+    } catch {
+      promise = Promise.resolve();
+    }
+    promise.then(finish, finish);
+  }
+}
+
+export const taskScheduler = new TaskScheduler();
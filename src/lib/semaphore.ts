@@ -6,6 +6,25 @@ export class Semaphore {
     this.permits = permits;
   }
 
+  /** Permits free right now. */
+  get available(): number {
+    return this.permits;
+  }
+
+  /** Callers blocked in acquire(). */
+  get waiting(): number {
+    return this.queue.length;
+  }
+
+  /** Take a permit only if one is free, without queueing. */
+  tryAcquire(): boolean {
+    if (this.permits > 0) {
+      this.permits--;
+      return true;
+    }
+    return false;
+  }
+
   acquire(): Promise<void> {
     if (this.permits > 0) {
       this.permits--;
@@ -0,0 +1,236 @@
+// Shared status poller — one upstream fetch loop per resource ID, no matter how
+// many tasks or sessions are waiting on it. Intervals back off while progress
+// stalls and snap back when it moves; every waiter wakes on the same fetch.
+
+import type { Exa } from 'exa-js';
+
+export type PollOutcome = 'pending' | 'done' | 'failed';
+
+export interface StatusPollerOptions<T> {
+  fetch: (id: string) => Promise<T>;
+  classify: (resource: T) => PollOutcome;
+  failureMessage: (id: string, resource: T) => string;
+  /** Fingerprint of observable progress; a change resets the backoff. */
+  progressKey?: (resource: T) => string;
+  /** True when the resource is about to finish and should be polled eagerly. */
+  nearlyDone?: (resource: T) => boolean;
+  minIntervalMs?: number;
+  maxIntervalMs?: number;
+  backoffFactor?: number;
+}
+
+export interface WaitOptions<T> {
+  timeoutMs: number;
+  /** Upper bound on the interval between fetches while this waiter is active. */
+  maxIntervalMs?: number;
+  onUpdate?: (resource: T) => void;
+  shouldStop?: () => boolean;
+}
+
+export interface WaitResult<T> {
+  resource: T;
+  timedOut: boolean;
+  stopped: boolean;
+}
+
+export interface PollerStats {
+  watched: number;
+  waiters: number;
+  fetches: number;
+  coalesced: number;
+}
+
+interface Waiter<T> {
+  deadline: number;
+  opts: WaitOptions<T>;
+  resolve: (result: WaitResult<T>) => void;
+  reject: (error: unknown) => void;
+}
+
+interface Entry<T> {
+  waiters: Set<Waiter<T>>;
+  timer: ReturnType<typeof setTimeout> | null;
+  fireAt: number;
+  inFlight: boolean;
+  intervalMs: number;
+  lastKey: string | undefined;
+}
+
+const DEFAULT_MIN_INTERVAL_MS = 1_000;
+const DEFAULT_MAX_INTERVAL_MS = 8_000;
+const DEFAULT_BACKOFF_FACTOR = 1.5;
+
+export class StatusPoller<T> {
+  private entries = new Map<string, Entry<T>>();
+  private minIntervalMs: number;
+  private maxIntervalMs: number;
+  private backoffFactor: number;
+  private fetches = 0;
+  private coalesced = 0;
+
+  constructor(private options: StatusPollerOptions<T>) {
+    this.minIntervalMs = options.minIntervalMs ?? DEFAULT_MIN_INTERVAL_MS;
+    this.maxIntervalMs = options.maxIntervalMs ?? DEFAULT_MAX_INTERVAL_MS;
+    this.backoffFactor = options.backoffFactor ?? DEFAULT_BACKOFF_FACTOR;
+  }
+
+  waitFor(id: string, opts: WaitOptions<T>): Promise<WaitResult<T>> {
+    return new Promise<WaitResult<T>>((resolve, reject) => {
+      const waiter: Waiter<T> = { deadline: Date.now() + opts.timeoutMs, opts, resolve, reject };
+      let entry = this.entries.get(id);
+      if (entry) {
+        this.coalesced++;
+        entry.waiters.add(waiter);
+        // A newcomer with a tighter deadline or interval pulls the next fetch forward
+        if (entry.timer) {
+          const wanted = Math.min(waiter.deadline, Date.now() + (opts.maxIntervalMs ?? Infinity));
+          if (wanted < entry.fireAt) this.schedule(id, entry, Math.max(0, wanted - Date.now()));
+        }
+        return;
+      }
+      entry = {
+        waiters: new Set([waiter]),
+        timer: null,
+        fireAt: 0,
+        inFlight: false,
+        intervalMs: this.minIntervalMs,
+        lastKey: undefined,
+      };
+      this.entries.set(id, entry);
+      void this.tick(id, entry);
+    });
+  }
+
+  /**
+   * Feed a status fetched elsewhere (e.g. a direct get call) into the poller.
+   * Waiters on a finished resource are released without waiting for the next tick.
+   */
+  observe(id: string, resource: T): void {
+    const entry = this.entries.get(id);
+    if (!entry || this.options.classify(resource) === 'pending') return;
+    this.settle(id, entry, resource);
+  }
+
+  stats(): PollerStats {
+    let waiters = 0;
+    for (const entry of this.entries.values()) waiters += entry.waiters.size;
+    return { watched: this.entries.size, waiters, fetches: this.fetches, coalesced: this.coalesced };
+  }
+
+  private async tick(id: string, entry: Entry<T>): Promise<void> {
+    entry.timer = null;
+    entry.inFlight = true;
+    let resource: T;
+    try {
+      this.fetches++;
+      resource = await this.options.fetch(id);
+    } catch (error) {
+      entry.inFlight = false;
+      this.entries.delete(id);
+      for (const w of entry.waiters) w.reject(error);
+      entry.waiters.clear();
+      return;
+    }
+    entry.inFlight = false;
+    if (this.entries.get(id) !== entry) return;
+    this.settle(id, entry, resource);
+  }
+
+  private settle(id: string, entry: Entry<T>, resource: T): void {
+    const outcome = this.options.classify(resource);
+    const now = Date.now();
+
+    for (const w of [...entry.waiters]) {
+      if (outcome === 'done') {
+        w.resolve({ resource, timedOut: false, stopped: false });
+      } else if (outcome === 'failed') {
+        w.reject(new Error(this.options.failureMessage(id, resource)));
+      } else if (now >= w.deadline) {
+        w.resolve({ resource, timedOut: true, stopped: false });
+      } else {
+        try {
+          w.opts.onUpdate?.(resource);
+          if (!w.opts.shouldStop?.()) continue;
+          w.resolve({ resource, timedOut: false, stopped: true });
+        } catch (error) {
+          w.reject(error);
+        }
+      }
+      entry.waiters.delete(w);
+    }
+
+    if (entry.waiters.size === 0) {
+      if (entry.timer) clearTimeout(entry.timer);
+      this.entries.delete(id);
+      return;
+    }
+    if (entry.inFlight || entry.timer) return;
+
+    this.adjustInterval(entry, resource);
+    let delay = entry.intervalMs;
+    for (const w of entry.waiters) {
+      if (w.opts.maxIntervalMs !== undefined) delay = Math.min(delay, w.opts.maxIntervalMs);
+      delay = Math.min(delay, Math.max(0, w.deadline - now));
+    }
+    this.schedule(id, entry, delay);
+  }
+
+  private schedule(id: string, entry: Entry<T>, delay: number): void {
+    if (entry.timer) clearTimeout(entry.timer);
+    entry.fireAt = Date.now() + delay;
+    entry.timer = setTimeout(() => void this.tick(id, entry), delay);
+  }
+
+  private adjustInterval(entry: Entry<T>, resource: T): void {
+    const key = this.options.progressKey?.(resource);
+    if (this.options.nearlyDone?.(resource) || (key !== undefined && key !== entry.lastKey)) {
+      entry.intervalMs = this.minIntervalMs;
+    } else {
+      entry.intervalMs = Math.min(entry.intervalMs * this.backoffFactor, this.maxIntervalMs);
+    }
+    entry.lastKey = key;
+  }
+}
+
+// --- Webset and import pollers (one per Exa client) ---
+
+function lastSearchProgress(webset: any): { found?: number; analyzed?: number; completion?: number } | undefined {
+  const searches = webset?.searches as any[] | undefined;
+  return searches?.[searches.length - 1]?.progress;
+}
+
+const websetPollers = new WeakMap<Exa, StatusPoller<any>>();
+const importPollers = new WeakMap<Exa, StatusPoller<any>>();
+
+export function getWebsetPoller(exa: Exa): StatusPoller<any> {
+  let poller = websetPollers.get(exa);
+  if (!poller) {
+    poller = new StatusPoller<any>({
+      fetch: id => exa.websets.get(id),
+      classify: ws => (ws.status === 'idle' ? 'done' : ws.status === 'paused' ? 'failed' : 'pending'),
+      failureMessage: () => 'Webset was paused unexpectedly',
+      progressKey: ws => {
+        const prog = lastSearchProgress(ws);
+        return `${ws.status}:${prog?.found ?? ''}/${prog?.analyzed ?? ''}`;
+      },
+      nearlyDone: ws => (lastSearchProgress(ws)?.completion ?? 0) >= 90,
+    });
+    websetPollers.set(exa, poller);
+  }
+  return poller;
+}
+
+export function getImportPoller(exa: Exa): StatusPoller<any> {
+  let poller = importPollers.get(exa);
+  if (!poller) {
+    poller = new StatusPoller<any>({
+      fetch: id => exa.websets.imports.get(id),
+      classify: imp => (imp.status === 'completed' ? 'done' : imp.status === 'failed' ? 'failed' : 'pending'),
+      failureMessage: (id, imp) => `Import ${id} failed: ${imp.failedMessage ?? imp.failedReason ?? 'unknown reason'}`,
+      progressKey: imp => `${imp.status}:${imp.count ?? ''}`,
+      minIntervalMs: 2_000,
+    });
+    importPollers.set(exa, poller);
+  }
+  return poller;
+}
@@ -29,30 +29,109 @@ export interface TaskState<T = unknown> {
   expiresAt: string;
 }
 
+/**
+ * Storage behind the TaskStore. The store keeps its working set in memory and
+ * writes changed tasks through in batches; a durable backend replays them on
+ * startup so interrupted tasks can be resumed.
+ */
+export interface TaskBackend {
+  readonly durable: boolean;
+  load(): TaskState[];
+  /** Persist changed tasks and deletions. `snapshot` returns every live task, for compaction. */
+  write(upserts: TaskState[], deletes: string[], snapshot: () => TaskState[]): void;
+  close(): void;
+}
+
+export class MemoryTaskBackend implements TaskBackend {
+  readonly durable = false;
+  load(): TaskState[] {
+    return [];
+  }
+  write(): void {}
+  close(): void {}
+}
+
 const DEFAULT_TTL_MS = 60 * 60 * 1000; // 1 hour
 const CLEANUP_INTERVAL_MS = 5 * 60 * 1000; // 5 minutes
-const MAX_CONCURRENT = 20;
+const PERSIST_DEBOUNCE_MS = 250;
 
 export class TaskStore {
   private tasks = new Map<string, TaskState>();
   private cleanupTimer: ReturnType<typeof setInterval> | null = null;
   private ttlMs: number;
+  private backend: TaskBackend;
+  private dirty = new Set<string>();
+  private deleted = new Set<string>();
+  private persistTimer: ReturnType<typeof setTimeout> | null = null;
+  private interrupted: TaskState[] = [];
 
-  constructor(ttlMs = DEFAULT_TTL_MS) {
+  constructor(ttlMs = DEFAULT_TTL_MS, backend: TaskBackend = new MemoryTaskBackend()) {
     this.ttlMs = ttlMs;
+    this.backend = backend;
+    this.loadFrom(backend);
     this.cleanupTimer = setInterval(() => this.cleanup(), CLEANUP_INTERVAL_MS);
     // Don't keep the process alive just for cleanup
     if (this.cleanupTimer.unref) this.cleanupTimer.unref();
   }
 
-  create(type: string, args: Record<string, unknown>): TaskState {
-    const activeCount = [...this.tasks.values()].filter(
-      t => t.status === 'pending' || t.status === 'working',
-    ).length;
-    if (activeCount >= MAX_CONCURRENT) {
-      throw new Error(`Max concurrent tasks (${MAX_CONCURRENT}) reached. Cancel or wait for existing tasks.`);
+  /**
+   * Switch to a different backend (e.g. a durable one chosen at startup).
+   * Tasks it holds are loaded; tasks already in memory are written to it.
+   */
+  attachBackend(backend: TaskBackend): void {
+    this.flush();
+    this.backend.close();
+    this.backend = backend;
+    for (const id of this.tasks.keys()) this.dirty.add(id);
+    this.loadFrom(backend);
+    this.flush();
+  }
+
+  /** Tasks that were pending or working when the backend was last written. Returned once. */
+  takeInterrupted(): TaskState[] {
+    const tasks = this.interrupted.filter(t => this.tasks.get(t.id) === t);
+    this.interrupted = [];
+    return tasks;
+  }
+
+  /** Write pending changes to the backend now. */
+  flush(): void {
+    if (this.persistTimer) {
+      clearTimeout(this.persistTimer);
+      this.persistTimer = null;
     }
+    if (this.dirty.size === 0 && this.deleted.size === 0) return;
+    const upserts = [...this.dirty]
+      .map(id => this.tasks.get(id))
+      .filter((t): t is TaskState => t !== undefined);
+    const deletes = [...this.deleted];
+    this.dirty.clear();
+    this.deleted.clear();
+    this.backend.write(upserts, deletes, () => [...this.tasks.values()]);
+  }
+
+  private loadFrom(backend: TaskBackend): void {
+    for (const task of backend.load()) {
+      this.tasks.set(task.id, task);
+      if (task.status === 'pending' || task.status === 'working') {
+        this.interrupted.push(task);
+      }
+    }
+  }
 
+  private persist(id: string): void {
+    if (!this.backend.durable) return;
+    this.dirty.add(id);
+    this.schedulePersist();
+  }
+
+  private schedulePersist(): void {
+    if (this.persistTimer) return;
+    this.persistTimer = setTimeout(() => this.flush(), PERSIST_DEBOUNCE_MS);
+    if (this.persistTimer.unref) this.persistTimer.unref();
+  }
+
+  create(type: string, args: Record<string, unknown>): TaskState {
     const now = new Date().toISOString();
     const task: TaskState = {
       id: `task_${randomUUID()}`,
@@ -68,6 +147,7 @@ export class TaskStore {
       expiresAt: '', // set on completion
     };
     this.tasks.set(task.id, task);
+    this.persist(task.id);
     return task;
   }
 
@@ -87,6 +167,7 @@ export class TaskStore {
     task.status = 'working';
     task.progress = progress;
     task.updatedAt = new Date().toISOString();
+    this.persist(id);
   }
 
   setResult(id: string, result: unknown): void {
@@ -96,6 +177,7 @@ export class TaskStore {
     task.result = result;
     task.updatedAt = new Date().toISOString();
     task.expiresAt = new Date(Date.now() + this.ttlMs).toISOString();
+    this.persist(id);
   }
 
   setPartialResult(id: string, partial: unknown): void {
@@ -103,6 +185,7 @@ export class TaskStore {
     if (!task) return;
     task.partialResult = partial;
     task.updatedAt = new Date().toISOString();
+    this.persist(id);
   }
 
   setError(id: string, error: TaskError): void {
@@ -112,6 +195,7 @@ export class TaskStore {
     task.error = error;
     task.updatedAt = new Date().toISOString();
     task.expiresAt = new Date(Date.now() + this.ttlMs).toISOString();
+    this.persist(id);
   }
 
   cancel(id: string): boolean {
@@ -121,6 +205,7 @@ export class TaskStore {
     task.status = 'cancelled';
     task.updatedAt = new Date().toISOString();
     task.expiresAt = new Date(Date.now() + this.ttlMs).toISOString();
+    this.persist(id);
     return true;
   }
 
@@ -130,9 +215,14 @@ export class TaskStore {
     for (const [id, task] of this.tasks) {
       if (task.expiresAt && new Date(task.expiresAt).getTime() <= now) {
         this.tasks.delete(id);
+        if (this.backend.durable) {
+          this.dirty.delete(id);
+          this.deleted.add(id);
+        }
         removed++;
       }
     }
+    if (removed > 0 && this.backend.durable) this.schedulePersist();
     return removed;
   }
 
@@ -141,6 +231,8 @@ export class TaskStore {
       clearInterval(this.cleanupTimer);
       this.cleanupTimer = null;
     }
+    this.flush();
+    this.backend.close();
     this.tasks.clear();
   }
 }
@@ -4,13 +4,29 @@ import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js";
 import { StreamableHTTPServerTransport } from "@modelcontextprotocol/sdk/server/streamableHttp.js";
 import { Exa } from "exa-js";
 import { registerManageWebsetsTool } from "./tools/manageWebsets.js";
+import { taskStore, type TaskStatus } from "./lib/taskStore.js";
+import { FileTaskBackend } from "./lib/fileTaskBackend.js";
+import { resumeInterruptedTasks } from "./workflows/runner.js";
+import { apiPools, taskScheduler, withApiPools, type ApiPool } from "./lib/scheduler.js";
+import { metrics, withUpstreamMetrics, PROMETHEUS_CONTENT_TYPE, type Sample } from "./lib/metrics.js";
+import { getWebsetPoller } from "./lib/statusPoller.js";
+import { ResponseCache, withResponseCache, type ResponseCacheOptions } from "./lib/responseCache.js";
+import type { OutputFormat } from "./handlers/types.js";
 import type { Express, Request, Response } from "express";
 
 export interface ServerConfig {
   exaApiKey: string;
+  /** Exa API base URL; points the server at a mock API in load tests. */
+  exaBaseUrl?: string;
   host?: string;
   sessionTimeoutMs?: number;
   defaultCompatMode?: 'safe' | 'strict';
+  /** Default JSON format of tool results; per-call `output` overrides it. */
+  defaultOutputFormat?: OutputFormat;
+  /** Path of a task log; when set, tasks survive restarts and interrupted workflows resume. */
+  taskStorePath?: string;
+  /** Cache for search/findSimilar/getContents/answer responses; false disables it. */
+  responseCache?: ResponseCacheOptions | false;
 }
 
 export interface ServerInstance {
@@ -38,11 +54,40 @@ export function createServer(config: ServerConfig): ServerInstance {
     res.json({ status: 'ok' });
   });
 
-  const exa = new Exa(config.exaApiKey || 'dummy-key-for-testing');
+  // Every session shares one client, so the per-API concurrency pools and the
+  // response cache are global. Cache hits never take a pool slot.
+  const responseCache = config.responseCache === false ? null : new ResponseCache(config.responseCache);
+  const pooledExa = withApiPools(withUpstreamMetrics(new Exa(config.exaApiKey || 'dummy-key-for-testing', config.exaBaseUrl)));
+  const exa = responseCache ? withResponseCache(pooledExa, responseCache) : pooledExa;
+
+  if (config.taskStorePath) {
+    taskStore.attachBackend(new FileTaskBackend(config.taskStorePath));
+    const resumed = resumeInterruptedTasks(exa, taskStore);
+    if (resumed.length > 0) {
+      console.log(`Resumed ${resumed.length} interrupted task(s)`);
+    }
+  }
+
   const sessions = new Map<string, SessionEntry>();
   const pendingSessions = new Set<string>();
   const sessionTimeoutMs = config.sessionTimeoutMs ?? DEFAULT_SESSION_TIMEOUT_MS;
 
+  // Runtime counters: open sessions and response cache hit/miss rates
+  app.get('/stats', (_req: Request, res: Response) => {
+    res.json({
+      sessions: sessions.size,
+      responseCache: responseCache?.stats() ?? null,
+    });
+  });
+
+  registerRuntimeMetrics(sessions, exa, responseCache);
+
+  // Prometheus scrape endpoint
+  app.get('/metrics', (_req: Request, res: Response) => {
+    res.setHeader('Content-Type', PROMETHEUS_CONTENT_TYPE);
+    res.send(metrics.render());
+  });
+
   // Helper to schedule session cleanup
   const scheduleSessionCleanup = (sessionId: string) => {
     const entry = sessions.get(sessionId);
@@ -124,6 +169,7 @@ export function createServer(config: ServerConfig): ServerInstance {
 
         registerManageWebsetsTool(server, exa, {
           defaultCompatMode: config.defaultCompatMode ?? 'strict',
+          defaultOutputFormat: config.defaultOutputFormat ?? 'pretty',
         });
 
         transport.onclose = () => {
@@ -168,3 +214,46 @@ export function createServer(config: ServerConfig): ServerInstance {
 
   return { app, sessions };
 }
+
+const TASK_STATUSES: TaskStatus[] = ['pending', 'working', 'completed', 'failed', 'cancelled'];
+
+/** Gauges read from live state when /metrics is scraped; nothing is tracked per request. */
+function registerRuntimeMetrics(
+  sessions: Map<string, SessionEntry>,
+  exa: Exa,
+  responseCache: ResponseCache | null,
+): void {
+  metrics.collect('websets_sessions', 'Open MCP sessions', 'gauge', () => sessions.size);
+
+  metrics.collect('websets_tasks', 'Tasks held in the task store by status', 'gauge', () => {
+    const counts = new Map<TaskStatus, number>(TASK_STATUSES.map(s => [s, 0]));
+    for (const task of taskStore.list()) counts.set(task.status, (counts.get(task.status) ?? 0) + 1);
+    return TASK_STATUSES.map((s): Sample => [[s], counts.get(s)!]);
+  }, ['status']);
+
+  metrics.collect('websets_scheduler_tasks', 'Background tasks running or waiting for a worker', 'gauge', () => {
+    const stats = taskScheduler.stats();
+    const samples: Sample[] = [[['running'], stats.running], [['queued'], stats.queued]];
+    return samples;
+  }, ['state']);
+
+  const pools = Object.keys(apiPools) as ApiPool[];
+  metrics.collect('websets_api_pool_waiting', 'Calls queued for an upstream API pool slot', 'gauge',
+    () => pools.map((pool): Sample => [[pool], apiPools[pool].waiting]), ['pool']);
+  metrics.collect('websets_api_pool_available', 'Free upstream API pool slots', 'gauge',
+    () => pools.map((pool): Sample => [[pool], apiPools[pool].available]), ['pool']);
+
+  metrics.collect('websets_poll_fetches_total', 'Status fetches made by the shared webset poller', 'counter',
+    () => getWebsetPoller(exa).stats().fetches);
+  metrics.collect('websets_poll_waiters', 'Callers waiting on the shared webset poller', 'gauge',
+    () => getWebsetPoller(exa).stats().waiters);
+
+  if (responseCache) {
+    const cacheOps = (field: 'hits' | 'misses') => () =>
+      Object.entries(responseCache.stats().operations).map(([op, s]): Sample => [[op], s[field]]);
+    metrics.collect('websets_response_cache_hits_total', 'Response cache hits by operation', 'counter', cacheOps('hits'), ['operation']);
+    metrics.collect('websets_response_cache_misses_total', 'Response cache misses by operation', 'counter', cacheOps('misses'), ['operation']);
+    metrics.collect('websets_response_cache_bytes', 'Bytes held in the in-memory response cache', 'gauge',
+      () => responseCache.stats().bytes);
+  }
+}
@@ -0,0 +1,65 @@
+// The result serialization manage_websets used before results were serialized
+// once at the dispatch boundary: successResult pretty-printed the data, and
+// withCoercionMetadata parsed that text back to attach _coercions/_warnings
+// and pretty-printed it again. Kept verbatim as the benchmark baseline.
+import type { ToolResult } from '../../../handlers/types.js';
+import type { AppliedCoercion } from '../../coercion.js';
+
+export function legacySuccessResult(data: unknown): ToolResult {
+  return {
+    content: [{ type: 'text', text: JSON.stringify(data, null, 2) }],
+  };
+}
+
+export function legacyWithCoercionMetadata(
+  result: ToolResult,
+  coercions: AppliedCoercion[],
+  warnings: string[],
+): ToolResult {
+  if (coercions.length === 0 && warnings.length === 0) return result;
+
+  if (result.isError) {
+    const lines: string[] = [];
+    if (coercions.length > 0) {
+      lines.push('Coercions applied:');
+      for (const c of coercions) {
+        lines.push(`- ${c.path}: ${c.from} -> ${c.to}`);
+      }
+    }
+    if (warnings.length > 0) {
+      lines.push('Warnings:');
+      for (const w of warnings) {
+        lines.push(`- ${w}`);
+      }
+    }
+
+    return {
+      ...result,
+      content: [{
+        type: 'text',
+        text: `${result.content[0]?.text ?? ''}\n\n${lines.join('\n')}`.trim(),
+      }],
+    };
+  }
+
+  const rawText = result.content[0]?.text;
+  if (!rawText) return result;
+
+  try {
+    const parsed = JSON.parse(rawText) as unknown;
+    if (!parsed || typeof parsed !== 'object' || Array.isArray(parsed)) {
+      return result;
+    }
+
+    const enriched = parsed as Record<string, unknown>;
+    if (coercions.length > 0) enriched._coercions = coercions;
+    if (warnings.length > 0) enriched._warnings = warnings;
+
+    return {
+      ...result,
+      content: [{ type: 'text', text: JSON.stringify(enriched, null, 2) }],
+    };
+  } catch {
+    return result;
+  }
+}
@@ -0,0 +1,67 @@
+// Run with `npm run bench`. Compares how manage_websets serializes a large
+// result with coercion metadata: the baseline (successResult pretty-prints,
+// then withCoercionMetadata parses and re-stringifies to attach _coercions,
+// kept in fixtures/legacySerialization.ts) against the current
+// successResult -> withCoercionMetadata path in pretty and compact formats.
+import { bench, describe } from 'vitest';
+import { successResult } from '../../handlers/types.js';
+import type { OutputFormat } from '../../handlers/types.js';
+import type { AppliedCoercion } from '../coercion.js';
+import { withCoercionMetadata } from '../manageWebsets.js';
+import { legacySuccessResult, legacyWithCoercionMetadata } from './fixtures/legacySerialization.js';
+
+const ITEMS = 3_000;
+
+function syntheticItem(i: number) {
+  return {
+    id: `witem_${i}`,
+    name: `Company ${i}`,
+    url: `https://company${i}.example.com`,
+    entityType: 'company',
+    description: 'Builds infrastructure for distributed data pipelines. '.repeat(4),
+    evaluations: [{ criterion: 'Series A or later', satisfied: 'yes' }],
+    enrichments: {
+      'Number of employees': String(50 + (i % 400)),
+      'Latest funding round': ['Seed', 'Series A', 'Series B'][i % 3],
+      'Headquarters': 'San Francisco, CA',
+    },
+    createdAt: new Date(Date.UTC(2026, 0, 1) + i * 60_000).toISOString(),
+  };
+}
+
+const payload = { data: Array.from({ length: ITEMS }, (_, i) => syntheticItem(i)), total: ITEMS };
+const coercions: AppliedCoercion[] = [{ path: 'args.maxItems', from: 'string', to: 'number' }];
+
+// Each run reads the text, as the MCP transport does when it sends the result
+function legacy(): string {
+  return legacyWithCoercionMetadata(legacySuccessResult(payload), coercions, []).content[0].text;
+}
+
+function current(format: OutputFormat): string {
+  return withCoercionMetadata(successResult(payload), coercions, [], format).content[0].text;
+}
+
+const legacyText = legacy();
+if (current('pretty') !== legacyText) {
+  throw new Error('pretty output differs from the baseline');
+}
+const legacyBytes = Buffer.byteLength(legacyText);
+const compactBytes = Buffer.byteLength(current('compact'));
+console.log(
+  `payload: ${ITEMS} items, pretty ${(legacyBytes / 1e6).toFixed(2)} MB, ` +
+  `compact ${(compactBytes / 1e6).toFixed(2)} MB (${((1 - compactBytes / legacyBytes) * 100).toFixed(0)}% smaller)`,
+);
+
+describe('manage_websets result serialization with coercion metadata', () => {
+  bench('baseline: pretty stringify, parse, re-stringify', () => {
+    legacy();
+  });
+
+  bench('successResult -> withCoercionMetadata, pretty', () => {
+    current('pretty');
+  });
+
+  bench('successResult -> withCoercionMetadata, compact', () => {
+    current('compact');
+  });
+});
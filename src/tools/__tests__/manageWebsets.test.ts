@@ -1,7 +1,10 @@
 import { describe, it, expect, vi } from 'vitest';
 import { registerManageWebsetsTool } from '../manageWebsets.js';
 
-function setupTool(exa: any, options?: { defaultCompatMode?: 'safe' | 'strict' }) {
+function setupTool(
+  exa: any,
+  options?: { defaultCompatMode?: 'safe' | 'strict'; defaultOutputFormat?: 'pretty' | 'compact' },
+) {
   let handler: ((input: any) => Promise<any>) | null = null;
   let inputSchema: { parse: (input: unknown) => unknown } | null = null;
 
@@ -237,6 +240,56 @@ describe('registerManageWebsetsTool', () => {
     expect(body._coercions).toHaveLength(1);
   });
 
+  it('writes compact output in one pass, including coercion metadata', async () => {
+    const exa = {
+      websets: {
+        searches: {
+          create: vi.fn().mockResolvedValue({ id: 'search_1', status: 'completed', query: 'ai startups' }),
+        },
+      },
+    } as any;
+
+    const { call } = setupTool(exa);
+    const parseSpy = vi.spyOn(JSON, 'parse');
+    let result: any;
+    try {
+      result = await call({
+        operation: 'searches.create',
+        output: 'compact',
+        compat: { mode: 'safe' },
+        websetId: 'ws_1',
+        query: 'ai startups',
+        entity: 'company',
+      });
+      expect(parseSpy).not.toHaveBeenCalled();
+    } finally {
+      parseSpy.mockRestore();
+    }
+
+    const text = result.content[0].text as string;
+    expect(text).not.toContain('\n');
+    const body = JSON.parse(text);
+    expect(body.id).toBe('search_1');
+    expect(body._coercions).toHaveLength(1);
+  });
+
+  it('honors server-level output format and per-call override', async () => {
+    const exa = {
+      websets: {
+        get: vi.fn().mockResolvedValue({ id: 'ws_1', status: 'idle' }),
+      },
+    } as any;
+
+    const { call } = setupTool(exa, { defaultOutputFormat: 'compact' });
+
+    const compact = await call({ operation: 'websets.get', id: 'ws_1' });
+    expect(compact.content[0].text).not.toContain('\n');
+
+    const pretty = await call({ operation: 'websets.get', id: 'ws_1', output: 'pretty' });
+    expect(pretty.content[0].text).toContain('\n  ');
+    expect(JSON.parse(pretty.content[0].text)).toEqual(JSON.parse(compact.content[0].text));
+  });
+
   it('preserves enrichment options when creating websets', async () => {
     const createSpy = vi.fn().mockResolvedValue({
       id: 'ws_1',
@@ -1,8 +1,16 @@
 import { z } from 'zod';
 import { McpServer } from '@modelcontextprotocol/sdk/server/mcp.js';
 import type { Exa } from 'exa-js';
-import type { OperationHandler, ToolResult } from '../handlers/types.js';
+import {
+  resultPayload,
+  serializeData,
+  successResult,
+  type OperationHandler,
+  type OutputFormat,
+  type ToolResult,
+} from '../handlers/types.js';
 import { createRequestLogger } from '../utils/logger.js';
+import { operationDuration, secondsSince } from '../lib/metrics.js';
 
 import * as websets from '../handlers/websets.js';
 import * as searches from '../handlers/searches.js';
@@ -168,18 +176,36 @@ function buildInputSchema() {
   return z.object({
     operation: z.enum(OPERATION_NAMES).describe('The operation to perform'),
     args: z.record(z.string(), z.unknown()).optional().describe('Legacy operation-specific arguments envelope'),
+    output: z.enum(['pretty', 'compact']).optional().describe('Result JSON format: pretty (indented) or compact (smaller, for large results)'),
   }).catchall(z.unknown());
 }
 
 interface ManageWebsetsOptions {
   defaultCompatMode?: CompatMode;
+  /** Format of successful results; a per-call `output` takes precedence. */
+  defaultOutputFormat?: OutputFormat;
 }
 
-function withCoercionMetadata(
+/** Attach coercion metadata and warnings to a handler result, serialized in `format`. */
+export function withCoercionMetadata(
   result: ToolResult,
   coercions: AppliedCoercion[],
   warnings: string[],
+  format: OutputFormat = 'pretty',
 ): ToolResult {
+  // Results from successResult still carry their data: serialize it exactly once
+  const payload = resultPayload(result);
+  if (payload) {
+    let data = payload.data;
+    if ((coercions.length > 0 || warnings.length > 0) && isRecord(data)) {
+      const enriched: Record<string, unknown> = { ...data };
+      if (coercions.length > 0) enriched._coercions = coercions;
+      if (warnings.length > 0) enriched._warnings = warnings;
+      data = enriched;
+    }
+    return { content: [{ type: 'text', text: serializeData(data, format) }] };
+  }
+
   if (coercions.length === 0 && warnings.length === 0) return result;
 
   if (result.isError) {
@@ -221,7 +247,7 @@ function withCoercionMetadata(
 
     return {
       ...result,
-      content: [{ type: 'text', text: JSON.stringify(enriched, null, 2) }],
+      content: [{ type: 'text', text: serializeData(enriched, format) }],
     };
   } catch {
     return result;
@@ -272,16 +298,18 @@ function isRecord(value: unknown): value is Record<string, unknown> {
 function normalizeInput(input: Record<string, unknown>): {
   operation: string;
   args: Record<string, unknown>;
+  output?: OutputFormat;
 } {
   const operation = String(input.operation);
   const legacyArgs = isRecord(input.args) ? input.args : {};
-  const { operation: _operation, args: _args, ...rest } = input;
+  const { operation: _operation, args: _args, output, ...rest } = input;
   return {
     operation,
     args: {
       ...legacyArgs,
       ...(rest as Record<string, unknown>),
     },
+    output: output as OutputFormat | undefined,
   };
 }
 
@@ -308,6 +336,7 @@ export function registerManageWebsetsTool(
   options: ManageWebsetsOptions = {},
 ): void {
   const defaultCompatMode = options.defaultCompatMode ?? 'strict';
+  const defaultOutputFormat = options.defaultOutputFormat ?? 'pretty';
 
   server.registerTool(
     'manage_websets',
@@ -315,8 +344,10 @@ export function registerManageWebsetsTool(
       description: buildToolDescription(),
       inputSchema: buildInputSchema() as any,
     },
-    async (input: any) => {
-      const { operation, args } = normalizeInput(input as Record<string, unknown>);
+    async (input: any, extra?: { sessionId?: string }) => {
+      const { operation, args, output } = normalizeInput(input as Record<string, unknown>);
+      const format = output ?? defaultOutputFormat;
+      const start = performance.now();
       const requestId = `manage_websets-${Date.now()}-${Math.random().toString(36).substring(2, 7)}`;
       const logger = createRequestLogger(requestId, operation);
 
@@ -340,6 +371,7 @@ export function registerManageWebsetsTool(
       if (!validation.success) {
         logger.error(validation.error.message);
         const validationResult = formatValidationError(operation, validation.error.issues);
+        operationDuration.observe(secondsSince(start), operation, 'invalid');
         return withCoercionMetadata(
           validationResult,
           coercion.coercions,
@@ -350,30 +382,27 @@ export function registerManageWebsetsTool(
 
       // Handle dry-run preview if requested via compat.preview
       if ((coercion as any).preview) {
-        const previewResult: ToolResult = {
-          content: [{
-            type: 'text',
-            text: JSON.stringify({
-              preview: true,
-              operation,
-              execution: 'skipped',
-              effectiveCompatMode: (coercion as any).effectiveMode || defaultCompatMode,
-              normalizedArgs: validatedArgs,
-            }, null, 2),
-          }],
-        };
+        const previewResult = successResult({
+          preview: true,
+          operation,
+          execution: 'skipped',
+          effectiveCompatMode: (coercion as any).effectiveMode || defaultCompatMode,
+          normalizedArgs: validatedArgs,
+        });
 
         const finalPreviewResult = withCoercionMetadata(
           previewResult,
           coercion.coercions,
           coercion.warnings,
+          format,
         );
         logger.complete();
         return finalPreviewResult;
       }
 
-      const result = await meta.handler(validatedArgs, exa);
-      const finalResult = withCoercionMetadata(result, coercion.coercions, coercion.warnings);
+      const result = await meta.handler(validatedArgs, exa, { sessionId: extra?.sessionId });
+      const finalResult = withCoercionMetadata(result, coercion.coercions, coercion.warnings, format);
+      operationDuration.observe(secondsSince(start), operation, finalResult.isError ? 'error' : 'ok');
 
       if (finalResult.isError) {
         logger.error(finalResult.content[0]?.text || 'Unknown error');
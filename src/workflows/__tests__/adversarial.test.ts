@@ -139,6 +139,44 @@ describe('adversarial.verify workflow', () => {
     store.dispose();
   });
 
+  it('resumes with checkpointed websets and research instead of creating new ones', async () => {
+    const mockExa = createMockExa(mockItems('t', 2), mockItems('a', 1));
+    const task = store.create('adversarial.verify', {
+      thesis: 'claim',
+      thesisQuery: 'q1',
+      antithesisQuery: 'q2',
+      synthesize: true,
+    });
+    store.setPartialResult(task.id, {
+      thesisWebsetId: 'ws_t',
+      antithesisWebsetId: 'ws_a',
+      synthesisResearchId: 'res_running',
+    });
+
+    const result = (await workflow(task.id, task.args, mockExa, store)) as any;
+
+    expect(result.thesis.websetId).toBe('ws_t');
+    expect(result.antithesis.websetId).toBe('ws_a');
+    expect(result.synthesis.researchId).toBe('res_running');
+    expect(mockExa.websets.create).not.toHaveBeenCalled();
+    expect(mockExa.research.create).not.toHaveBeenCalled();
+    expect(mockExa.research.pollUntilFinished.mock.calls[0][0]).toBe('res_running');
+    store.dispose();
+  });
+
+  it('resumes after the thesis webset was created', async () => {
+    const mockExa = createMockExa(mockItems('t', 1), mockItems('a', 1));
+    const task = store.create('adversarial.verify', { thesis: 'claim', thesisQuery: 'q1', antithesisQuery: 'q2' });
+    store.setPartialResult(task.id, { thesisWebsetId: 'ws_t' });
+
+    const result = (await workflow(task.id, task.args, mockExa, store)) as any;
+
+    expect(result.thesis.websetId).toBe('ws_t');
+    expect(result.antithesis.websetId).toBe('ws_1');
+    expect(mockExa.websets.create).toHaveBeenCalledTimes(1);
+    store.dispose();
+  });
+
   it('handles synthesis failure gracefully', async () => {
     const mockExa = createMockExa(mockItems('t', 1), mockItems('a', 1));
     mockExa.research.create.mockRejectedValue(new Error('API rate limit'));
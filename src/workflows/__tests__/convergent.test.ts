@@ -195,6 +195,34 @@ describe('convergent.search workflow', () => {
     store.dispose();
   });
 
+  it('resumes with checkpointed websets and creates only the missing ones', async () => {
+    const mockExa = {
+      websets: {
+        create: vi.fn().mockResolvedValue({ id: 'ws_new', status: 'idle', searches: [] }),
+        get: vi.fn().mockImplementation(async (id: string) => ({ id, status: 'idle', searches: [] })),
+        cancel: vi.fn(),
+        items: {
+          listAll: vi.fn().mockImplementation(() => (async function* () {})()),
+        },
+      },
+    } as any;
+
+    const task = store.create('convergent.search', {
+      queries: ['q1', 'q2', 'q3'],
+      entity: { type: 'company' },
+    });
+    store.setPartialResult(task.id, { websetIds: ['ws_a', 'ws_b'] });
+
+    const result = (await workflow(task.id, task.args, mockExa, store)) as any;
+
+    expect(result.websetIds).toEqual(['ws_a', 'ws_b', 'ws_new']);
+    expect(mockExa.websets.create).toHaveBeenCalledTimes(1);
+    expect(mockExa.websets.create).toHaveBeenCalledWith(
+      expect.objectContaining({ search: expect.objectContaining({ query: 'q3' }) }),
+    );
+    store.dispose();
+  });
+
   it('returns null when cancelled', async () => {
     const mockExa = {
       websets: {
@@ -94,6 +94,19 @@ describe('lifecycle.harvest workflow', () => {
     store.dispose();
   });
 
+  it('resumes with the checkpointed webset instead of creating another', async () => {
+    const mockExa = createMockExa('ws_new', mockItems(2));
+    const task = store.create('lifecycle.harvest', { query: 'test', entity: { type: 'company' } });
+    store.setPartialResult(task.id, { websetId: 'ws_resumed' });
+
+    const result = (await workflow(task.id, task.args, mockExa, store)) as any;
+
+    expect(result.websetId).toBe('ws_resumed');
+    expect(mockExa.websets.create).not.toHaveBeenCalled();
+    expect(mockExa.websets.items.listAll).toHaveBeenCalledWith('ws_resumed', undefined);
+    store.dispose();
+  });
+
   it('deletes webset when cleanup is true', async () => {
     const mockExa = createMockExa('ws_cleanup', mockItems(1));
 
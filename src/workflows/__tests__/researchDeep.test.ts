@@ -56,6 +56,26 @@ describe('research.deep workflow', () => {
     store.dispose();
   });
 
+  it('resumes polling the checkpointed research job instead of creating another', async () => {
+    const mockExa = {
+      research: {
+        create: vi.fn(),
+        pollUntilFinished: vi.fn().mockResolvedValue({ status: 'completed', output: 'done' }),
+      },
+    } as any;
+
+    const task = store.create('research.deep', { instructions: 'Test query' });
+    store.setPartialResult(task.id, { researchId: 'res_running' });
+
+    const result = (await workflow(task.id, task.args, mockExa, store)) as any;
+
+    expect(result.researchId).toBe('res_running');
+    expect(result.result).toBe('done');
+    expect(mockExa.research.create).not.toHaveBeenCalled();
+    expect(mockExa.research.pollUntilFinished.mock.calls[0][0]).toBe('res_running');
+    store.dispose();
+  });
+
   it('uses default model exa-research', async () => {
     const mockExa = {
       research: {
@@ -8,6 +8,7 @@ import {
   evaluateSignal,
   computeDelta,
   buildSnapshot,
+  collectLens,
   type JoinResult,
   type SignalResult,
 } from '../semanticCron.js';
@@ -905,6 +906,189 @@ describe('buildSnapshot', () => {
   });
 });
 
+describe('collectLens', () => {
+  const enrichmentMap = new Map([['enr_1', 'Count']]);
+  const shapes = [{ lensId: 'a', conditions: [{ enrichment: 'Count', operator: 'gte', value: 10 }], logic: 'all' as const }];
+
+  function countItem(id: string, count: string | null, createdAt: string, status = 'completed') {
+    return mockRawItem({
+      id, name: id, url: `https://${id}.com`, createdAt,
+      enrichments: [{ enrichmentId: 'enr_1', format: 'number', result: count === null ? null : [count], status }],
+    });
+  }
+
+  function streamingExa(items: Record<string, unknown>[], byId: Record<string, Record<string, unknown>> = {}) {
+    const read = { count: 0 };
+    const exa = {
+      websets: {
+        items: {
+          listAll: vi.fn().mockImplementation(() => (async function* () {
+            for (const item of items) {
+              read.count++;
+              yield item;
+            }
+          })()),
+          get: vi.fn().mockImplementation(async (_ws: string, id: string) => byId[id]),
+        },
+      },
+    } as any;
+    return { exa, read };
+  }
+
+  async function snapshotLens(items: Record<string, unknown>[], updatedAt?: string) {
+    const { exa } = streamingExa(items);
+    const collected = await collectLens(exa, 'a', 'ws_a', enrichmentMap, shapes, undefined, updatedAt);
+    const snapshot = buildSnapshot(
+      [collected.result],
+      { type: 'cooccurrence', entities: [], lensesWithEvidence: [] },
+      { fired: false, satisfiedBy: [], rule: 'any', entities: [] },
+      { a: 'ws_a' },
+      { a: collected.index },
+    );
+    return snapshot.lenses.a;
+  }
+
+  it('reads only items created since the previous cursor', async () => {
+    const old = [
+      countItem('b', '30', '2026-01-02T00:00:00Z'),
+      countItem('a', '5', '2026-01-01T00:00:00Z'),
+      countItem('z', '90', '2025-12-01T00:00:00Z'),
+    ];
+    const previous = await snapshotLens(old);
+    expect(previous.shapedCount).toBe(2);
+    expect(previous.index!.cursor).toBeTruthy();
+
+    const { exa, read } = streamingExa([countItem('c', '12', '2026-01-03T00:00:00Z'), ...old]);
+    const collected = await collectLens(exa, 'a', 'ws_a', enrichmentMap, shapes, previous);
+
+    expect(collected.incremental).toBe(true);
+    expect(collected.changed).toBe(true);
+    // The new item, the one at the cursor, then the first older one ends the stream
+    expect(read.count).toBe(3);
+    expect(collected.result.shapedItems.map(si => si.name)).toEqual(['c', 'b', 'z']);
+    expect(collected.result.totalItems).toBe(4);
+  });
+
+  it('reports no change when nothing new arrived', async () => {
+    const items = [countItem('b', '30', '2026-01-02T00:00:00Z')];
+    const previous = await snapshotLens(items);
+    const { exa } = streamingExa(items);
+
+    const collected = await collectLens(exa, 'a', 'ws_a', enrichmentMap, shapes, previous);
+    expect(collected.changed).toBe(false);
+    expect(collected.result.shapedItems.map(si => si.name)).toEqual(['b']);
+  });
+
+  it('re-reads items whose enrichments were pending', async () => {
+    const items = [
+      countItem('b', '30', '2026-01-02T00:00:00Z'),
+      countItem('p', null, '2026-01-01T00:00:00Z', 'pending'),
+    ];
+    const previous = await snapshotLens(items);
+    expect(previous.index!.pending).toEqual(['p']);
+
+    const { exa } = streamingExa(items, { p: countItem('p', '50', '2026-01-01T00:00:00Z') });
+    const collected = await collectLens(exa, 'a', 'ws_a', enrichmentMap, shapes, previous);
+
+    expect(exa.websets.items.get).toHaveBeenCalledWith('ws_a', 'p');
+    expect(collected.result.shapedItems.map(si => si.name)).toEqual(['b', 'p']);
+    expect(collected.index.pending).toEqual([]);
+  });
+
+  it('orders incremental results like a full collect when items are listed oldest first', async () => {
+    const old = [
+      countItem('a', '20', '2026-01-01T00:00:00Z'),
+      countItem('b', '30', '2026-01-02T00:00:00Z'),
+    ];
+    const previous = await snapshotLens(old);
+    const all = [...old, countItem('c', '12', '2026-01-03T00:00:00Z'), countItem('d', '40', '2026-01-04T00:00:00Z')];
+
+    const incremental = await collectLens(streamingExa(all).exa, 'a', 'ws_a', enrichmentMap, shapes, previous);
+    const full = await collectLens(streamingExa(all).exa, 'a', 'ws_a', enrichmentMap, shapes);
+
+    expect(incremental.incremental).toBe(true);
+    expect(incremental.result.shapedItems.map(si => si.name)).toEqual(['d', 'c', 'b', 'a']);
+    expect(incremental.result.shapedItems.map(si => si.name)).toEqual(full.result.shapedItems.map(si => si.name));
+  });
+
+  it('caps a lens past 1,000 items the same way on both paths', async () => {
+    const at = (i: number) => new Date(Date.UTC(2026, 0, 1) + i * 60_000).toISOString();
+    const items = (from: number, to: number) => {
+      const list: Record<string, unknown>[] = [];
+      for (let i = to - 1; i >= from; i--) list.push(countItem(`i${i}`, '50', at(i)));
+      return list;
+    };
+    const previous = await snapshotLens(items(0, 1200));
+    expect(previous.shapedCount).toBe(1000);
+    expect(previous.totalItems).toBe(1200);
+
+    const all = items(0, 1250);
+    const incremental = await collectLens(streamingExa(all).exa, 'a', 'ws_a', enrichmentMap, shapes, previous);
+    const full = await collectLens(streamingExa(all).exa, 'a', 'ws_a', enrichmentMap, shapes);
+
+    expect(incremental.incremental).toBe(true);
+    expect(incremental.result.shapedItems).toHaveLength(1000);
+    expect(incremental.result.shapedItems[0].name).toBe('i1249');
+    expect(incremental.result.shapedItems.map(si => si.id)).toEqual(full.result.shapedItems.map(si => si.id));
+    expect(incremental.result.totalItems).toBe(full.result.totalItems);
+  });
+
+  it('falls back to a full collect when an item was deleted since the last one', async () => {
+    const items = [
+      countItem('c', '12', '2026-01-03T00:00:00Z'),
+      countItem('b', '30', '2026-01-02T00:00:00Z'),
+      countItem('a', '5', '2026-01-01T00:00:00Z'),
+    ];
+    const previous = await snapshotLens(items, '2026-01-03T00:00:00Z');
+    expect(previous.index!.websetUpdatedAt).toBe('2026-01-03T00:00:00Z');
+
+    // b is deleted; the webset's updatedAt moves but no item is added
+    const remaining = [items[0], items[2]];
+    const collected = await collectLens(
+      streamingExa(remaining).exa, 'a', 'ws_a', enrichmentMap, shapes, previous, '2026-01-04T00:00:00Z',
+    );
+
+    expect(collected.incremental).toBe(false);
+    expect(collected.result.shapedItems.map(si => si.name)).toEqual(['c']);
+    expect(collected.result.totalItems).toBe(2);
+    expect(collected.index.websetUpdatedAt).toBe('2026-01-04T00:00:00Z');
+
+    // An unchanged updatedAt stays incremental
+    const unchanged = await collectLens(
+      streamingExa(items).exa, 'a', 'ws_a', enrichmentMap, shapes, previous, '2026-01-03T00:00:00Z',
+    );
+    expect(unchanged.incremental).toBe(true);
+    expect(unchanged.changed).toBe(false);
+  });
+
+  it('reconciles with a full collect once the last one is a week old', async () => {
+    const items = [countItem('b', '30', '2026-01-02T00:00:00Z')];
+    const previous = await snapshotLens(items);
+    expect(Date.parse(previous.index!.fullAt!)).toBeGreaterThan(Date.now() - 60_000);
+
+    const stale = { ...previous, index: { ...previous.index!, fullAt: new Date(Date.now() - 8 * 86_400_000).toISOString() } };
+    const collected = await collectLens(streamingExa(items).exa, 'a', 'ws_a', enrichmentMap, shapes, stale);
+    expect(collected.incremental).toBe(false);
+    expect(Date.parse(collected.index.fullAt!)).toBeGreaterThan(Date.now() - 60_000);
+
+    const recent = await collectLens(streamingExa(items).exa, 'a', 'ws_a', enrichmentMap, shapes, previous);
+    expect(recent.incremental).toBe(true);
+    expect(recent.index.fullAt).toBe(previous.index!.fullAt);
+  });
+
+  it('falls back to a full collect when the shapes changed', async () => {
+    const items = [countItem('b', '30', '2026-01-02T00:00:00Z'), countItem('a', '5', '2026-01-01T00:00:00Z')];
+    const previous = await snapshotLens(items);
+    const { exa, read } = streamingExa(items);
+    const looser = [{ ...shapes[0], conditions: [{ enrichment: 'Count', operator: 'gte', value: 1 }] }];
+
+    const collected = await collectLens(exa, 'a', 'ws_a', enrichmentMap, looser, previous);
+    expect(collected.incremental).toBe(false);
+    expect(read.count).toBe(2);
+    expect(collected.result.shapedItems).toHaveLength(2);
+  });
+});
+
 // --- Full workflow tests ---
 
 describe('semantic.cron workflow', () => {
@@ -1157,4 +1341,123 @@ describe('semantic.cron workflow', () => {
     expect(result.snapshot.signal.fired).toBe(false);
     store.dispose();
   });
+
+  it('incremental re-eval produces the same delta as a full re-collect', async () => {
+    const ws1 = mockWebset('ws_hiring', [{ id: 'enr_1', description: 'Open roles count', format: 'number' }]);
+    const ws2 = mockWebset('ws_funding', [{ id: 'enr_2', description: 'Latest funding', format: 'text' }]);
+    const hiring = (name: string, roles: string, createdAt: string) => mockRawItem({
+      id: `h_${name}`, name, url: `https://${name.toLowerCase()}.com`, createdAt,
+      enrichments: [{ enrichmentId: 'enr_1', format: 'number', result: [roles], status: 'completed' }],
+    });
+    const funding = (name: string, createdAt: string) => mockRawItem({
+      id: `f_${name}`, name, url: `https://${name.toLowerCase()}.com`, createdAt,
+      enrichments: [{ enrichmentId: 'enr_2', format: 'text', result: ['Series A'], status: 'completed' }],
+    });
+
+    const lenses = {
+      hiring: { webset: ws1, items: [hiring('Acme', '25', '2026-01-02T00:00:00Z'), hiring('Beta', '3', '2026-01-01T00:00:00Z')] },
+      funding: { webset: ws2, items: [funding('Acme', '2026-01-02T00:00:00Z')] },
+    };
+    const config = {
+      lenses: [
+        { id: 'hiring', source: { query: 'hiring' } },
+        { id: 'funding', source: { query: 'funding' } },
+      ],
+      shapes: [
+        { lensId: 'hiring', conditions: [{ enrichment: 'Open roles count', operator: 'gte', value: 10 }], logic: 'all' },
+        { lensId: 'funding', conditions: [{ enrichment: 'Latest funding', operator: 'exists' }], logic: 'all' },
+      ],
+      join: { by: 'entity' },
+      signal: { requires: { type: 'all' } },
+    };
+    const existingWebsets = { hiring: 'ws_hiring', funding: 'ws_funding' };
+
+    const initialTask = store.create('semantic.cron', { config });
+    const initial = (await workflow(initialTask.id, initialTask.args, createMockExa(lenses), store)) as any;
+    expect(initial.snapshot.lenses.hiring.index.cursor).toBeTruthy();
+
+    // New items since the snapshot: Gamma in both lenses
+    lenses.hiring.items.unshift(hiring('Gamma', '40', '2026-01-03T00:00:00Z'));
+    lenses.funding.items.unshift(funding('Gamma', '2026-01-03T00:00:00Z'));
+
+    const incrementalTask = store.create('semantic.cron', { config, existingWebsets, previousSnapshot: initial.snapshot });
+    const incrementalExa = createMockExa(lenses);
+    const incremental = (await workflow(incrementalTask.id, incrementalTask.args, incrementalExa, store)) as any;
+
+    const { joinKey: _joinKey, ...legacy } = initial.snapshot;
+    legacy.lenses = Object.fromEntries(
+      Object.entries(initial.snapshot.lenses).map(([id, lens]: [string, any]) => {
+        const { index: _index, ...rest } = lens;
+        return [id, rest];
+      }),
+    );
+    const fullTask = store.create('semantic.cron', { config, existingWebsets, previousSnapshot: legacy });
+    const full = (await workflow(fullTask.id, fullTask.args, createMockExa(lenses), store)) as any;
+
+    const { timeSinceLastEval: _a, ...incrementalDelta } = incremental.delta;
+    const { timeSinceLastEval: _b, ...fullDelta } = full.delta;
+    expect(incrementalDelta).toEqual(fullDelta);
+    expect(incremental.delta.newShapedItems).toEqual({ hiring: 1, funding: 1 });
+    expect(incremental.delta.newJoins).toEqual(['https://gamma.com']);
+    expect(incremental.snapshot.join).toEqual(full.snapshot.join);
+    expect(incremental.snapshot.lenses.hiring.totalItems).toBe(full.snapshot.lenses.hiring.totalItems);
+
+    // Unchanged lenses on the next run reuse the previous join outright
+    const idleTask = store.create('semantic.cron', { config, existingWebsets, previousSnapshot: incremental.snapshot });
+    const idle = (await workflow(idleTask.id, idleTask.args, createMockExa(lenses), store)) as any;
+    expect(idle.snapshot.join).toBe(incremental.snapshot.join);
+    expect(idle.delta.newJoins).toEqual([]);
+    store.dispose();
+  });
+
+  it('drops items deleted between evaluations', async () => {
+    const ws1 = { ...mockWebset('ws_hiring', [{ id: 'enr_1', description: 'Open roles count', format: 'number' }]), updatedAt: '2026-01-02T00:00:00Z' };
+    const ws2 = { ...mockWebset('ws_funding', [{ id: 'enr_2', description: 'Latest funding', format: 'text' }]), updatedAt: '2026-01-02T00:00:00Z' };
+    const hiring = (name: string, createdAt: string) => mockRawItem({
+      id: `h_${name}`, name, url: `https://${name.toLowerCase()}.com`, createdAt,
+      enrichments: [{ enrichmentId: 'enr_1', format: 'number', result: ['25'], status: 'completed' }],
+    });
+    const funding = (name: string, createdAt: string) => mockRawItem({
+      id: `f_${name}`, name, url: `https://${name.toLowerCase()}.com`, createdAt,
+      enrichments: [{ enrichmentId: 'enr_2', format: 'text', result: ['Series A'], status: 'completed' }],
+    });
+
+    const lenses = {
+      hiring: { webset: ws1, items: [hiring('Acme', '2026-01-02T00:00:00Z'), hiring('Beta', '2026-01-01T00:00:00Z')] },
+      funding: { webset: ws2, items: [funding('Acme', '2026-01-02T00:00:00Z'), funding('Beta', '2026-01-01T00:00:00Z')] },
+    };
+    const config = {
+      lenses: [
+        { id: 'hiring', source: { query: 'hiring' } },
+        { id: 'funding', source: { query: 'funding' } },
+      ],
+      shapes: [
+        { lensId: 'hiring', conditions: [{ enrichment: 'Open roles count', operator: 'gte', value: 10 }], logic: 'all' },
+        { lensId: 'funding', conditions: [{ enrichment: 'Latest funding', operator: 'exists' }], logic: 'all' },
+      ],
+      join: { by: 'entity' },
+      signal: { requires: { type: 'all' } },
+    };
+
+    const initialTask = store.create('semantic.cron', { config });
+    const initial = (await workflow(initialTask.id, initialTask.args, createMockExa(lenses), store)) as any;
+    expect(initial.snapshot.lenses.hiring.totalItems).toBe(2);
+
+    // Beta is removed from the hiring webset, which bumps its updatedAt
+    lenses.hiring.items.pop();
+    ws1.updatedAt = '2026-01-05T00:00:00Z';
+
+    const task = store.create('semantic.cron', {
+      config,
+      existingWebsets: { hiring: 'ws_hiring', funding: 'ws_funding' },
+      previousSnapshot: initial.snapshot,
+    });
+    const result = (await workflow(task.id, task.args, createMockExa(lenses), store)) as any;
+
+    expect(result.snapshot.lenses.hiring.totalItems).toBe(1);
+    expect(result.snapshot.lenses.hiring.shapes.map((s: any) => s.name)).toEqual(['Acme']);
+    expect(result.delta.lostJoins).toEqual(['https://beta.com']);
+    expect(result.snapshot.lenses.hiring.index.websetUpdatedAt).toBe('2026-01-05T00:00:00Z');
+    store.dispose();
+  });
 });
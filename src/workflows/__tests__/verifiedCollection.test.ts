@@ -172,6 +172,48 @@ describe('research.verifiedCollection workflow', () => {
     store.dispose();
   });
 
+  it('resumes polling checkpointed per-entity research instead of creating it again', async () => {
+    const items = [
+      { id: '1', properties: { company: { name: 'Acme' }, url: 'https://acme.com' } },
+      { id: '2', properties: { company: { name: 'Beta' }, url: 'https://beta.com' } },
+    ];
+
+    async function* listAllGen() {
+      for (const item of items) yield item;
+    }
+
+    const mockExa = {
+      websets: {
+        create: vi.fn(),
+        get: vi.fn().mockResolvedValue({ id: 'ws_resume', status: 'idle', searches: [] }),
+        cancel: vi.fn(),
+        items: { listAll: vi.fn().mockReturnValue(listAllGen()) },
+      },
+      research: {
+        create: vi.fn().mockResolvedValue({ id: 'res_new' }),
+        pollUntilFinished: vi.fn().mockResolvedValue({ output: 'ok' }),
+      },
+    } as any;
+
+    const task = store.create('research.verifiedCollection', {
+      query: 'test',
+      entity: { type: 'company' },
+      researchPrompt: 'About {{name}}',
+    });
+    store.setPartialResult(task.id, { websetId: 'ws_resume', researchIds: { '1': 'res_running' } });
+
+    const result = (await workflow(task.id, task.args, mockExa, store)) as any;
+
+    expect(mockExa.websets.create).not.toHaveBeenCalled();
+    expect(mockExa.research.create).toHaveBeenCalledTimes(1);
+    expect(mockExa.research.create.mock.calls[0][0].instructions).toContain('Beta');
+    const polled = mockExa.research.pollUntilFinished.mock.calls.map((c: any[]) => c[0]);
+    expect(polled.sort()).toEqual(['res_new', 'res_running']);
+    expect(result.items.map((i: any) => i.research.researchId).sort()).toEqual(['res_new', 'res_running']);
+    expect((store.get(task.id)!.partialResult as any).researchIds).toEqual({ '1': 'res_running', '2': 'res_new' });
+    store.dispose();
+  });
+
   it('handles per-entity research failure gracefully', async () => {
     const items = [
       { id: '1', properties: { company: { name: 'Acme' }, url: 'https://acme.com' } },
@@ -2,10 +2,13 @@ import type { Exa } from 'exa-js';
 import type { TaskStore } from '../lib/taskStore.js';
 import { registerWorkflow } from './types.js';
 import {
+  checkpoint,
   createStepTracker,
+  getCheckpoint,
   isCancelled,
   pollUntilIdle,
   collectItems,
+  runCheckpointedResearch,
   summarizeItem,
   validateRequired,
   withSummary,
@@ -19,7 +22,7 @@ async function adversarialVerifyWorkflow(
   store: TaskStore,
 ): Promise<unknown> {
   const startTime = Date.now();
-  const tracker = createStepTracker();
+  const tracker = createStepTracker('adversarial.verify');
 
   const entity = args.entity as { type: string } | undefined;
   const count = (args.count as number) ?? 25;
@@ -39,6 +42,9 @@ async function adversarialVerifyWorkflow(
 
   if (isCancelled(taskId, store)) return null;
 
+  // A resumed task reuses the websets its earlier run created
+  const resumed = getCheckpoint<{ thesisWebsetId: string; antithesisWebsetId: string }>(store, taskId);
+
   // Create thesis webset
   const step1 = Date.now();
   store.updateProgress(taskId, { step: 'creating thesis webset', completed: 1, total: synthesize ? 7 : 5 });
@@ -47,11 +53,12 @@ async function adversarialVerifyWorkflow(
     search: { query: thesisQuery, count, entity },
   };
   if (enrichments) thesisParams.enrichments = enrichments;
-  const thesisWebset = await exa.websets.create(thesisParams as any);
+  const thesisWebsetId = resumed.thesisWebsetId ?? (await exa.websets.create(thesisParams as any)).id;
+  checkpoint(store, taskId, { thesisWebsetId });
   tracker.track('create-thesis', step1);
 
   if (isCancelled(taskId, store)) {
-    await exa.websets.cancel(thesisWebset.id);
+    await exa.websets.cancel(thesisWebsetId);
     return null;
   }
 
@@ -63,57 +70,54 @@ async function adversarialVerifyWorkflow(
     search: { query: antithesisQuery, count, entity },
   };
   if (enrichments) antithesisParams.enrichments = enrichments;
-  const antithesisWebset = await exa.websets.create(antithesisParams as any);
+  const antithesisWebsetId = resumed.antithesisWebsetId ?? (await exa.websets.create(antithesisParams as any)).id;
+  checkpoint(store, taskId, { antithesisWebsetId });
   tracker.track('create-antithesis', step2);
 
   if (isCancelled(taskId, store)) {
-    await exa.websets.cancel(thesisWebset.id);
-    await exa.websets.cancel(antithesisWebset.id);
+    await exa.websets.cancel(thesisWebsetId);
+    await exa.websets.cancel(antithesisWebsetId);
     return null;
   }
 
-  // Poll thesis
+  // Poll thesis and antithesis concurrently
   const step3 = Date.now();
-  store.updateProgress(taskId, { step: 'polling thesis', completed: 3, total: synthesize ? 7 : 5 });
-  await pollUntilIdle({
-    exa,
-    websetId: thesisWebset.id,
-    taskId,
-    store,
-    timeoutMs,
-    stepNum: 3,
-    totalSteps: synthesize ? 7 : 5,
-  });
-  tracker.track('poll-thesis', step3);
-
-  if (isCancelled(taskId, store)) return null;
-
-  // Poll antithesis
-  const step4 = Date.now();
-  store.updateProgress(taskId, { step: 'polling antithesis', completed: 4, total: synthesize ? 7 : 5 });
-  await pollUntilIdle({
-    exa,
-    websetId: antithesisWebset.id,
-    taskId,
-    store,
-    timeoutMs,
-    stepNum: 4,
-    totalSteps: synthesize ? 7 : 5,
-  });
-  tracker.track('poll-antithesis', step4);
+  store.updateProgress(taskId, { step: 'polling thesis + antithesis', completed: 3, total: synthesize ? 7 : 5 });
+  await Promise.all([
+    pollUntilIdle({
+      exa,
+      websetId: thesisWebsetId,
+      taskId,
+      store,
+      timeoutMs,
+      stepNum: 3,
+      totalSteps: synthesize ? 7 : 5,
+    }).then(() => tracker.track('poll-thesis', step3)),
+    pollUntilIdle({
+      exa,
+      websetId: antithesisWebsetId,
+      taskId,
+      store,
+      timeoutMs,
+      stepNum: 4,
+      totalSteps: synthesize ? 7 : 5,
+    }).then(() => tracker.track('poll-antithesis', step3)),
+  ]);
 
   if (isCancelled(taskId, store)) return null;
 
   // Collect items from both
   const step5 = Date.now();
   store.updateProgress(taskId, { step: 'collecting', completed: 5, total: synthesize ? 7 : 5 });
-  const thesisItems = await collectItems(exa, thesisWebset.id, count * 2);
-  const antithesisItems = await collectItems(exa, antithesisWebset.id, count * 2);
+  const [thesisItems, antithesisItems] = await Promise.all([
+    collectItems(exa, thesisWebsetId, count * 2),
+    collectItems(exa, antithesisWebsetId, count * 2),
+  ]);
   tracker.track('collect', step5);
 
-  store.setPartialResult(taskId, {
-    thesis: { websetId: thesisWebset.id, itemCount: thesisItems.length },
-    antithesis: { websetId: antithesisWebset.id, itemCount: antithesisItems.length },
+  checkpoint(store, taskId, {
+    thesis: { websetId: thesisWebsetId, itemCount: thesisItems.length },
+    antithesis: { websetId: antithesisWebsetId, itemCount: antithesisItems.length },
   });
 
   // Synthesize if requested
@@ -134,14 +138,16 @@ ${antithesisSummaries}
 Provide a balanced assessment including: verdict, confidence level, key supporting factors, key countering factors, and identified blind spots.`;
 
     try {
-      const researchResp = await (exa.research as any).create({
-        instructions,
-        model: 'exa-research-fast',
-      });
-      const researchId = researchResp.researchId ?? researchResp.id;
-      const researchResult = await (exa.research as any).pollUntilFinished(researchId, {
-        timeoutMs: 120_000,
-      });
+      const job = await runCheckpointedResearch(
+        exa,
+        store,
+        taskId,
+        'synthesisResearchId',
+        { instructions, model: 'exa-research-fast' },
+        120_000,
+      );
+      if (!job) return null;
+      const { researchId, result: researchResult } = job;
       synthesis = {
         researchId,
         content: researchResult.output ?? researchResult.result ?? JSON.stringify(researchResult),
@@ -163,13 +169,13 @@ Provide a balanced assessment including: verdict, confidence level, key supporti
   const projectedAntithesis = filterAndProjectItems(antithesisItems);
   const result: Record<string, unknown> = {
     thesis: {
-      websetId: thesisWebset.id,
+      websetId: thesisWebsetId,
       items: projectedThesis.data,
       itemCount: projectedThesis.included,
       itemsExcluded: projectedThesis.excluded,
     },
     antithesis: {
-      websetId: antithesisWebset.id,
+      websetId: antithesisWebsetId,
       items: projectedAntithesis.data,
       itemCount: projectedAntithesis.included,
       itemsExcluded: projectedAntithesis.excluded,
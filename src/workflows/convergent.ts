@@ -2,7 +2,9 @@ import type { Exa } from 'exa-js';
 import type { TaskStore } from '../lib/taskStore.js';
 import { registerWorkflow } from './types.js';
 import {
+  checkpoint,
   createStepTracker,
+  getCheckpoint,
   isCancelled,
   pollUntilIdle,
   collectItems,
@@ -11,32 +13,12 @@ import {
   withSummary,
 } from './helpers.js';
 import { projectItem } from '../lib/projections.js';
+import { EntityIndex } from '../lib/entityMatcher.js';
 
 // --- Deduplication helpers (exported for testing) ---
 
-export function diceCoefficient(a: string, b: string): number {
-  const normalize = (s: string) => s.toLowerCase().trim();
-  const na = normalize(a);
-  const nb = normalize(b);
-  if (na === nb) return 1;
-  if (na.length < 2 || nb.length < 2) return 0;
-
-  const bigrams = (s: string): Set<string> => {
-    const set = new Set<string>();
-    for (let i = 0; i < s.length - 1; i++) {
-      set.add(s.slice(i, i + 2));
-    }
-    return set;
-  };
-
-  const bigramsA = bigrams(na);
-  const bigramsB = bigrams(nb);
-  let intersection = 0;
-  for (const bg of bigramsA) {
-    if (bigramsB.has(bg)) intersection++;
-  }
-  return (2 * intersection) / (bigramsA.size + bigramsB.size);
-}
+// Re-export diceCoefficient for backward compatibility with existing callers
+export { diceCoefficient } from '../lib/entityMatcher.js';
 
 interface DeduplicatedEntity {
   url: string;
@@ -67,36 +49,24 @@ function getItemName(item: Record<string, unknown>): string {
 export function deduplicateItems(
   itemsByQuery: Array<Record<string, unknown>[]>,
 ): DeduplicationResult {
-  const entities: DeduplicatedEntity[] = [];
+  const index = new EntityIndex<DeduplicatedEntity>(0.85);
 
   for (let qi = 0; qi < itemsByQuery.length; qi++) {
     for (const item of itemsByQuery[qi]) {
       const url = getItemUrl(item);
       const name = getItemName(item);
 
-      // Try to find existing match
-      let matched = false;
-      for (const existing of entities) {
-        // URL exact match
-        if (url && existing.url && url === existing.url) {
-          existing.queryIndices.push(qi);
-          matched = true;
-          break;
-        }
-        // Name fuzzy match
-        if (name && existing.name && diceCoefficient(name, existing.name) > 0.85) {
-          existing.queryIndices.push(qi);
-          matched = true;
-          break;
-        }
-      }
-
-      if (!matched) {
-        entities.push({ url, name, item, queryIndices: [qi] });
+      const existing = index.match(name, url);
+      if (existing) {
+        existing.queryIndices.push(qi);
+      } else {
+        index.add(name, url, { url, name, item, queryIndices: [qi] });
       }
     }
   }
 
+  const entities = index.values();
+
   // Deduplicate query indices
   for (const e of entities) {
     e.queryIndices = [...new Set(e.queryIndices)];
@@ -117,7 +87,7 @@ async function convergentSearchWorkflow(
   store: TaskStore,
 ): Promise<unknown> {
   const startTime = Date.now();
-  const tracker = createStepTracker();
+  const tracker = createStepTracker('convergent.search');
 
   const criteria = args.criteria as Array<{ description: string }> | undefined;
   const count = (args.count as number) ?? 25;
@@ -133,7 +103,8 @@ async function convergentSearchWorkflow(
 
   const totalSteps = 2 + queries.length * 2 + 1; // validate + create*N + poll*N + analyze
 
-  // Create websets sequentially
+  // Create websets sequentially; a resumed task reuses the ones already created
+  const resumed = getCheckpoint<{ websetIds: string[] }>(store, taskId).websetIds ?? [];
   const websetIds: string[] = [];
   for (let i = 0; i < queries.length; i++) {
     const stepStart = Date.now();
@@ -148,9 +119,9 @@ async function convergentSearchWorkflow(
     };
     if (criteria) (createParams.search as any).criteria = criteria;
 
-    const webset = await exa.websets.create(createParams as any);
-    websetIds.push(webset.id);
-    tracker.track(`create-${i}`, stepStart);
+    websetIds.push(resumed[i] ?? (await exa.websets.create(createParams as any)).id);
+    checkpoint(store, taskId, { websetIds: [...websetIds] });
+    tracker.track(`create-${i}`, stepStart, 'create');
 
     if (isCancelled(taskId, store)) {
       for (const id of websetIds) {
@@ -160,29 +131,29 @@ async function convergentSearchWorkflow(
     }
   }
 
-  // Poll all until idle, sequentially
-  for (let i = 0; i < websetIds.length; i++) {
+  // Poll all until idle, concurrently
+  const stepPoll = Date.now();
+  store.updateProgress(taskId, {
+    step: `polling ${queries.length} websets`,
+    completed: 1 + queries.length,
+    total: totalSteps,
+  });
+  await Promise.all(websetIds.map(async (websetId, i) => {
     const stepStart = Date.now();
-    const stepNum = 1 + queries.length + i;
-    store.updateProgress(taskId, {
-      step: `polling webset ${i + 1}/${queries.length}`,
-      completed: stepNum,
-      total: totalSteps,
-    });
-
     await pollUntilIdle({
       exa,
-      websetId: websetIds[i],
+      websetId,
       taskId,
       store,
       timeoutMs,
-      stepNum,
+      stepNum: 1 + queries.length + i,
       totalSteps,
     });
-    tracker.track(`poll-${i}`, stepStart);
+    tracker.track(`poll-${i}`, stepStart, 'poll-query');
+  }));
+  tracker.track('poll', stepPoll);
 
-    if (isCancelled(taskId, store)) return null;
-  }
+  if (isCancelled(taskId, store)) return null;
 
   // Collect items from all websets
   const stepCollect = Date.now();
@@ -1,5 +1,10 @@
 import type { Exa } from 'exa-js';
 import type { TaskStore } from '../lib/taskStore.js';
+import { getWebsetPoller } from '../lib/statusPoller.js';
+import { apiPools } from '../lib/scheduler.js';
+import { streamItems, type ItemStreamOptions } from '../lib/itemStream.js';
+import { compactItem } from '../lib/projections.js';
+import { workflowStepDuration } from '../lib/metrics.js';
 
 // --- Validators ---
 
@@ -61,17 +66,20 @@ export interface StepTiming {
 
 export interface StepTracker {
   steps: StepTiming[];
-  track(name: string, startMs: number): void;
+  /** `metricStep` groups per-lens/per-query steps (e.g. "poll") in the step histogram. */
+  track(name: string, startMs: number, metricStep?: string): void;
 }
 
 // --- Utilities ---
 
-export function createStepTracker(): StepTracker {
+export function createStepTracker(workflow = 'unknown'): StepTracker {
   const steps: StepTiming[] = [];
   return {
     steps,
-    track(name: string, startMs: number) {
-      steps.push({ name, durationMs: Date.now() - startMs });
+    track(name: string, startMs: number, metricStep = name) {
+      const durationMs = Date.now() - startMs;
+      steps.push({ name, durationMs });
+      workflowStepDuration.observe(durationMs / 1000, workflow, metricStep);
     },
   };
 }
@@ -97,6 +105,20 @@ export function summarizeItem(item: Record<string, unknown>): string {
   return url ? `${name} (${url})` : name;
 }
 
+// --- Checkpoints ---
+
+/** Merge resumable state (created resource IDs, finished work) into the task's partialResult. */
+export function checkpoint(store: TaskStore, taskId: string, data: Record<string, unknown>): void {
+  const current = store.get(taskId)?.partialResult as Record<string, unknown> | null | undefined;
+  store.setPartialResult(taskId, { ...(current ?? {}), ...data });
+}
+
+/** State checkpointed by an earlier run of this task (after a restart), or {} on a fresh start. */
+export function getCheckpoint<T extends object>(store: TaskStore, taskId: string): Partial<T> {
+  const partial = store.get(taskId)?.partialResult;
+  return (partial && typeof partial === 'object' ? partial : {}) as Partial<T>;
+}
+
 // --- Polling ---
 
 export async function pollUntilIdle(opts: {
@@ -107,56 +129,105 @@ export async function pollUntilIdle(opts: {
   timeoutMs: number;
   stepNum: number;
   totalSteps: number;
+  formatProgress?: (progress: { found: number; analyzed: number }) => string;
 }): Promise<{ webset: any; timedOut: boolean }> {
-  const { exa, websetId, taskId, store, timeoutMs, stepNum, totalSteps } = opts;
-  const deadline = Date.now() + timeoutMs;
-  let webset: any;
-
-  while (true) {
-    webset = await exa.websets.get(websetId);
-    if (webset.status === 'idle') break;
-    if (webset.status === 'paused') {
-      throw new Error('Webset was paused unexpectedly');
-    }
+  const { exa, websetId, taskId, store, timeoutMs, stepNum, totalSteps, formatProgress } = opts;
+
+  const { resource: webset, timedOut, stopped } = await getWebsetPoller(exa).waitFor(websetId, {
+    timeoutMs,
+    onUpdate: ws => {
+      const searches = ws.searches as any[] | undefined;
+      const lastSearch = searches?.[searches.length - 1];
+      if (lastSearch?.progress) {
+        const prog = lastSearch.progress;
+        store.updateProgress(taskId, {
+          step: 'searching',
+          completed: stepNum,
+          total: totalSteps,
+          message: formatProgress
+            ? formatProgress(prog)
+            : `Found ${prog.found}/${prog.analyzed} analyzed`,
+        });
+      }
+    },
+    shouldStop: () => isCancelled(taskId, store),
+  });
 
-    if (Date.now() >= deadline) {
-      return { webset, timedOut: true };
-    }
+  if (stopped) {
+    await exa.websets.cancel(websetId);
+  }
+  return { webset, timedOut };
+}
 
-    const searches = webset.searches as any[] | undefined;
-    const lastSearch = searches?.[searches.length - 1];
-    if (lastSearch?.progress) {
-      const prog = lastSearch.progress;
-      store.updateProgress(taskId, {
-        step: 'searching',
-        completed: stepNum,
-        total: totalSteps,
-        message: `Found ${prog.found}/${prog.analyzed} analyzed`,
-      });
-    }
+// --- Research ---
 
-    if (isCancelled(taskId, store)) {
-      await exa.websets.cancel(websetId);
-      return { webset, timedOut: false };
-    }
+export interface ResearchJob {
+  researchId: string;
+  result: any;
+}
 
-    await sleep(2000);
-  }
+/**
+ * Create a research job and wait for it, holding one slot of the shared
+ * research pool for the whole job, so callers can fan out freely.
+ * Returns null if `shouldStop` says so once a slot is free.
+ */
+export async function runResearch(exa: Exa, params: Record<string, unknown>, timeoutMs: number): Promise<ResearchJob>;
+export async function runResearch(
+  exa: Exa,
+  params: Record<string, unknown>,
+  timeoutMs: number,
+  shouldStop: () => boolean,
+): Promise<ResearchJob | null>;
+export async function runResearch(
+  exa: Exa,
+  params: Record<string, unknown>,
+  timeoutMs: number,
+  shouldStop?: () => boolean,
+): Promise<ResearchJob | null> {
+  return apiPools.research.run(async () => {
+    if (shouldStop?.()) return null;
+    const response = await (exa.research as any).create(params);
+    const researchId = response.researchId ?? response.id;
+    const result = await (exa.research as any).pollUntilFinished(researchId, { timeoutMs });
+    return { researchId, result };
+  });
+}
 
-  return { webset, timedOut: false };
+/**
+ * runResearch for resumable tasks: the research ID is checkpointed under `key`
+ * as soon as the job exists, and a resumed task polls that job instead of
+ * starting (and paying for) another.
+ */
+export async function runCheckpointedResearch(
+  exa: Exa,
+  store: TaskStore,
+  taskId: string,
+  key: string,
+  params: Record<string, unknown>,
+  timeoutMs: number,
+): Promise<ResearchJob | null> {
+  return apiPools.research.run(async () => {
+    let researchId = getCheckpoint<Record<string, string>>(store, taskId)[key];
+    if (!researchId) {
+      if (isCancelled(taskId, store)) return null;
+      const response = await (exa.research as any).create(params);
+      researchId = (response.researchId ?? response.id) as string;
+      checkpoint(store, taskId, { [key]: researchId });
+    }
+    const result = await (exa.research as any).pollUntilFinished(researchId, { timeoutMs });
+    return { researchId, result };
+  });
 }
 
 // --- Item collection ---
 
+/** Stream a webset's items, compacting each one as it arrives (see compactItem). */
 export async function collectItems(
   exa: Exa,
   websetId: string,
   cap = 1000,
+  options: Omit<ItemStreamOptions<Record<string, unknown>>, 'maxItems'> = {},
 ): Promise<Record<string, unknown>[]> {
-  const items: Record<string, unknown>[] = [];
-  for await (const item of (exa.websets.items as any).listAll(websetId)) {
-    items.push(item as Record<string, unknown>);
-    if (items.length >= cap) break;
-  }
-  return items;
+  const { data } = await streamItems(exa, websetId, { map: compactItem, ...options, maxItems: cap });
+  return data;
 }
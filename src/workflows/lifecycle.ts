@@ -2,7 +2,9 @@ import type { Exa } from 'exa-js';
 import type { TaskStore } from '../lib/taskStore.js';
 import { registerWorkflow } from './types.js';
 import {
+  checkpoint,
   createStepTracker,
+  getCheckpoint,
   isCancelled,
   pollUntilIdle,
   collectItems,
@@ -19,7 +21,7 @@ async function lifecycleHarvestWorkflow(
   store: TaskStore,
 ): Promise<unknown> {
   const startTime = Date.now();
-  const tracker = createStepTracker();
+  const tracker = createStepTracker('lifecycle.harvest');
 
   const criteria = args.criteria as Array<{ description: string }> | undefined;
   const count = (args.count as number) ?? 25;
@@ -46,8 +48,10 @@ async function lifecycleHarvestWorkflow(
   if (criteria) (createParams.search as any).criteria = criteria;
   if (enrichments) createParams.enrichments = enrichments;
 
-  const webset = await exa.websets.create(createParams as any);
-  const websetId = webset.id;
+  // A resumed task picks up the webset its earlier run created
+  const resumed = getCheckpoint<{ websetId: string }>(store, taskId);
+  const websetId = resumed.websetId ?? (await exa.websets.create(createParams as any)).id;
+  checkpoint(store, taskId, { websetId });
   tracker.track('create', step1);
 
   if (isCancelled(taskId, store)) {
@@ -5,9 +5,12 @@ import {
   type StepTiming,
   createStepTracker,
   isCancelled,
-  sleep,
+  checkpoint,
+  getCheckpoint,
+  pollUntilIdle,
   summarizeItem,
   collectItems,
+  runCheckpointedResearch,
   withSummary,
 } from './helpers.js';
 import { projectItem } from '../lib/projections.js';
@@ -136,7 +139,7 @@ async function qdWinnowWorkflow(
   store: TaskStore,
 ): Promise<unknown> {
   const startTime = Date.now();
-  const tracker = createStepTracker();
+  const tracker = createStepTracker('qd.winnow');
   const { steps } = tracker;
   const trackStep = tracker.track.bind(tracker);
 
@@ -193,8 +196,12 @@ async function qdWinnowWorkflow(
   const step1Start = Date.now();
   store.updateProgress(taskId, { step: 'creating', completed: 1, total: 7 });
 
+  const resumed = getCheckpoint<{ websetId: string }>(store, taskId);
   let websetId: string;
-  if (a.seedWebsetId) {
+  if (resumed.websetId) {
+    // Restarted after the webset was created — pick up from polling
+    websetId = resumed.websetId;
+  } else if (a.seedWebsetId) {
     websetId = a.seedWebsetId;
     if (a.query) {
       await (exa.websets.searches as any).create(websetId, {
@@ -220,6 +227,7 @@ async function qdWinnowWorkflow(
     } as any);
     websetId = webset.id;
   }
+  checkpoint(store, taskId, { websetId });
   trackStep('create', step1Start);
 
   if (isCancelled(taskId, store)) {
@@ -230,47 +238,24 @@ async function qdWinnowWorkflow(
   // Step 2: Poll until idle
   const step2Start = Date.now();
   const timeoutMs = a.timeout ?? 300_000;
-  const deadline = Date.now() + timeoutMs;
-  let timedOut = false;
-  let webset: any;
-
-  while (true) {
-    webset = await exa.websets.get(websetId);
-    if (webset.status === 'idle') break;
-    if (webset.status === 'paused') {
-      throw new Error('Webset was paused unexpectedly');
-    }
-
-    if (Date.now() >= deadline) {
-      timedOut = true;
-      break;
-    }
-
-    const searches = webset.searches as any[] | undefined;
-    const lastSearch = searches?.[searches.length - 1];
-    if (lastSearch?.progress) {
-      const prog = lastSearch.progress;
-      const stringency =
-        prog.analyzed > 0 ? prog.found / prog.analyzed : 0;
-      store.updateProgress(taskId, {
-        step: 'searching',
-        completed: 2,
-        total: 7,
-        message: `Found ${prog.found}/${prog.analyzed} analyzed (stringency: ${(stringency * 100).toFixed(1)}%)`,
-      });
-    }
-
-    if (isCancelled(taskId, store)) {
-      await exa.websets.cancel(websetId);
-      return null;
-    }
-
-    await sleep(2000);
-  }
+  const polled = await pollUntilIdle({
+    exa,
+    websetId,
+    taskId,
+    store,
+    timeoutMs,
+    stepNum: 2,
+    totalSteps: 7,
+    formatProgress: prog => {
+      const stringency = prog.analyzed > 0 ? prog.found / prog.analyzed : 0;
+      return `Found ${prog.found}/${prog.analyzed} analyzed (stringency: ${(stringency * 100).toFixed(1)}%)`;
+    },
+  });
+  const timedOut = polled.timedOut;
+  let webset: any = polled.webset;
   trackStep('poll', step2Start);
 
   if (isCancelled(taskId, store)) {
-    await exa.websets.cancel(websetId);
     return null;
   }
 
@@ -400,16 +385,18 @@ Assess:
 3. Gaps: what blind spots exist in the criteria?
 4. Surprises: anything unexpected that deserves deeper investigation?`;
 
-      const researchResp = await (exa.research as any).create({
-        instructions: critiqueInstructions,
-        model: 'exa-research-fast',
-      });
-      const critiqueResult = await (exa.research as any).pollUntilFinished(
-        researchResp.researchId ?? researchResp.id,
-        { timeoutMs: 120_000 },
+      const job = await runCheckpointedResearch(
+        exa,
+        store,
+        taskId,
+        'critiqueResearchId',
+        { instructions: critiqueInstructions, model: 'exa-research-fast' },
+        120_000,
       );
+      if (!job) return null;
+      const { researchId, result: critiqueResult } = job;
       critique = {
-        researchId: researchResp.researchId ?? researchResp.id,
+        researchId,
         content:
           critiqueResult.output ?? critiqueResult.result ?? JSON.stringify(critiqueResult),
       };
@@ -1,7 +1,8 @@
 import type { Exa } from 'exa-js';
 import type { TaskStore } from '../lib/taskStore.js';
+import { apiPools } from '../lib/scheduler.js';
 import { registerWorkflow } from './types.js';
-import { isCancelled, validateRequired, withSummary } from './helpers.js';
+import { checkpoint, getCheckpoint, isCancelled, validateRequired, withSummary } from './helpers.js';
 
 async function researchDeepWorkflow(
   taskId: string,
@@ -22,16 +23,27 @@ async function researchDeepWorkflow(
   const params: Record<string, unknown> = { instructions, model };
   if (outputSchema) params.outputSchema = outputSchema;
 
-  const response = await (exa.research as any).create(params);
-  const researchId = response.researchId ?? response.id;
+  // Hold a research pool slot for the whole job, not just the create call
+  const job = await apiPools.research.run(async () => {
+    // A resumed task polls the job its earlier run started
+    let researchId = getCheckpoint<{ researchId: string }>(store, taskId).researchId;
+    if (!researchId) {
+      const response = await (exa.research as any).create(params);
+      researchId = (response.researchId ?? response.id) as string;
+      checkpoint(store, taskId, { researchId });
+    }
 
-  if (isCancelled(taskId, store)) return null;
+    if (isCancelled(taskId, store)) return null;
 
-  store.updateProgress(taskId, { step: 'polling', completed: 2, total: 3 });
+    store.updateProgress(taskId, { step: 'polling', completed: 2, total: 3 });
 
-  const result = await (exa.research as any).pollUntilFinished(researchId, {
-    timeoutMs,
+    const result = await (exa.research as any).pollUntilFinished(researchId, {
+      timeoutMs,
+    });
+    return { researchId, result };
   });
+  if (!job) return null;
+  const { researchId, result } = job;
 
   store.updateProgress(taskId, { step: 'complete', completed: 3, total: 3 });
 
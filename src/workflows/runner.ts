@@ -0,0 +1,71 @@
+import type { Exa } from 'exa-js';
+import type { TaskState, TaskStore } from '../lib/taskStore.js';
+import { taskScheduler, type ScheduleOptions, type TaskScheduler } from '../lib/scheduler.js';
+import { workflowRegistry, type WorkflowFunction } from './types.js';
+import { WorkflowError } from './helpers.js';
+import { secondsSince, workflowDuration } from '../lib/metrics.js';
+
+/**
+ * Hand a task to the scheduler. It runs as soon as a worker is free; a task
+ * cancelled while still queued never starts. Returns true if it started immediately.
+ */
+export function launchWorkflow(
+  task: TaskState,
+  workflow: WorkflowFunction,
+  exa: Exa,
+  store: TaskStore,
+  options: ScheduleOptions = {},
+  scheduler: TaskScheduler = taskScheduler,
+): boolean {
+  return scheduler.submit(task.id, async () => {
+    if (store.get(task.id)?.status === 'cancelled') return;
+    const start = performance.now();
+    try {
+      const result = await workflow(task.id, task.args, exa, store);
+      const status = store.get(task.id)?.status === 'cancelled' ? 'cancelled' : 'completed';
+      workflowDuration.observe(secondsSince(start), task.type, status);
+      store.setResult(task.id, result);
+    } catch (err) {
+      workflowDuration.observe(secondsSince(start), task.type, 'failed');
+      store.setError(task.id, {
+        step: err instanceof WorkflowError ? err.step : 'unknown',
+        message: err instanceof Error ? err.message : String(err),
+        recoverable: err instanceof WorkflowError ? err.recoverable : false,
+      });
+    }
+  }, options);
+}
+
+/**
+ * Restart tasks that were pending or working when the process last stopped.
+ * Workflows pick up their own checkpoints from the task's partialResult.
+ */
+export function resumeInterruptedTasks(
+  exa: Exa,
+  store: TaskStore,
+  scheduler: TaskScheduler = taskScheduler,
+): string[] {
+  const resumed: string[] = [];
+  for (const task of store.takeInterrupted()) {
+    const workflow = workflowRegistry.get(task.type);
+    if (!workflow) {
+      store.setError(task.id, {
+        step: 'resume',
+        message: `Cannot resume task: unknown task type "${task.type}"`,
+        recoverable: false,
+      });
+      continue;
+    }
+    try {
+      launchWorkflow(task, workflow, exa, store, {}, scheduler);
+      resumed.push(task.id);
+    } catch (err) {
+      store.setError(task.id, {
+        step: 'resume',
+        message: err instanceof Error ? err.message : String(err),
+        recoverable: true,
+      });
+    }
+  }
+  return resumed;
+}
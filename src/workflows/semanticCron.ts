@@ -1,16 +1,19 @@
+import { createHash } from 'node:crypto';
 import type { Exa } from 'exa-js';
 import type { TaskStore } from '../lib/taskStore.js';
 import { registerWorkflow } from './types.js';
 import {
   createStepTracker,
   isCancelled,
+  checkpoint,
+  getCheckpoint,
   pollUntilIdle,
-  collectItems,
   withSummary,
   WorkflowError,
 } from './helpers.js';
-import { projectItem } from '../lib/projections.js';
-import { diceCoefficient } from './convergent.js';
+import { hasSatisfiedEvaluation, projectItem } from '../lib/projections.js';
+import { streamItems } from '../lib/itemStream.js';
+import { EntityIndex, hasCrossLensPairWithin, crossLensPairsWithin, type LensTimestamp } from '../lib/entityMatcher.js';
 
 // --- Types ---
 
@@ -109,7 +112,29 @@ export interface SignalResult {
   entities: string[];
 }
 
-interface SnapshotData {
+interface SnapshotShape {
+  id?: string;
+  name: string;
+  url: string;
+  enrichments: Record<string, unknown>;
+  createdAt?: string;
+}
+
+/** Per-lens collection state carried in the snapshot so re-evaluations fetch only new items. */
+export interface LensIndexState {
+  /** streamItems resume cursor: items created after it have not been seen. */
+  cursor: string | null;
+  /** Items whose enrichments were still running; re-read on the next evaluation. */
+  pending: string[];
+  /** Fingerprint of the lens's shapes; a change forces a full collect. */
+  shapeKey: string;
+  /** The webset's updatedAt when it was collected; a move with no new items forces a full collect. */
+  websetUpdatedAt?: string;
+  /** When the lens was last collected in full; older than FULL_RECONCILE_MS forces another. */
+  fullAt?: string;
+}
+
+export interface SnapshotData {
   evaluatedAt: string;
   lenses: Record<
     string,
@@ -117,11 +142,14 @@ interface SnapshotData {
       websetId: string;
       totalItems: number;
       shapedCount: number;
-      shapes: Array<{ name: string; url: string; enrichments: Record<string, unknown> }>;
+      shapes: SnapshotShape[];
+      index?: LensIndexState;
     }
   >;
   join: JoinResult;
   signal: SignalResult;
+  /** Fingerprint of the join and signal config the join/signal were computed with. */
+  joinKey?: string;
 }
 
 interface Delta {
@@ -278,6 +306,37 @@ export function evaluateShape(
   return shape.logic === 'all' ? results.every(Boolean) : results.some(Boolean);
 }
 
+/**
+ * Resolve one item's enrichments and test it against the lens's shapes.
+ * Returns the shaped item, or null if no shape matches.
+ */
+export function shapeItem(
+  item: Record<string, unknown>,
+  enrichmentMap: Map<string, string>,
+  shapes: ShapeConfig[],
+): ShapedItem | null {
+  const [{ enrichments }] = resolveEnrichmentDescriptions([item], enrichmentMap);
+  if (shapes.length > 0 && !shapes.some(shape => evaluateShape(shape, enrichments))) {
+    return null;
+  }
+
+  const projected = projectItem(item);
+  const enrichmentValues: Record<string, unknown> = {};
+  for (const e of enrichments) {
+    enrichmentValues[e.description] = e.result?.[0] ?? null;
+  }
+
+  return {
+    id: (item.id as string) ?? '',
+    name: (projected.name as string) ?? '',
+    url: (projected.url as string) ?? '',
+    entityType: (projected.entityType as string) ?? '',
+    enrichments: enrichmentValues,
+    createdAt: (item.createdAt as string) ?? new Date().toISOString(),
+    projected,
+  };
+}
+
 // --- 3. Join Engine ---
 
 export function joinLensResults(
@@ -297,54 +356,45 @@ export function joinLensResults(
   }
 
   // Entity or entity+temporal
-  const entityMap = new Map<
-    string,
-    {
-      entity: string;
-      url: string;
-      lenses: Set<string>;
-      shapes: Record<string, Record<string, unknown>>;
-      timestamps: Array<{ lensId: string; createdAt: string }>;
-    }
-  >();
+  interface EntityEntry {
+    entity: string;
+    url: string;
+    lenses: Set<string>;
+    shapes: Record<string, Record<string, unknown>>;
+    timestamps: LensTimestamp[];
+  }
+  const index = new EntityIndex<EntityEntry>(threshold);
 
   for (const lr of lensResults) {
     for (const si of lr.shapedItems) {
-      let matched = false;
-
-      for (const [key, existing] of entityMap) {
-        // URL exact match
-        if (si.url && existing.url && si.url === existing.url) {
-          existing.lenses.add(lr.lensId);
-          existing.shapes[lr.lensId] = si.enrichments;
-          existing.timestamps.push({ lensId: lr.lensId, createdAt: si.createdAt });
-          matched = true;
-          break;
-        }
-        // Name fuzzy match
-        if (si.name && existing.entity && diceCoefficient(si.name, existing.entity) > threshold) {
-          existing.lenses.add(lr.lensId);
-          existing.shapes[lr.lensId] = si.enrichments;
-          existing.timestamps.push({ lensId: lr.lensId, createdAt: si.createdAt });
-          matched = true;
-          break;
-        }
-      }
+      const stamp = { lensId: lr.lensId, time: new Date(si.createdAt).getTime() };
+      const existing = index.match(si.name, si.url);
 
-      if (!matched) {
-        const key = si.url || si.name || si.id;
-        entityMap.set(key, {
+      if (existing) {
+        existing.lenses.add(lr.lensId);
+        existing.shapes[lr.lensId] = si.enrichments;
+        existing.timestamps.push(stamp);
+      } else {
+        index.add(si.name, si.url, {
           entity: si.name,
           url: si.url,
           lenses: new Set([lr.lensId]),
           shapes: { [lr.lensId]: si.enrichments },
-          timestamps: [{ lensId: lr.lensId, createdAt: si.createdAt }],
+          timestamps: [stamp],
         });
       }
     }
   }
 
-  let entities: JoinedEntity[] = [...entityMap.values()].map(e => ({
+  let entries = index.values();
+
+  // entity+temporal: keep entities seen by two different lenses within the window
+  if (joinConfig.by === 'entity+temporal' && temporalDays) {
+    const windowMs = temporalDays * 86400000;
+    entries = entries.filter(e => hasCrossLensPairWithin(e.timestamps, windowMs));
+  }
+
+  let entities: JoinedEntity[] = entries.map(e => ({
     entity: e.entity,
     url: e.url,
     presentInLenses: [...e.lenses],
@@ -352,32 +402,6 @@ export function joinLensResults(
     shapes: e.shapes,
   }));
 
-  // entity+temporal: filter by temporal window
-  if (joinConfig.by === 'entity+temporal' && temporalDays) {
-    const windowMs = temporalDays * 86400000;
-    entities = entities.filter(ent => {
-      // Find underlying timestamps from entityMap
-      const entry = [...entityMap.values()].find(
-        e => e.entity === ent.entity && e.url === ent.url,
-      );
-      if (!entry) return false;
-
-      // Check if any two items from different lenses are within window
-      const ts = entry.timestamps;
-      for (let i = 0; i < ts.length; i++) {
-        for (let j = i + 1; j < ts.length; j++) {
-          if (ts[i].lensId !== ts[j].lensId) {
-            const diff = Math.abs(
-              new Date(ts[i].createdAt).getTime() - new Date(ts[j].createdAt).getTime(),
-            );
-            if (diff <= windowMs) return true;
-          }
-        }
-      }
-      return false;
-    });
-  }
-
   // Filter by minLensOverlap
   entities = entities.filter(e => e.lensCount >= minOverlap);
 
@@ -405,7 +429,10 @@ function joinByCooccurrence(
       return { type: 'cooccurrence', entities: [], lensesWithEvidence: [] };
     }
 
-    const earliest = Math.min(...allTimestamps.map(t => t.time));
+    let earliest = Infinity;
+    for (const t of allTimestamps) {
+      if (t.time < earliest) earliest = t.time;
+    }
     const windowMs = temporalDays * 86400000;
     const qualifying = allTimestamps.filter(t => t.time - earliest <= windowMs);
     lensesWithEvidence = [...new Set(qualifying.map(t => t.lensId))];
@@ -423,30 +450,27 @@ function joinByTemporal(
   days: number,
 ): JoinResult {
   const windowMs = days * 86400000;
-  const lensTimes = new Map<string, number[]>();
+  const stamps: LensTimestamp[] = [];
+  const lensIds: string[] = [];
 
   for (const lr of lensResults) {
-    const times = lr.shapedItems.map(si => new Date(si.createdAt).getTime());
-    if (times.length > 0) {
-      lensTimes.set(lr.lensId, times);
+    if (lr.shapedItems.length === 0) continue;
+    if (!lensIds.includes(lr.lensId)) lensIds.push(lr.lensId);
+    for (const si of lr.shapedItems) {
+      stamps.push({ lensId: lr.lensId, time: new Date(si.createdAt).getTime() });
     }
   }
 
+  // One sorted sweep finds every lens pair with timestamps inside the window;
+  // pairs are then visited in lens order so evidence ordering is stable.
+  const pairs = crossLensPairsWithin(stamps, windowMs);
   const qualifying = new Set<string>();
-  const lensIds = [...lensTimes.keys()];
 
   for (let i = 0; i < lensIds.length; i++) {
     for (let j = i + 1; j < lensIds.length; j++) {
-      const timesA = lensTimes.get(lensIds[i])!;
-      const timesB = lensTimes.get(lensIds[j])!;
-
-      for (const ta of timesA) {
-        for (const tb of timesB) {
-          if (Math.abs(ta - tb) <= windowMs) {
-            qualifying.add(lensIds[i]);
-            qualifying.add(lensIds[j]);
-          }
-        }
+      if (pairs.has(`${lensIds[i]}\u0000${lensIds[j]}`)) {
+        qualifying.add(lensIds[i]);
+        qualifying.add(lensIds[j]);
       }
     }
   }
@@ -652,6 +676,8 @@ export function buildSnapshot(
   joinResult: JoinResult,
   signalResult: SignalResult,
   websetIds: Record<string, string>,
+  indexes?: Record<string, LensIndexState>,
+  joinKey?: string,
 ): SnapshotData {
   const lenses: SnapshotData['lenses'] = {};
   for (const lr of lensResults) {
@@ -660,22 +686,236 @@ export function buildSnapshot(
       totalItems: lr.totalItems,
       shapedCount: lr.shapedItems.length,
       shapes: lr.shapedItems.map(si => ({
+        id: si.id,
         name: si.name,
         url: si.url,
         enrichments: si.enrichments,
+        createdAt: si.createdAt,
       })),
     };
+    if (indexes?.[lr.lensId]) lenses[lr.lensId].index = indexes[lr.lensId];
   }
 
-  return {
+  const snapshot: SnapshotData = {
     evaluatedAt: new Date().toISOString(),
     lenses,
     join: joinResult,
     signal: signalResult,
   };
+  if (joinKey) snapshot.joinKey = joinKey;
+  return snapshot;
 }
 
-// --- 7. Main Workflow ---
+// --- 7. Lens Collector ---
+
+/** Shaped items kept per lens (newest first); bounds snapshot size on large lenses. */
+const MAX_LENS_SHAPED_ITEMS = 1000;
+
+/**
+ * Incremental collects only see new and pending items, so deletions and
+ * re-run enrichments that leave the webset's updatedAt unchanged (or coincide
+ * with new items) are picked up by a full collect at least this often.
+ */
+const FULL_RECONCILE_MS = 7 * 24 * 60 * 60 * 1000;
+
+function configFingerprint(value: unknown): string {
+  return createHash('sha256').update(JSON.stringify(value)).digest('hex').slice(0, 16);
+}
+
+/** True while any of the lens's enrichments has not produced a result for this item yet. */
+function hasPendingEnrichments(item: Record<string, unknown>, enrichmentMap: Map<string, string>): boolean {
+  const enrichments = (item.enrichments ?? []) as Array<{ status?: string }>;
+  return enrichments.some(e => e.status === 'pending') || enrichments.length < enrichmentMap.size;
+}
+
+/** Rebuild a shaped item from its snapshot entry, or null if it no longer fits the shapes. */
+function restoreShapedItem(shape: SnapshotShape, shapes: ShapeConfig[]): ShapedItem | null {
+  const resolved: ResolvedEnrichment[] = Object.entries(shape.enrichments).map(([description, value]) => ({
+    description,
+    result: value === null || value === undefined ? null : [String(value)],
+    format: '',
+  }));
+  // Re-checked because time-relative conditions (withinDays) drift between evaluations
+  if (shapes.length > 0 && !shapes.some(s => evaluateShape(s, resolved))) return null;
+  return {
+    id: shape.id ?? '',
+    name: shape.name,
+    url: shape.url,
+    entityType: '',
+    enrichments: shape.enrichments,
+    createdAt: shape.createdAt ?? '',
+    projected: { name: shape.name, url: shape.url },
+  };
+}
+
+/** Newest first, ties by ID: the order the join sees a lens's items in, whatever order the API lists them in. */
+function compareShapedItems(a: ShapedItem, b: ShapedItem): number {
+  if (a.createdAt !== b.createdAt) return a.createdAt < b.createdAt ? 1 : -1;
+  return a.id < b.id ? -1 : a.id > b.id ? 1 : 0;
+}
+
+/**
+ * The MAX_LENS_SHAPED_ITEMS newest shaped items, kept in order as they are
+ * added, so a lens holds at most that many however large its webset is. Both
+ * the full and the incremental path collect through this.
+ */
+function newestShapedItems(): { items: ShapedItem[]; add(item: ShapedItem): void } {
+  const items: ShapedItem[] = [];
+  return {
+    items,
+    add(item) {
+      let lo = 0;
+      let hi = items.length;
+      while (lo < hi) {
+        const mid = (lo + hi) >> 1;
+        if (compareShapedItems(items[mid], item) <= 0) lo = mid + 1;
+        else hi = mid;
+      }
+      if (lo >= MAX_LENS_SHAPED_ITEMS) return;
+      items.splice(lo, 0, item);
+      if (items.length > MAX_LENS_SHAPED_ITEMS) items.pop();
+    },
+  };
+}
+
+export interface CollectedLens {
+  result: LensResult;
+  index: LensIndexState;
+  /** False when an incremental collect found nothing that changes the lens's shaped items. */
+  changed: boolean;
+  incremental: boolean;
+}
+
+/**
+ * Collect one lens's shaped items. With a usable index from the previous
+ * snapshot only items created since its cursor are read, plus the items whose
+ * enrichments were still pending; the rest come from the snapshot's shapes.
+ * Without one (first run, older snapshots, changed shapes, a reconcile falling
+ * due) or when the webset changed without gaining items, the whole webset is read.
+ */
+export async function collectLens(
+  exa: Exa,
+  lensId: string,
+  websetId: string,
+  enrichmentMap: Map<string, string>,
+  shapes: ShapeConfig[],
+  previous?: SnapshotData['lenses'][string],
+  websetUpdatedAt?: string,
+): Promise<CollectedLens> {
+  const shapeKey = configFingerprint(shapes);
+  const pending: string[] = [];
+  const shape = (item: Record<string, unknown>): ShapedItem | null => {
+    if (typeof item.id === 'string' && hasPendingEnrichments(item, enrichmentMap)) pending.push(item.id);
+    return shapeItem(item, enrichmentMap, shapes);
+  };
+  const indexOf = (cursor: string | null, fullAt: string | undefined): LensIndexState => {
+    const index: LensIndexState = { cursor, pending, shapeKey };
+    if (websetUpdatedAt) index.websetUpdatedAt = websetUpdatedAt;
+    if (fullAt) index.fullAt = fullAt;
+    return index;
+  };
+
+  // Read to the end so the full and incremental paths see the same items; only
+  // the newest shaped items are kept while the stream runs, so memory stays
+  // bounded however large the webset is.
+  const collectAll = async (): Promise<CollectedLens> => {
+    pending.length = 0;
+    const kept = newestShapedItems();
+    const collected = await streamItems<never>(exa, websetId, {
+      filter: hasSatisfiedEvaluation,
+      map: item => {
+        const si = shape(item);
+        if (si) kept.add(si);
+        return null;
+      },
+      maxItems: Infinity,
+    });
+    return {
+      result: { lensId, websetId, totalItems: collected.total, shapedItems: kept.items },
+      index: indexOf(collected.resumeCursor, new Date().toISOString()),
+      changed: true,
+      incremental: false,
+    };
+  };
+
+  const prevIndex = previous?.index;
+  const usable = !!prevIndex?.cursor
+    && previous!.websetId === websetId
+    && prevIndex.shapeKey === shapeKey
+    && !!prevIndex.fullAt && Date.now() - Date.parse(prevIndex.fullAt) < FULL_RECONCILE_MS
+    && previous!.shapes.every(s => s.id && s.createdAt);
+  if (!usable) return collectAll();
+
+  const kept = newestShapedItems();
+  const freshIds = new Set<string>();
+  const fresh = await streamItems<never>(exa, websetId, {
+    filter: hasSatisfiedEvaluation,
+    map: item => {
+      const si = shape(item);
+      if (si) {
+        freshIds.add(si.id);
+        kept.add(si);
+      }
+      return null;
+    },
+    maxItems: Infinity,
+    resumeCursor: prevIndex!.cursor!,
+  });
+
+  // Items still enriching last time may have settled since: re-read each one
+  const refreshed = new Map<string, ShapedItem | null>();
+  for (const id of prevIndex!.pending) {
+    if (freshIds.has(id) || pending.includes(id)) continue;
+    let item: Record<string, unknown>;
+    try {
+      item = await (exa.websets.items as any).get(websetId, id);
+    } catch {
+      refreshed.set(id, null); // deleted since
+      continue;
+    }
+    refreshed.set(id, hasSatisfiedEvaluation(item) ? shape(item) : null);
+  }
+
+  // The webset changed but gained no items and no pending item explains it:
+  // something was deleted or re-enriched, which only a full read can see
+  const websetMoved = !!websetUpdatedAt && !!prevIndex!.websetUpdatedAt
+    && websetUpdatedAt !== prevIndex!.websetUpdatedAt;
+  if (websetMoved && fresh.total === 0 && refreshed.size === 0) return collectAll();
+
+  // Refreshed items replace their previous version; the rest are restored from the snapshot
+  let changed = freshIds.size > 0 || refreshed.size > 0;
+  for (const prev of previous!.shapes) {
+    if (freshIds.has(prev.id!)) continue;
+    if (refreshed.has(prev.id!)) {
+      const next = refreshed.get(prev.id!);
+      refreshed.delete(prev.id!);
+      if (next) kept.add(next);
+      continue;
+    }
+    const restored = restoreShapedItem(prev, shapes);
+    if (restored) kept.add(restored);
+    else changed = true;
+  }
+
+  // Pending items that were not shaped before
+  for (const si of refreshed.values()) {
+    if (si) kept.add(si);
+  }
+
+  return {
+    result: {
+      lensId,
+      websetId,
+      totalItems: previous!.totalItems + fresh.total,
+      shapedItems: kept.items,
+    },
+    index: indexOf(fresh.resumeCursor ?? prevIndex!.cursor, prevIndex!.fullAt),
+    changed,
+    incremental: true,
+  };
+}
+
+// --- 8. Main Workflow ---
 
 async function semanticCronWorkflow(
   taskId: string,
@@ -684,7 +924,7 @@ async function semanticCronWorkflow(
   store: TaskStore,
 ): Promise<unknown> {
   const startTime = Date.now();
-  const tracker = createStepTracker();
+  const tracker = createStepTracker('semantic.cron');
 
   const rawConfig = args.config as SemanticCronConfig;
   const variables = args.variables as Record<string, string> | undefined;
@@ -729,12 +969,14 @@ async function semanticCronWorkflow(
   const isReeval = !!existingWebsets;
   const websetIds: Record<string, string> = existingWebsets ? { ...existingWebsets } : {};
   const enrichmentMaps: Record<string, Map<string, string>> = {}; // lensId → Map<enrichmentId, description>
+  const websetUpdatedAt: Record<string, string | undefined> = {}; // lensId → webset updatedAt, for the lens index
 
   // Step: Create or fetch websets
   const totalLenses = config.lenses.length;
 
   if (!isReeval) {
-    // Initial run: create websets
+    // Initial run: create websets (reusing any created before a restart)
+    const resumedIds = getCheckpoint<{ websetIds: Record<string, string> }>(store, taskId).websetIds ?? {};
     for (let i = 0; i < config.lenses.length; i++) {
       const stepStart = Date.now();
       const lens = config.lenses[i];
@@ -755,9 +997,10 @@ async function semanticCronWorkflow(
 
       let webset: any;
 
-      if (lens.source.websetId) {
-        websetIds[lens.id] = lens.source.websetId;
-        webset = await exa.websets.get(lens.source.websetId);
+      const existingId = lens.source.websetId ?? resumedIds[lens.id];
+      if (existingId) {
+        websetIds[lens.id] = existingId;
+        webset = await exa.websets.get(existingId);
       } else {
         const createParams: Record<string, unknown> = {
           search: {
@@ -775,6 +1018,7 @@ async function semanticCronWorkflow(
 
         webset = await exa.websets.create(createParams as any);
         websetIds[lens.id] = webset.id;
+        checkpoint(store, taskId, { websetIds: { ...websetIds } });
       }
 
       // Extract enrichment id → description map
@@ -788,8 +1032,9 @@ async function semanticCronWorkflow(
         }
       }
       enrichmentMaps[lens.id] = map;
+      websetUpdatedAt[lens.id] = webset.updatedAt;
 
-      tracker.track(`create-${lens.id}`, stepStart);
+      tracker.track(`create-${lens.id}`, stepStart, 'create');
     }
   } else {
     // Re-eval: fetch existing websets for enrichment definitions
@@ -820,6 +1065,7 @@ async function semanticCronWorkflow(
         }
       }
       enrichmentMaps[lens.id] = map;
+      websetUpdatedAt[lens.id] = webset.updatedAt;
     }
   }
 
@@ -832,30 +1078,33 @@ async function semanticCronWorkflow(
     return null;
   }
 
-  // Step: Poll websets (initial run only)
+  // Step: Poll websets (initial run only) — all lenses awaited concurrently
   if (!isReeval) {
-    for (let i = 0; i < config.lenses.length; i++) {
-      const lens = config.lenses[i];
-      if (lens.source.websetId) continue; // pre-existing webset, already idle
-
+    const pending = config.lenses.filter(lens => !lens.source.websetId); // pre-existing websets are already idle
+    if (pending.length > 0) {
       const stepStart = Date.now();
       store.updateProgress(taskId, {
-        step: `polling lens ${i + 1}/${totalLenses}: ${lens.id}`,
+        step: `polling ${pending.length}/${totalLenses} lenses: ${pending.map(l => l.id).join(', ')}`,
         completed: 2,
         total: 8,
       });
 
-      await pollUntilIdle({
-        exa,
-        websetId: websetIds[lens.id],
-        taskId,
-        store,
-        timeoutMs,
-        stepNum: 2,
-        totalSteps: 8,
-      });
+      await Promise.all(pending.map(async lens => {
+        const lensStart = Date.now();
+        const { webset } = await pollUntilIdle({
+          exa,
+          websetId: websetIds[lens.id],
+          taskId,
+          store,
+          timeoutMs,
+          stepNum: 2,
+          totalSteps: 8,
+        });
+        websetUpdatedAt[lens.id] = webset?.updatedAt;
+        tracker.track(`poll-${lens.id}`, lensStart, 'poll-lens');
+      }));
 
-      tracker.track(`poll-${lens.id}`, stepStart);
+      tracker.track('poll', stepStart);
 
       if (isCancelled(taskId, store)) {
         for (const id of Object.values(websetIds)) {
@@ -871,78 +1120,51 @@ async function semanticCronWorkflow(
   store.updateProgress(taskId, { step: 'collecting items', completed: 3, total: 8 });
 
   const lensResults: LensResult[] = [];
+  const indexes: Record<string, LensIndexState> = {};
+  let lensesChanged = false;
 
   for (const lens of config.lenses) {
-    const wsId = websetIds[lens.id];
-    const rawItems = await collectItems(exa, wsId);
-
-    // Filter to items with satisfied evaluation
-    const passingItems = rawItems.filter(item => {
-      const evaluations = item.evaluations as
-        | Array<{ satisfied: string }>
-        | undefined;
-      if (!evaluations || evaluations.length === 0) return true;
-      return evaluations.some(e => e.satisfied === 'yes');
-    });
-
-    // Resolve enrichment descriptions
-    const resolved = resolveEnrichmentDescriptions(passingItems, enrichmentMaps[lens.id]);
-
-    // Apply shape evaluation
-    const shapesForLens = config.shapes.filter(s => s.lensId === lens.id);
-
-    const shapedItems: ShapedItem[] = [];
-    for (const { item, enrichments } of resolved) {
-      // Check if item passes any of the shapes for this lens
-      const passes =
-        shapesForLens.length === 0 ||
-        shapesForLens.some(shape => evaluateShape(shape, enrichments));
-
-      if (passes) {
-        const projected = projectItem(item);
-        const enrichmentValues: Record<string, unknown> = {};
-        for (const e of enrichments) {
-          enrichmentValues[e.description] = e.result?.[0] ?? null;
-        }
-
-        shapedItems.push({
-          id: (item.id as string) ?? '',
-          name: (projected.name as string) ?? '',
-          url: (projected.url as string) ?? '',
-          entityType: (projected.entityType as string) ?? '',
-          enrichments: enrichmentValues,
-          createdAt: (item.createdAt as string) ?? new Date().toISOString(),
-          projected,
-        });
-      }
-    }
-
-    lensResults.push({
-      lensId: lens.id,
-      websetId: wsId,
-      totalItems: rawItems.length,
-      shapedItems,
-    });
+    // Evaluation filter, enrichment resolution and shape predicates run per item
+    // as the stream arrives; only shaped items are kept. Re-evaluations read only
+    // items added since the previous snapshot when it carries a lens index.
+    const collected = await collectLens(
+      exa,
+      lens.id,
+      websetIds[lens.id],
+      enrichmentMaps[lens.id],
+      config.shapes.filter(s => s.lensId === lens.id),
+      isReeval ? previousSnapshot?.lenses[lens.id] : undefined,
+      websetUpdatedAt[lens.id],
+    );
+    lensResults.push(collected.result);
+    indexes[lens.id] = collected.index;
+    if (collected.changed) lensesChanged = true;
   }
 
   tracker.track('collect-shape', stepCollect);
 
   if (isCancelled(taskId, store)) return null;
 
+  // Join and signal depend only on the shaped items and their config, so an
+  // unchanged index reuses the previous snapshot's results
+  const joinKey = configFingerprint({ lenses: lensIds, join: config.join, signal: config.signal });
+  const reusable = isReeval && !lensesChanged && previousSnapshot?.joinKey === joinKey
+    && Object.keys(previousSnapshot.lenses).length === lensIds.length;
+
   // Step: Join
   const stepJoin = Date.now();
   store.updateProgress(taskId, { step: 'joining lenses', completed: 5, total: 8 });
-  const joinResult = joinLensResults(lensResults, config.join);
+  const joinResult = reusable ? previousSnapshot!.join : joinLensResults(lensResults, config.join);
   tracker.track('join', stepJoin);
 
   // Step: Evaluate signal
   const stepSignal = Date.now();
   store.updateProgress(taskId, { step: 'evaluating signal', completed: 6, total: 8 });
-  const signalResult = evaluateSignal(joinResult, config.signal, lensIds);
+  const signalResult = reusable ? previousSnapshot!.signal : evaluateSignal(joinResult, config.signal, lensIds);
   tracker.track('signal', stepSignal);
 
   // Step: Build snapshot
-  const snapshot = buildSnapshot(lensResults, joinResult, signalResult, websetIds);
+  const snapshot = buildSnapshot(lensResults, joinResult, signalResult, websetIds, indexes, joinKey);
 
   // Step: Create monitors (initial run only, non-fatal)
   if (!isReeval && config.monitor) {
@@ -1,10 +1,11 @@
 import type { Exa } from 'exa-js';
 import type { TaskStore } from '../lib/taskStore.js';
-import { Semaphore } from '../lib/semaphore.js';
 import { registerWorkflow } from './types.js';
 import {
   createStepTracker,
   isCancelled,
+  checkpoint,
+  getCheckpoint,
   pollUntilIdle,
   collectItems,
   summarizeItem,
@@ -13,6 +14,7 @@ import {
   withSummary,
 } from './helpers.js';
 import { projectItem } from '../lib/projections.js';
+import { apiPools } from '../lib/scheduler.js';
 
 // --- Template expansion ---
 
@@ -35,6 +37,12 @@ export function expandTemplate(
     .replace(/\{\{description\}\}/g, description);
 }
 
+interface ResearchOutcome {
+  researchId: string;
+  result: unknown;
+  duration: number;
+}
+
 // --- Main Workflow ---
 
 async function verifiedCollectionWorkflow(
@@ -44,7 +52,7 @@ async function verifiedCollectionWorkflow(
   store: TaskStore,
 ): Promise<unknown> {
   const startTime = Date.now();
-  const tracker = createStepTracker();
+  const tracker = createStepTracker('research.verifiedCollection');
 
   const criteria = args.criteria as Array<{ description: string }> | undefined;
   const count = (args.count as number) ?? 25;
@@ -75,8 +83,13 @@ async function verifiedCollectionWorkflow(
   if (criteria) (createParams.search as any).criteria = criteria;
   if (enrichments) createParams.enrichments = enrichments;
 
-  const webset = await exa.websets.create(createParams as any);
-  const websetId = webset.id;
+  const resumed = getCheckpoint<{
+    websetId: string;
+    research: Record<string, ResearchOutcome>;
+    researchIds: Record<string, string>;
+  }>(store, taskId);
+  const websetId = resumed.websetId ?? (await exa.websets.create(createParams as any)).id;
+  checkpoint(store, taskId, { websetId });
   tracker.track('create', step1);
 
   if (isCancelled(taskId, store)) {
@@ -110,15 +123,18 @@ async function verifiedCollectionWorkflow(
   // Select top N items for research
   const selectedItems = allItems.slice(0, researchLimit);
 
-  store.setPartialResult(taskId, {
+  checkpoint(store, taskId, {
     websetId,
     totalItems: allItems.length,
     selectedForResearch: selectedItems.length,
   });
+  const research: Record<string, ResearchOutcome> = { ...resumed.research };
+  // Jobs started before a restart are polled again rather than re-created
+  const researchIds: Record<string, string> = { ...resumed.researchIds };
 
   if (isCancelled(taskId, store)) return null;
 
-  // Run per-entity research with concurrency limit
+  // Per-entity research fans out; the shared research pool bounds concurrency
   const step4 = Date.now();
   store.updateProgress(taskId, {
     step: 'researching',
@@ -127,52 +143,67 @@ async function verifiedCollectionWorkflow(
     message: `Researching ${selectedItems.length} entities`,
   });
 
-  const semaphore = new Semaphore(3);
+  let completedCount = 0;
   const researchResults = await Promise.all(
-    selectedItems.map((item, idx) =>
-      semaphore.run(async () => {
-        if (isCancelled(taskId, store)) return { item, research: undefined };
-
-        const instructions = expandTemplate(researchPrompt, item);
-        const researchStart = Date.now();
-
-        try {
-          const params: Record<string, unknown> = { instructions, model: researchModel };
-          if (researchSchema) params.outputSchema = researchSchema;
-
-          const resp = await (exa.research as any).create(params);
-          const researchId = resp.researchId ?? resp.id;
+    selectedItems.map(async item => {
+      // Research finished before a restart is reused rather than paid for again
+      const itemId = item.id as string | undefined;
+      if (itemId && research[itemId]) return { item, research: research[itemId] };
+
+      const instructions = expandTemplate(researchPrompt, item);
+      const researchStart = Date.now();
+
+      try {
+        const params: Record<string, unknown> = { instructions, model: researchModel };
+        if (researchSchema) params.outputSchema = researchSchema;
+
+        // Hold a research pool slot for the whole job, not just the create call
+        const job = await apiPools.research.run(async () => {
+          let researchId = itemId ? researchIds[itemId] : undefined;
+          if (!researchId) {
+            if (isCancelled(taskId, store)) return null;
+            const response = await (exa.research as any).create(params);
+            researchId = (response.researchId ?? response.id) as string;
+            if (itemId) {
+              researchIds[itemId] = researchId;
+              checkpoint(store, taskId, { researchIds: { ...researchIds } });
+            }
+          }
           const result = await (exa.research as any).pollUntilFinished(researchId, {
             timeoutMs: Math.min(timeoutMs, 120_000),
           });
-
-          store.updateProgress(taskId, {
-            step: 'researching',
-            completed: 4,
-            total: 5,
-            message: `Completed ${idx + 1}/${selectedItems.length}`,
-          });
-
-          return {
-            item,
-            research: {
-              researchId,
-              result: result.output ?? result.result ?? result,
-              duration: Date.now() - researchStart,
-            },
-          };
-        } catch (err) {
-          return {
-            item,
-            research: {
-              researchId: 'error',
-              result: `Research failed: ${err instanceof Error ? err.message : String(err)}`,
-              duration: Date.now() - researchStart,
-            },
-          };
+          return { researchId, result };
+        });
+        if (!job) return { item, research: undefined };
+
+        store.updateProgress(taskId, {
+          step: 'researching',
+          completed: 4,
+          total: 5,
+          message: `Completed ${++completedCount}/${selectedItems.length}`,
+        });
+
+        const outcome: ResearchOutcome = {
+          researchId: job.researchId,
+          result: job.result.output ?? job.result.result ?? job.result,
+          duration: Date.now() - researchStart,
+        };
+        if (itemId) {
+          research[itemId] = outcome;
+          checkpoint(store, taskId, { research });
         }
-      }),
-    ),
+        return { item, research: outcome };
+      } catch (err) {
+        return {
+          item,
+          research: {
+            researchId: 'error',
+            result: `Research failed: ${err instanceof Error ? err.message : String(err)}`,
+            duration: Date.now() - researchStart,
+          },
+        };
+      }
+    }),
   );
   tracker.track('research', step4);
 